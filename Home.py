@@ -1,16 +1,14 @@
-import os
-import shutil
-import yaml
 import streamlit as st
-from Lib.commons import DEFAULT_DIR, RESULT_PATH, SETTING_YAML
+from Lib.commons import DEFAULT_DIR, SETTING_YAML
+from Lib.dataAccess import load_yaml, render_cache_stats
+from Lib.resultArchive import RetentionPolicy, apply_retention
+from Lib.traceBlobs import collect_garbage
 
 if "first_time_connection" not in st.session_state:
     st.session_state["first_time_connection"] = True  # 처음 접속 플래그 삽입
     st.session_state["upload_test"] = False  # 테스트파일 업로드 상태
 
-    with open(SETTING_YAML, encoding='utf-8-sig') as f:
-        setting = yaml.load(f, Loader=yaml.SafeLoader)
-        f.close()
+    setting = load_yaml(SETTING_YAML)
 
     st.session_state["project_path"] = setting['project_path']
     st.session_state["git_branch"] = setting['git_branch']
@@ -18,23 +16,25 @@ if "first_time_connection" not in st.session_state:
     st.session_state["compilation_option"] = setting['compilation_option']
     st.session_state["source_file"] = setting['source_file']
     st.session_state["header_file"] = setting['header_file']
+    st.session_state["backend"] = setting.get('backend', 'exe')
+    st.session_state["compiler"] = setting.get('compiler', 'gcc')
+    st.session_state["build_profile"] = setting.get('build_profile', 'faithful')
+    st.session_state["retention"] = setting.get('retention', {})
 
 
 st.set_page_config(layout="wide")
 
-# Customize the sidebar
-markdown = """
-결과 파일 20개 초과로 오래된 파일 삭제 완료
-"""
-
 st.sidebar.title("SW Test based on Scenario")
+render_cache_stats()
 
-result_files = [f for f in os.listdir(RESULT_PATH) if 'xlsx' in f]
-if len(result_files) > 20:
-    for res in result_files[:-20]:
-        os.remove(f"{RESULT_PATH}/{res}")
-        shutil.rmtree(f"{RESULT_PATH}/{res.replace('_SW_TestCase.xlsx', '')}")
-        st.sidebar.info(markdown)
+# 최근 실행을 제외한 결과는 압축 보관하고, 보관 용량/기간 한도를 넘으면 오래된 보관부터 삭제
+retention = apply_retention(RetentionPolicy.from_setting({'retention': st.session_state.get("retention")}))
+if retention.archived:
+    st.sidebar.info(f"오래된 결과 {len(retention.archived)}개 압축 보관 완료")
+if retention.evicted:
+    st.sidebar.info(f"보관 한도 초과로 오래된 보관 결과 {len(retention.evicted)}개 삭제 완료")
+if retention.archived:
+    collect_garbage()  # 압축 보관된 실행만 참조하던 측정값 blob 정리
 
 st.title("SW TEST based on Scenario")
 
@@ -69,3 +69,9 @@ markdown = """
 """
 st.markdown(markdown)
 st.page_link(f"{DEFAULT_DIR}/pages/4_🗂️_Data_Storage.py", label="데이터 저장소", icon="🗂️")
+
+markdown = """
+- 누적된 실행 결과로 테스트별 통과율 추이와 불안정한 테스트를 확인할 수 있다.
+"""
+st.markdown(markdown)
+st.page_link(f"{DEFAULT_DIR}/pages/5_📈_Analytics.py", label="테스트 추이 분석", icon="📈")
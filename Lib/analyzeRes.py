@@ -1,17 +1,32 @@
+import io
 import os
+import shutil
+import hashlib
+import numpy as np
 import pandas as pd
 import openpyxl
 from pathlib import Path
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
-from Lib.commons import add_col_data, RESULT_PATH, TEST_CASE_FILE, ERROR_LOG
+from typing import Iterable, List, Dict, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+from Lib.commons import add_col_data, DEFAULT_CYCLE_NUMBER, RESULT_PATH, STUB_PATH, TEST_CASE_FILE, ERROR_LOG
+from Lib.dataAccess import file_hash, load_report, normalize_cell, TEST_NUM_TITLE
+from Lib.expectations import (ExpectationBuilder, ExpectationEntries, ExpectationError, ExpectationTable,
+                              ExpectationView, LegacyExpect, EXPECT_FILE)
+from Lib.resultArchive import RunArchive, is_archived, read_result_file
+from Lib.resultStore import ResultStore, ResultStoreError, RunRecord, TestRecord, hash_file, run_created_at
+from Lib.stimulus import STIM_ERROR_MARK
+from Lib.sweep import SWEEP_POINT_VAR
+from Lib.traceBlobs import load_trace_refs, previous_run, store_traces, unchanged_traces
 
 # 상수 정의
-LAST_ROW_INDEX = 255
 MEASURED_COL_INDEX = 10
 RESULT_COL_INDEX = 11
 PASS_RESULT = 'Pass'
 FAIL_RESULT = 'Fail'
+REPORT_SUFFIX = '_testcase.xlsx'
+MEASURED_TITLE = 'Measured(산출값)'
+RESULT_TITLE = 'Result(결과)'
+TEST_NUM_COL, C_FILE_COL, FUNCTION_COL = 1, 4, 5  # 테스트 케이스 시트 컬럼 위치 (0부터, 첫 번째 열 포함)
 
 
 @dataclass
@@ -20,6 +35,16 @@ class TestResult:
     measured_output: List[str]
     results: List[str]
     failed_indices: List[str]
+    point_results: Dict[str, List[str]] = field(default_factory=dict)  # 스윕 행별 지점 결과 (행 번호 → Pass/Fail)
+
+
+@dataclass
+class TestInfo:
+    """결과 이력용 테스트 행 식별 정보"""
+    test_num: str
+    c_file: Optional[str]
+    function: Optional[str]
+    row_hash: str  # 행 내용 sha1 (첫 번째 열 제외)
 
 
 class AnalyzeResError(Exception):
@@ -34,24 +59,43 @@ class AnalyzeRes:
 
     Attributes:
         res_path: 결과 파일이 저장된 경로
+        result_xlsx: 결과 보고서 파일 경로
         test_result: 테스트 결과 데이터
     """
 
-    def __init__(self, time: str, exp_res: List[Dict[int, List[str]]]):
+    def __init__(self, time: str, exp_res: Union[ExpectationTable, Sequence[LegacyExpect], None] = None,
+                 base: Optional[str] = None, rows: Optional[List[int]] = None,
+                 traces: Optional[List[pd.DataFrame]] = None, excluded: Optional[Dict[int, str]] = None):
         """AnalyzeRes 클래스 초기화
 
         Args:
             time: 테스트 실행 시간 (결과 폴더명)
-            exp_res: 테스트 예상값 리스트 (다차원 딕셔너리)
+            exp_res: 테스트 예상값 (ExpectationTable 또는 기존 딕셔너리 리스트,
+                     None 이면 결과 폴더에 저장된 예상값으로 재분석)
+            base: 재실행 시 병합할 이전 테스트 실행 시간
+            rows: 재실행된 테스트 행 번호 리스트 (1부터 시작, exp_res 순서)
+            traces: 공유 라이브러리 실행 측정값 (exp_res 순서, 지정 시 CSV 파싱 생략)
+            excluded: 컴파일 에러로 실행하지 않은 행 (행 번호 → 에러 메시지, 실패로 기록)
 
         Raises:
             AnalyzeResError: 결과 폴더가 존재하지 않거나 분석 실패 시
         """
         self.res_path: Path = Path(RESULT_PATH) / time
+        self.result_xlsx: str = f"{self.res_path}{REPORT_SUFFIX}"
+        self.base = base
         self._validate_result_path()
 
         try:
-            self.test_result = self._analyze_results(exp_res)
+            expect_table = self._get_expect_table(exp_res, rows)
+            self.test_result = self._analyze_results(expect_table, traces)
+            if base is not None:
+                self.test_result = self._merge_results(base, sorted(rows or []))
+                self._merge_expectations(base, sorted(rows or []), expect_table)
+            elif excluded:
+                self.test_result = self._expand_results(sorted(rows or []), excluded)
+                self._expand_expectations(sorted(rows or []), excluded, expect_table)
+            if excluded:
+                self.test_result = self._mark_excluded(excluded)
             self._generate_report()
         except Exception as e:
             print(f"Error: 테스트 결과 분석 중 오류 발생: {e}")
@@ -112,136 +156,327 @@ class AnalyzeRes:
             print(f"Error: CSV 파싱 오류 ({csv_path}): {e}")
             raise AnalyzeResError(f"CSV 파일 읽기 실패: {csv_path}") from e
 
-    def _process_last_row_case(self, exp_list: List[str], meas_df: pd.DataFrame) -> Tuple[List[str], bool]:
-        """마지막 행 기준 테스트 케이스 처리
+    def _get_expect_table(self, exp_res: Union[ExpectationTable, Sequence[LegacyExpect], None],
+                          rows: Optional[List[int]]) -> ExpectationTable:
+        """예상값을 컬럼형 테이블로 변환 (None 이면 결과 폴더의 저장 파일 로드)"""
+        if exp_res is None:
+            try:
+                return ExpectationTable.load(self.res_path / EXPECT_FILE)
+            except ExpectationError as e:
+                raise AnalyzeResError(str(e)) from e
+        if isinstance(exp_res, ExpectationTable):
+            return exp_res
+        if isinstance(exp_res, ExpectationView):
+            return exp_res.table
+        return ExpectationTable.from_legacy(exp_res, rows)
+
+    def _analyze_single_result(self, entries: ExpectationEntries, meas_df: pd.DataFrame) -> Tuple[str, str]:
+        """단일 테스트 결과 분석
+
+        사이클 미지정(DEFAULT_CYCLE_NUMBER) 예상값이 있으면 마지막 행 기준으로, 없으면
+        사이클 번호 행 기준으로 측정값을 한 번에 조회하여 비교합니다.
 
         Args:
-            exp_list: 예상값 리스트
+            entries: 테스트 하나의 예상값
             meas_df: 측정값 DataFrame
 
         Returns:
-            Tuple[출력 라인 리스트, 통과 여부]
+            Tuple[측정 출력, 결과 (Pass/Fail)]
         """
-        output_lines = []
-        is_pass = True
+        matrix = meas_df.to_numpy()
+        columns = {name: i for i, name in enumerate(meas_df.columns)}
 
-        for exp in exp_list:
-            if len(exp) < 2:
-                print(f"Warning: 잘못된 예상값 형식: {exp}")
-                continue
+        indexed = not (entries.cycles == DEFAULT_CYCLE_NUMBER).any()
+        if not indexed:
+            entries = entries.select(entries.cycles == DEFAULT_CYCLE_NUMBER)
+            rows = np.full(len(entries), len(matrix) - 1)
+        else:
+            rows = entries.cycles.astype(np.intp) - 1
 
-            var, expected_val = exp[0], exp[1]
+        names = entries.names()
+        cols = np.array([columns.get(name, -1) for name in names], dtype=np.intp)
+        valid_rows = (rows >= 0) & (rows < len(matrix))
+        valid = valid_rows & (cols >= 0)
 
-            if var not in meas_df.columns:
-                print(f"Warning: 컬럼을 찾을 수 없습니다: {var}")
-                is_pass = False
-                continue
+        for order in sorted(set(entries.cycles[~valid_rows].tolist())):
+            print(f"Warning: 잘못된 행 인덱스: {order}")
+        for name in np.array(names, dtype=object)[valid_rows & (cols < 0)].tolist():
+            print(f"Warning: 컬럼을 찾을 수 없습니다: {name}")
 
-            measured_val = meas_df[var].iloc[-1]
-            output_lines.append(f"{var} = {measured_val}")
+        measured = matrix[rows[valid], cols[valid]]
+        is_pass = bool(valid.all()) and bool((measured.astype(str) == entries.values[valid].astype(str)).all())
 
-            if expected_val != measured_val:
-                is_pass = False
+        valid_names = [name for name, ok in zip(names, valid.tolist()) if ok]
+        if indexed:
+            output_lines = [f"{order}) {name} = {value}" for order, name, value
+                            in zip(entries.cycles[valid].tolist(), valid_names, measured.tolist())]
+        else:
+            output_lines = [f"{name} = {value}" for name, value in zip(valid_names, measured.tolist())]
+
+        measured_output = '\n'.join(output_lines)
+        result = PASS_RESULT if is_pass else FAIL_RESULT
 
-        return output_lines, is_pass
+        return measured_output, result
 
-    def _process_indexed_case(self, exp_dict: Dict[int, List[str]], meas_df: pd.DataFrame) -> Tuple[List[str], bool]:
-        """인덱스 기준 테스트 케이스 처리
+    @staticmethod
+    def _stim_error(meas_df: pd.DataFrame) -> Optional[str]:
+        """자극 테이블을 열지 못한 테스트면 에러 메시지 (드라이버가 측정값 파일 첫 컬럼에 표시)"""
+        if meas_df.empty:
+            return None
+        first = meas_df.iloc[:, 0].astype(str)
+        marked = first[first.str.startswith(STIM_ERROR_MARK)]
+        if marked.empty:
+            return None
+        return f"자극 테이블을 열 수 없습니다: {marked.iloc[0][len(STIM_ERROR_MARK):].strip()}"
+
+    def _analyze_sweep_result(self, entries: ExpectationEntries, sweep: Tuple[str, List[int]],
+                              meas_df: pd.DataFrame) -> Tuple[str, str, List[str]]:
+        """스윕 행 결과 분석 (결과 파일 하나를 지점별로 나누어 판정)
 
         Args:
-            exp_dict: 예상값 딕셔너리
-            meas_df: 측정값 DataFrame
+            entries: 테스트 하나의 예상값 (지점 번호 포함)
+            sweep: (스윕 변수, 지점 값 리스트)
+            meas_df: 측정값 DataFrame (첫 컬럼: 스윕 지점 번호)
 
         Returns:
-            Tuple[출력 라인 리스트, 통과 여부]
+            Tuple[측정 출력 (지점별 라인), 결과 (모든 지점 통과 시 Pass), 지점별 결과 리스트]
         """
-        output_lines = []
-        is_pass = True
+        if SWEEP_POINT_VAR not in meas_df.columns:
+            raise AnalyzeResError(f"스윕 지점 컬럼을 찾을 수 없습니다: {SWEEP_POINT_VAR}")
+
+        variable, points = sweep
+        groups = {point: df.reset_index(drop=True) for point, df in meas_df.groupby(SWEEP_POINT_VAR, sort=False)}
+        output_lines, point_results = [], []
+        for index, point in enumerate(points):
+            label = f"{variable}={point}"
+            point_df = groups.get(str(index))
+            if point_df is None:
+                print(f"Warning: 측정값이 없는 스윕 지점: {label}")
+                measured, result = "", FAIL_RESULT
+            else:
+                measured, result = self._analyze_single_result(entries.select(entries.points == index), point_df)
+            point_results.append(result)
+            output_lines.append(f"[{label}] {result}: {measured.replace(chr(10), ', ')}")
+
+        result = PASS_RESULT if all(res == PASS_RESULT for res in point_results) else FAIL_RESULT
+        return '\n'.join(output_lines), result, point_results
+
+    def _analyze_results(self, expect_table: ExpectationTable,
+                         traces: Optional[List[pd.DataFrame]] = None) -> TestResult:
+        """테스트 결과 분석 수행
 
-        for order, exp_list in exp_dict.items():
-            if order <= 0 or order > len(meas_df):
-                print(f"Warning: 잘못된 행 인덱스: {order}")
-                is_pass = False
-                continue
+        Args:
+            expect_table: 테스트 예상값 테이블
+            traces: 메모리상의 측정값 리스트 (없으면 CSV 파일 로드)
 
-            for exp in exp_list:
-                if len(exp) < 2:
-                    print(f"Warning: 잘못된 예상값 형식: {exp}")
-                    continue
+        Returns:
+            TestResult 객체
+        """
+        meas_files = self._load_csv_files() if traces is None else traces
 
-                var, expected_val = exp[0], exp[1]
+        if len(meas_files) != len(expect_table):
+            error_msg = f"파일 수 불일치: CSV({len(meas_files)}) vs 예상값({len(expect_table)})"
+            print(f"Error: {error_msg}")
+            raise AnalyzeResError(error_msg)
 
-                if var not in meas_df.columns:
-                    print(f"Warning: 컬럼을 찾을 수 없습니다: {var}")
-                    is_pass = False
-                    continue
+        measured_outputs = []
+        results = []
+        point_results: Dict[str, List[str]] = {}
 
-                measured_val = meas_df[var].iloc[order - 1]
-                output_lines.append(f"{order}) {var} = {measured_val}")
+        for index, meas_file in enumerate(meas_files):
+            try:
+                meas_df = meas_file if traces is not None else self._read_csv_safely(meas_file)
+                entries = expect_table.entries(index)
+                sweep = expect_table.get_sweep(index)
+                stim_error = self._stim_error(meas_df)
+                if stim_error is not None:
+                    measured_output, result = stim_error, FAIL_RESULT
+                elif sweep is not None:
+                    measured_output, result, point_results[str(index + 1)] = \
+                        self._analyze_sweep_result(entries, sweep, meas_df)
+                else:
+                    measured_output, result = self._analyze_single_result(entries, meas_df)
+                measured_outputs.append(measured_output)
+                results.append(result)
+            except Exception as e:
+                print(f"Error: 파일 분석 오류 ({meas_file if traces is None else index + 1}): {e}")
+                measured_outputs.append("분석 오류")
+                results.append(FAIL_RESULT)
 
-                if expected_val != measured_val:
-                    is_pass = False
+        # 실패한 케이스 인덱스 추출
+        failed_indices = [
+            str(i + 1) for i, result in enumerate(results)
+            if result == FAIL_RESULT
+        ]
 
-        return output_lines, is_pass
+        return TestResult(measured_outputs, results, failed_indices, point_results)
 
-    def _analyze_single_result(self, exp_dict: Dict[int, List[str]], meas_file: Path) -> Tuple[str, str]:
-        """단일 테스트 결과 분석
+    def _merge_results(self, base: str, rows: List[int]) -> TestResult:
+        """재실행 결과를 이전 실행 결과에 병합
 
         Args:
-            exp_dict: 예상값 딕셔너리
-            meas_file: 측정값 파일 경로
+            base: 이전 테스트 실행 시간
+            rows: 재실행된 테스트 행 번호 리스트 (1부터 시작)
 
         Returns:
-            Tuple[측정 출력, 결과 (Pass/Fail)]
+            병합된 TestResult 객체
         """
-        meas_df = self._read_csv_safely(meas_file)
+        if len(rows) != len(self.test_result.results):
+            error_msg = f"재실행 행 수 불일치: 행({len(rows)}) vs 결과({len(self.test_result.results)})"
+            print(f"Error: {error_msg}")
+            raise AnalyzeResError(error_msg)
 
-        if LAST_ROW_INDEX in exp_dict:
-            output_lines, is_pass = self._process_last_row_case(exp_dict[LAST_ROW_INDEX], meas_df)
-        else:
-            output_lines, is_pass = self._process_indexed_case(exp_dict, meas_df)
+        previous = load_run_result(base)
+        measured_outputs = list(previous.measured_output)
+        results = list(previous.results)
+
+        rerun_points = {}
+        for index, (row, measured, result) in enumerate(zip(rows, self.test_result.measured_output,
+                                                             self.test_result.results)):
+            if row > len(results):
+                raise AnalyzeResError(f"이전 결과에 없는 행입니다: {row}")
+            measured_outputs[row - 1] = measured
+            results[row - 1] = result
+            if str(index + 1) in self.test_result.point_results:
+                rerun_points[str(row)] = self.test_result.point_results[str(index + 1)]
+
+        # 재실행하지 않은 테스트의 CSV는 이전 결과 폴더에서 가져온다
+        base_path = Path(RESULT_PATH) / base
+        if base_path.exists():
+            for csv_file in base_path.glob('*.csv'):
+                if not (self.res_path / csv_file.name).exists():
+                    shutil.copy2(csv_file, self.res_path)
+        elif is_archived(base):
+            archive = RunArchive(base)
+            for name in archive.names('.csv'):
+                if not (self.res_path / Path(name).name).exists():
+                    (self.res_path / Path(name).name).write_bytes(archive.read_bytes(name))
+
+        # 재실행하지 않은 스윕 행의 지점 결과는 이전 예상값과 가져온 측정값으로 다시 판정
+        point_results = {**self._base_point_results(base, rows), **rerun_points}
+        point_results = {row: point_results[row] for row in sorted(point_results, key=int)}
 
-        measured_output = '\n'.join(output_lines)
-        result = PASS_RESULT if is_pass else FAIL_RESULT
+        failed_indices = [
+            str(i + 1) for i, result in enumerate(results)
+            if result == FAIL_RESULT
+        ]
 
-        return measured_output, result
+        return TestResult(measured_outputs, results, failed_indices, point_results)
 
-    def _analyze_results(self, exp_res: List[Dict[int, List[str]]]) -> TestResult:
-        """테스트 결과 분석 수행
+    @staticmethod
+    def _load_base_expectations(base: str) -> Optional[ExpectationTable]:
+        """이전 실행의 저장된 예상값 테이블 (없거나 읽을 수 없으면 None)"""
+        data = read_result_file(f"{base}/{EXPECT_FILE}")  # 압축 보관된 실행은 보관 파일에서 읽음
+        try:
+            if data is None:
+                raise ExpectationError(f"저장된 예상값 파일이 없습니다: {Path(RESULT_PATH) / base / EXPECT_FILE}")
+            return ExpectationTable.load(io.BytesIO(data))
+        except ExpectationError as e:
+            print(f"Warning: 이전 예상값을 읽지 못했습니다: {e}")
+            return None
+
+    def _base_point_results(self, base: str, rows: List[int]) -> Dict[str, List[str]]:
+        """재실행하지 않은 스윕 행의 이전 실행 지점 결과 (행 번호 → Pass/Fail)
 
         Args:
-            exp_res: 테스트 예상값 리스트
+            base: 이전 테스트 실행 시간
+            rows: 재실행된 테스트 행 번호 리스트 (1부터 시작)
 
         Returns:
-            TestResult 객체
+            스윕 행별 지점 결과 (결과 폴더로 가져온 이전 측정값 CSV 기준)
         """
-        meas_files = self._load_csv_files()
+        previous = self._load_base_expectations(base)
+        if previous is None:
+            return {}
+
+        df_res = load_run_report(base)  # 테스트 케이스 시트를 다시 파싱하지 않고 이전 보고서의 Test# 사용
+        if TEST_NUM_TITLE not in df_res.columns:
+            return {}
+        test_nums = [normalize_cell(value).zfill(3) for value in df_res[TEST_NUM_TITLE]]
+        rerun = set(rows)
+        point_results = {}
+        for index in range(min(len(previous), len(test_nums))):
+            sweep = previous.get_sweep(index)
+            csv_file = self.res_path / f"test_{test_nums[index]}.csv"
+            if sweep is None or index + 1 in rerun or not csv_file.is_file():
+                continue
+            try:
+                _, _, point_results[str(index + 1)] = self._analyze_sweep_result(
+                    previous.entries(index), sweep, self._read_csv_safely(csv_file))
+            except Exception as e:
+                print(f"Warning: 이전 스윕 지점 결과 판정 실패 ({csv_file.name}): {e}")
+        return point_results
+
+    def _expand_results(self, rows: List[int], excluded: Dict[int, str]) -> TestResult:
+        """실행한 행 결과를 전체 행 순서로 확장 (제외 행은 _mark_excluded 에서 채움)
+
+        Args:
+            rows: 실행한 테스트 행 번호 리스트 (1부터 시작)
+            excluded: 컴파일 에러로 제외한 행 번호
 
-        if len(meas_files) != len(exp_res):
-            error_msg = f"파일 수 불일치: CSV({len(meas_files)}) vs 예상값({len(exp_res)})"
+        Returns:
+            전체 행 TestResult 객체
+        """
+        if len(rows) != len(self.test_result.results):
+            error_msg = f"실행 행 수 불일치: 행({len(rows)}) vs 결과({len(self.test_result.results)})"
             print(f"Error: {error_msg}")
             raise AnalyzeResError(error_msg)
 
-        measured_outputs = []
-        results = []
-
-        for exp_dict, meas_file in zip(exp_res, meas_files):
-            try:
-                measured_output, result = self._analyze_single_result(exp_dict, meas_file)
-                measured_outputs.append(measured_output)
-                results.append(result)
-            except Exception as e:
-                print(f"Error: 파일 분석 오류 ({meas_file}): {e}")
-                measured_outputs.append("분석 오류")
-                results.append(FAIL_RESULT)
+        total = max([*rows, *excluded])
+        measured_outputs, results = [''] * total, [FAIL_RESULT] * total
+        point_results = {}
+        for index, row in enumerate(rows):
+            measured_outputs[row - 1] = self.test_result.measured_output[index]
+            results[row - 1] = self.test_result.results[index]
+            if str(index + 1) in self.test_result.point_results:
+                point_results[str(row)] = self.test_result.point_results[str(index + 1)]
+
+        return TestResult(measured_outputs, results, [], point_results)
+
+    def _expand_expectations(self, rows: List[int], excluded: Dict[int, str],
+                             expect_table: ExpectationTable) -> None:
+        """실행한 행 예상값을 전체 행 순서로 저장 (제외 행은 빈 예상값, 이후 재실행 병합용)"""
+        position = {row - 1: index for index, row in enumerate(rows)}
+        builder = ExpectationBuilder()
+        for index in range(max([*rows, *excluded])):
+            builder.append(expect_table.to_legacy(position[index]) if index in position else {})
+        builder.build().save(self.res_path / EXPECT_FILE)
+
+    def _mark_excluded(self, excluded: Dict[int, str]) -> TestResult:
+        """컴파일 에러로 제외한 행을 실패로 기록"""
+        measured_outputs = list(self.test_result.measured_output)
+        results = list(self.test_result.results)
+        for row, message in excluded.items():
+            if row > len(results):
+                raise AnalyzeResError(f"결과에 없는 행입니다: {row}")
+            measured_outputs[row - 1] = f"컴파일 에러: {message}"
+            results[row - 1] = FAIL_RESULT
 
-        # 실패한 케이스 인덱스 추출
         failed_indices = [
             str(i + 1) for i, result in enumerate(results)
             if result == FAIL_RESULT
         ]
 
-        return TestResult(measured_outputs, results, failed_indices)
+        return TestResult(measured_outputs, results, failed_indices, self.test_result.point_results)
+
+    def _merge_expectations(self, base: str, rows: List[int], expect_table: ExpectationTable) -> None:
+        """재실행 예상값을 이전 실행 예상값에 병합하여 저장 (병합된 결과 폴더 재분석용)
+
+        Args:
+            base: 이전 테스트 실행 시간
+            rows: 재실행된 테스트 행 번호 리스트 (1부터 시작)
+            expect_table: 재실행 예상값 테이블 (rows 순서)
+        """
+        previous = self._load_base_expectations(base)
+        if previous is None:
+            print("Warning: 이전 예상값을 병합하지 못했습니다")
+            return
+
+        rerun = {row - 1: index for index, row in enumerate(rows)}
+        builder = ExpectationBuilder()
+        for index in range(len(previous)):
+            builder.append(expect_table.to_legacy(rerun[index]) if index in rerun else previous.to_legacy(index))
+        builder.build().save(self.res_path / EXPECT_FILE)
 
     def _generate_report(self) -> None:
         """결과 보고서 Excel 파일 생성
@@ -250,7 +485,7 @@ class AnalyzeRes:
             AnalyzeResError: Excel 파일 생성 실패 시
         """
         try:
-            result_xlsx = f"{self.res_path}_testcase.xlsx"
+            result_xlsx = self.result_xlsx
 
             # 테스트 케이스 파일 로드
             if not Path(TEST_CASE_FILE).exists():
@@ -258,21 +493,55 @@ class AnalyzeRes:
 
             wb = openpyxl.load_workbook(TEST_CASE_FILE)
             ws = wb.active
+            test_info = read_test_info(ws.iter_rows(min_row=2, values_only=True))
 
             # 결과 데이터 추가
-            add_col_data(ws, MEASURED_COL_INDEX, 'Measured(산출값)', self.test_result.measured_output)
-            add_col_data(ws, RESULT_COL_INDEX, 'Result(결과)', self.test_result.results, True)
+            add_col_data(ws, MEASURED_COL_INDEX, MEASURED_TITLE, self.test_result.measured_output)
+            add_col_data(ws, RESULT_COL_INDEX, RESULT_TITLE, self.test_result.results, True)
 
             # 파일 저장
             wb.save(result_xlsx)
             wb.close()
 
+            self._record_run(test_info)
             self._print_summary(result_xlsx)
 
         except Exception as e:
             print(f"Error: Excel 파일 생성 오류: {e}")
             raise AnalyzeResError(f"보고서 생성 실패: {e}") from e
 
+    def _record_run(self, test_info: List[TestInfo]) -> None:
+        """결과 이력 저장소에 실행 결과 추가 (저장 실패 시 경고만 출력)
+
+        Args:
+            test_info: 테스트 행별 식별 정보 리스트
+        """
+        refs = store_traces(self.res_path)  # 측정값을 blob 으로 저장하며 해시 계산
+        base = previous_run(self.res_path.name)
+        if base is not None:
+            unchanged = unchanged_traces(refs, load_trace_refs(base))
+            print(f"Info: {base} 실행 대비 측정값 변경 없음 {len(unchanged)}/{len(refs)}개")
+
+        source_hashes: Dict[str, Optional[str]] = {}
+        tests = []
+        for index, (info, measured, result) in enumerate(
+                zip(test_info, self.test_result.measured_output, self.test_result.results), start=1):
+            trace = self.res_path / f"test_{info.test_num}.csv"
+            trace_hash = refs.get(trace.name)
+            if info.c_file and info.c_file not in source_hashes:
+                source_hashes[info.c_file] = hash_file(Path(STUB_PATH) / info.c_file)
+            tests.append(TestRecord(index, info.test_num, info.function, info.c_file, result, measured,
+                                    f"{self.res_path.name}/{trace.name}" if trace_hash else None, trace_hash,
+                                    info.row_hash, source_hashes.get(info.c_file)))
+
+        run_id = self.res_path.name
+        run = RunRecord(run_id, run_created_at(run_id), self.base, Path(self.result_xlsx).name,
+                        file_hash(TEST_CASE_FILE), len(tests), len(self.test_result.failed_indices))
+        try:
+            ResultStore().add_run(run, tests)
+        except ResultStoreError as e:
+            print(f"Warning: 결과 이력 저장 실패: {e}")
+
     def _print_summary(self, result_file: str) -> None:
         """결과 요약 출력
 
@@ -284,6 +553,9 @@ class AnalyzeRes:
         if self.test_result.failed_indices:
             print(f"Failed test cases: {', '.join(self.test_result.failed_indices)}")
             print(f"Info: 실패한 테스트 케이스: {len(self.test_result.failed_indices)}개")
+            for row, point_results in self.test_result.point_results.items():
+                if FAIL_RESULT in point_results:
+                    print(f"Info: 스윕 행 {row}: {point_results.count(FAIL_RESULT)}/{len(point_results)} 지점 실패")
         else:
             print("All test cases passed!")
             print("Info: 모든 테스트 케이스 통과")
@@ -302,4 +574,128 @@ class AnalyzeRes:
     @property
     def fail_index(self) -> List[str]:
         """실패한 테스트 케이스 인덱스 목록 (하위 호환성)"""
-        return self.test_result.failed_indices
\ No newline at end of file
+        return self.test_result.failed_indices
+
+
+def get_latest_run() -> Optional[str]:
+    """가장 최근 테스트 실행 시간 (결과 보고서 기준)
+
+    Returns:
+        결과 폴더명 또는 결과가 없으면 None
+    """
+    result_path = Path(RESULT_PATH)
+    if not result_path.exists():
+        return None
+
+    runs = sorted(f.name[:-len(REPORT_SUFFIX)] for f in result_path.iterdir()
+                  if f.name.endswith(REPORT_SUFFIX))
+    return runs[-1] if runs else None
+
+
+def load_run_report(time: str) -> pd.DataFrame:
+    """저장된 결과 보고서 DataFrame 로드 (빈 값은 빈 문자열)
+
+    Args:
+        time: 테스트 실행 시간 (결과 폴더명)
+
+    Raises:
+        AnalyzeResError: 결과 보고서가 없거나 결과 컬럼이 없는 경우
+    """
+    result_xlsx = Path(RESULT_PATH) / f"{time}{REPORT_SUFFIX}"
+    if result_xlsx.is_file():
+        df_res = load_report(result_xlsx).fillna('')
+    else:
+        data = read_result_file(result_xlsx.name)  # 압축 보관된 실행은 보관 파일에서 읽음
+        if data is None:
+            raise AnalyzeResError(f"이전 결과 보고서가 없습니다: {result_xlsx}")
+        df_res = pd.read_excel(io.BytesIO(data), engine='openpyxl', dtype=str).fillna('')
+    if MEASURED_TITLE not in df_res.columns or RESULT_TITLE not in df_res.columns:
+        raise AnalyzeResError(f"결과 컬럼을 찾을 수 없습니다: {result_xlsx}")
+    return df_res
+
+
+def load_run_result(time: str) -> TestResult:
+    """저장된 결과 보고서에서 테스트 결과 로드
+
+    Args:
+        time: 테스트 실행 시간 (결과 폴더명)
+
+    Returns:
+        TestResult 객체
+
+    Raises:
+        AnalyzeResError: 결과 보고서가 없거나 결과 컬럼이 없는 경우
+    """
+    df_res = load_run_report(time)
+    results = df_res[RESULT_TITLE].tolist()
+    failed_indices = [str(i + 1) for i, result in enumerate(results) if result == FAIL_RESULT]
+    return TestResult(df_res[MEASURED_TITLE].tolist(), results, failed_indices)
+
+
+def read_test_info(rows: Iterable[Sequence]) -> List[TestInfo]:
+    """테스트 케이스 시트 행에서 테스트 식별 정보 리스트 생성 (빈 행 제외)
+
+    Args:
+        rows: 헤더를 제외한 시트 행 (첫 번째 열 포함, 결과 컬럼 제외)
+    """
+    test_info = []
+    for row in rows:
+        cells = [normalize_cell(val) for val in row[1:]]
+        while cells and not cells[-1]:
+            cells.pop()
+        if not cells:
+            continue  # 빈 행
+
+        values = [None] + [cell or None for cell in cells]
+        values += [None] * (FUNCTION_COL + 1 - len(values))
+        test_num = values[TEST_NUM_COL]
+        try:
+            test_num = str(int(float(test_num))).zfill(3)
+        except (TypeError, ValueError):
+            test_num = '' if test_num is None else test_num
+        row_hash = hashlib.sha1('\x1f'.join(cells).encode('utf-8')).hexdigest()
+        test_info.append(TestInfo(test_num, values[C_FILE_COL], values[FUNCTION_COL], row_hash))
+    return test_info
+
+
+def index_saved_runs(store: Optional[ResultStore] = None) -> List[str]:
+    """결과 이력 저장소에 없는 기존 결과 보고서를 저장소에 추가
+
+    Args:
+        store: 결과 이력 저장소 (기본: RESULT_DB)
+
+    Returns:
+        새로 추가한 실행 시간 리스트
+    """
+    store = store or ResultStore()
+    result_path = Path(RESULT_PATH)
+    if not result_path.exists():
+        return []
+
+    indexed = store.get_run_ids()
+    added = []
+    for report in sorted(result_path.glob(f"*{REPORT_SUFFIX}")):
+        run_id = report.name[:-len(REPORT_SUFFIX)]
+        if run_id in indexed:
+            continue
+        try:
+            df_res = pd.read_excel(report, engine='openpyxl', dtype=str)
+            test_info = read_test_info(df_res.drop(columns=[MEASURED_TITLE, RESULT_TITLE])
+                                       .itertuples(index=False, name=None))
+            df_res = df_res.fillna('')
+            measured_output, results = df_res[MEASURED_TITLE].tolist(), df_res[RESULT_TITLE].tolist()
+        except Exception as e:
+            print(f"Warning: 결과 보고서를 읽지 못했습니다 ({report.name}): {e}")
+            continue
+
+        tests = []
+        for index, (info, measured, result) in enumerate(zip(test_info, measured_output, results), start=1):
+            trace = result_path / run_id / f"test_{info.test_num}.csv"
+            trace_hash = hash_file(trace)
+            tests.append(TestRecord(index, info.test_num, info.function, info.c_file, result, measured,
+                                    f"{run_id}/{trace.name}" if trace_hash else None, trace_hash,
+                                    info.row_hash))  # 당시 소스는 알 수 없음
+        store.add_run(RunRecord(run_id, run_created_at(run_id), None, report.name, None,
+                                len(tests), results.count(FAIL_RESULT)), tests)
+        added.append(run_id)
+    return added
@@ -19,8 +19,19 @@ STUB_PATH = DEFAULT_DIR / 'data/stub'  # stub 코드 폴더
 TEST_CASE_FILE = DEFAULT_DIR / 'data/testcase.xlsx'  # 테스트케이스
 LAST_TEST_CASE_FILE = DEFAULT_DIR / 'data/old/last_testcase.xlsx'
 RESULT_PATH = DEFAULT_DIR / 'data/result'
-DOWNLOAD_ZIP = DEFAULT_DIR / 'data/download.zip'
+RESULT_DB = DEFAULT_DIR / 'data/result/results.db'  # 테스트 결과 이력 데이터베이스
+BLOB_PATH = DEFAULT_DIR / 'data/result/blobs'  # 내용 주소(sha1) 측정값 저장 폴더
+ARCHIVE_PATH = DEFAULT_DIR / 'data/archive'  # 오래된 실행 결과 압축 보관 폴더
 ERROR_LOG = DEFAULT_DIR / 'data/stub/error.log'
+SYMBOL_FILE = DEFAULT_DIR / 'data/stub/symbols.json'  # 스텁 소스별 전역 변수 이름 (행 검사용)
+SHARED_LIB_PATH = DEFAULT_DIR / 'data/shared'  # 공유 라이브러리 캐시 폴더
+PCH_PATH = DEFAULT_DIR / 'data/pch'  # 미리 컴파일된 헤더 캐시 폴더
+STIM_CACHE_PATH = DEFAULT_DIR / 'data/stim_cache'  # 변환된 자극 테이블 캐시 폴더
+CHECK_CACHE_PATH = DEFAULT_DIR / 'data/check_cache'  # 소스 파일별 컴파일 적합성 검사 결과 캐시 폴더
+
+GCC_FLAGS_WITH_ARG = {'-I', '-D', '-U', '-include', '-isystem'}
+SHELL_REDIRECTIONS = ('>', '2>', '&>', '1>')
+DEFAULT_CYCLE_NUMBER = 255  # 사이클 미지정 예상값 (마지막 사이클 기준)
 
 
 def git_checkout(project_dir: str, branch: str) -> None:
@@ -38,6 +49,30 @@ def git_checkout(project_dir: str, branch: str) -> None:
         os.chdir(original_dir)  # 예외 발생해도 원래 폴더로 복귀 보장
 
 
+def parse_gcc_flags(gcc_option: str) -> List[str]:
+    """gcc_option 문자열에서 컴파일 플래그만 추출 (소스, 출력 파일, 리다이렉션 제외)
+
+    Args:
+        gcc_option: 설정 파일의 gcc 옵션 문자열
+
+    Returns:
+        컴파일 플래그 리스트
+    """
+    flags = []
+    tokens = iter(gcc_option.split())
+    for token in tokens:
+        if token == '-o' or token in SHELL_REDIRECTIONS:
+            next(tokens, None)  # 출력 파일 / 리다이렉션 대상 건너뜀
+        elif token.startswith(SHELL_REDIRECTIONS) or (token.startswith('-o') and len(token) > 2):
+            continue
+        elif token in GCC_FLAGS_WITH_ARG:
+            flags.extend([token, next(tokens, '')])
+        elif token.startswith('-'):
+            flags.append(token)
+
+    return flags
+
+
 def copy_style(cell: Any, new_cell: Any) -> None:
     """셀 스타일 복사 함수
 
@@ -124,7 +159,7 @@ def colorize(val: str) -> Optional[str]:
 
 
 def get_2d_list(divider: int, path: Path) -> np.ndarray:
-    """디렉토리 파일 목록을 2D 배열로 변환
+    """디렉토리 CSV 파일 목록을 2D 배열로 변환
 
     Args:
         divider: 2차원 배열의 열 개수
@@ -137,8 +172,8 @@ def get_2d_list(divider: int, path: Path) -> np.ndarray:
     if not path_obj.exists():
         return np.array([]).reshape(0, divider)
 
-    # 디렉토리 파일 목록 가져오기
-    lst_files = [f.name for f in path_obj.iterdir() if f.is_file()]
+    # 디렉토리 CSV 파일 목록 가져오기 (예상값 파일 등 제외)
+    lst_files = sorted(f.name for f in path_obj.iterdir() if f.is_file() and f.suffix.lower() == '.csv')
 
     # 행과 더미 값 계산
     total_files = len(lst_files)
@@ -0,0 +1,191 @@
+import shutil
+import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from Lib.compileCheck import Diagnostic, SYNTAX_ONLY_FLAG, parse_diagnostics
+from Lib.pchCache import PCH_HEADER
+from Lib.rowValidator import RowIssue
+from Lib.toolchain import Toolchain
+
+# 상수 정의
+DIAG_DIR = 'diag'  # 진단용 컴파일 단위 폴더 (스텁 폴더 기준)
+OUT_COL_LINES = 3  # 테스트 함수 앞부분 출력 파일 코드 줄 수 (FILE*, fopen, 헤더 fprintf)
+ERROR_SEVERITIES = ('error', 'fatal error')
+IMPLICIT_DECL_FLAG = '-Werror=implicit-function-declaration'  # 구문 검사에서 링크 에러가 될 미선언 함수 호출 검출
+
+
+@dataclass
+class TestUnit:
+    """진단 대상 테스트 행 하나의 생성 코드
+
+    Attributes:
+        row: 행 번호 (1부터 시작)
+        test_num: 테스트 번호
+        code: 생성된 Test_NNN() 함수 코드
+        columns: 코드 줄별 원본 컬럼 이름 (Pre / Inputs / Function / Expect)
+    """
+    row: int
+    test_num: str
+    code: str
+    columns: List[str]
+
+
+def code_columns(code: str, pre_code: str, func: str) -> List[str]:
+    """생성된 테스트 함수 코드의 줄마다 해당 코드를 만든 시트 컬럼 이름
+
+    코드 구조 (_generate_function_code): 빈 줄, 함수 선언, '{', 출력 파일 코드 3줄,
+    사전 조건 코드, 조건 코드 (입력 / 함수 호출 / 측정값 기록), fclose, '}'
+    """
+    lines = code.split('\n')
+    func_lines = {line.strip() for line in func.split('\n') if line.strip()}
+    pre_end = 3 + OUT_COL_LINES + len(pre_code.split('\n'))
+
+    columns = []
+    for number, line in enumerate(lines):
+        if number < 3:
+            columns.append('Test#')
+        elif number < 3 + OUT_COL_LINES:
+            columns.append('Expect')  # 출력 변수 헤더
+        elif number < pre_end:
+            columns.append('Pre')
+        elif line.strip() in func_lines:
+            columns.append('Function')
+        elif 'fprintf' in line or 'fclose' in line or line.strip() == '}':
+            columns.append('Expect')
+        else:
+            columns.append('Inputs')
+    return columns
+
+
+class CompileBisector:
+    """컴파일 실패 원인 행 찾기
+
+    구문 검사만으로는 링크 단계에서야 실패하는 오타 함수 호출(App_Taskk() 등)을 찾지 못하므로
+    선언 없는 함수 호출은 에러로 검사합니다. 테스트 함수를 묶음 단위 컴파일 단위로 나누어 병렬로 구문 검사하고, 실패한 묶음만
+    반으로 나누어 다시 검사합니다. 행 하나까지 좁혀진 실패는 그 행의 에러로, 두 절반이
+    모두 통과하는데 합치면 실패하는 경우(중복 Test# 등)는 에러 줄 위치로 행을 찾습니다.
+
+    Attributes:
+        toolchain: 컴파일러와 플래그
+        stub_dir: 스텁 폴더 (stub_headers.h 위치)
+    """
+
+    def __init__(self, toolchain: Toolchain, stub_dir: Path):
+        self.toolchain = toolchain
+        self.stub_dir = Path(stub_dir).resolve()
+        self.diag_dir = self.stub_dir / DIAG_DIR
+        self._counter = 0
+
+    def _compile(self, units: Sequence[TestUnit], name: str) -> Tuple[bool, List[Diagnostic], List[int]]:
+        """묶음 하나 구문 검사
+
+        Returns:
+            Tuple[성공 여부, 진단 메시지 (이 컴파일 단위 파일의 것만), 컴파일 단위 줄 번호 → 묶음 내 위치]
+        """
+        source = self.diag_dir / f"{name}.c"
+        owners = [-1]  # 1행: #include
+        parts = [f'#include "{PCH_HEADER}"']
+        for position, unit in enumerate(units):
+            parts.append(unit.code)
+            owners.extend([position] * len(unit.code.split('\n')))
+        source.write_text('\n'.join(parts) + '\n', encoding='utf-8')
+
+        command = [self.toolchain.compiler, *self.toolchain.flags, SYNTAX_ONLY_FLAG, IMPLICIT_DECL_FLAG,
+                   '-I', str(self.stub_dir), str(source.relative_to(self.stub_dir))]
+        try:
+            proc = subprocess.run(command, cwd=self.stub_dir, capture_output=True, text=True)
+        except OSError as e:
+            return False, [Diagnostic(source.name, 0, None, 'error', f"{self.toolchain.compiler} 실행 실패: {e}")], owners
+        diagnostics = [d for d in parse_diagnostics(proc.stderr) if Path(d.file).name == source.name]
+        return proc.returncode == 0, diagnostics, owners
+
+    def _issues(self, units: Sequence[TestUnit], diagnostics: List[Diagnostic], owners: List[int]) -> List[RowIssue]:
+        """에러 진단을 행/컬럼 단위 문제로 변환"""
+        issues = []
+        for diag in diagnostics:
+            if diag.severity not in ERROR_SEVERITIES or not 0 < diag.line <= len(owners):
+                continue
+            position = owners[diag.line - 1]
+            if position < 0:
+                continue
+            unit = units[position]
+            line = diag.line - 1 - owners.index(position)  # 테스트 함수 코드 내 줄 위치 (0부터)
+            code = unit.code.split('\n')[line].strip()
+            issues.append(RowIssue(unit.row, unit.test_num, unit.columns[line], f"{diag.message} (코드: {code})"))
+        return issues
+
+    def _next_name(self) -> str:
+        self._counter += 1
+        return f"unit_{self._counter:05d}"
+
+    def _row_issues(self, unit: TestUnit, diagnostics: List[Diagnostic], owners: List[int]) -> List[RowIssue]:
+        """행 하나로 좁혀진 실패의 문제 (에러 줄을 찾지 못하면 행 전체 실패)"""
+        return self._issues([unit], diagnostics, owners) or \
+            [RowIssue(unit.row, unit.test_num, 'Test#', "테스트 함수 컴파일 실패")]
+
+    def run(self, units: List[TestUnit], groups: Optional[int] = None) -> List[RowIssue]:
+        """컴파일 실패 행 찾기
+
+        Args:
+            units: 진단 대상 테스트 행 (행 순서)
+            groups: 처음 나눌 묶음 수 (None 이면 병렬 작업 수)
+
+        Returns:
+            RowIssue 리스트 (행 순서, 헤더 자체가 컴파일되지 않으면 빈 리스트)
+        """
+        shutil.rmtree(self.diag_dir, ignore_errors=True)
+        self.diag_dir.mkdir(parents=True)
+        jobs = max(1, self.toolchain.jobs)
+        issues: Dict[int, List[RowIssue]] = {}
+
+        try:
+            if not self._compile([], self._next_name())[0]:
+                return []  # 스텁 헤더 문제는 특정 행 문제가 아님
+
+            n_groups = max(1, min(groups or jobs, len(units)))
+            size = -(-len(units) // n_groups)
+            # (검사할 묶음, 실패한 상위 묶음의 (묶음, 진단, 줄 소유 행)) - 처음 묶음은 상위 없음
+            pending = [(units[i:i + size], None) for i in range(0, len(units), size)]
+
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                while pending:
+                    names = [self._next_name() for _ in pending]
+                    results = list(executor.map(self._compile, [group for group, _ in pending], names))
+
+                    passed: Dict[int, int] = defaultdict(int)  # 상위 묶음별 통과한 절반 수
+                    parents = {}
+                    next_pending = []
+                    for (group, parent), (ok, diagnostics, owners) in zip(pending, results):
+                        if parent is not None:
+                            parents[id(parent)] = parent
+                        if ok:
+                            if parent is not None:
+                                passed[id(parent)] += 1
+                            continue
+                        if len(group) == 1:
+                            issues[group[0].row] = self._row_issues(group[0], diagnostics, owners)
+                            continue
+                        failed = (group, diagnostics, owners)
+                        half = len(group) // 2
+                        next_pending.extend([(group[:half], failed), (group[half:], failed)])
+
+                    # 두 절반이 모두 통과하면 행 사이 충돌 (예: 같은 Test# 함수 재정의) - 에러 줄 위치로 판정
+                    for key, count in passed.items():
+                        if count == 2:
+                            for issue in self._issues(*parents[key]):
+                                issues.setdefault(issue.row, []).append(issue)
+                    pending = next_pending
+
+            if not issues and len(units) > 1:
+                # 묶음마다 통과하면 묶음 사이 충돌 - 전체를 한 번에 검사하여 에러 줄 위치로 판정
+                ok, diagnostics, owners = self._compile(units, self._next_name())
+                if not ok:
+                    for issue in self._issues(units, diagnostics, owners):
+                        issues.setdefault(issue.row, []).append(issue)
+        finally:
+            shutil.rmtree(self.diag_dir, ignore_errors=True)
+
+        return [issue for row in sorted(issues) for issue in issues[row]]
@@ -0,0 +1,157 @@
+import re
+import json
+import time
+import hashlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import List, Optional
+from Lib.commons import CHECK_CACHE_PATH
+from Lib.resultStore import hash_file
+from Lib.toolchain import Toolchain
+
+# 상수 정의
+SYNTAX_ONLY_FLAG = '-fsyntax-only'
+HEADER_SUFFIXES = ('.h',)
+CHECK_SUFFIX = '.json'
+DIAGNOSTIC_PATTERN = re.compile(
+    r"^(?P<file>.+?):(?P<line>\d+):(?:(?P<column>\d+):)?\s*(?P<severity>fatal error|error|warning|note):\s*(?P<message>.*)$")
+
+
+@dataclass
+class Diagnostic:
+    """컴파일러 진단 메시지 하나"""
+    file: str
+    line: int
+    column: Optional[int]
+    severity: str
+    message: str
+
+
+@dataclass
+class FileVerdict:
+    """소스 파일 하나의 컴파일 적합성 결과
+
+    Attributes:
+        source: 소스 파일 이름
+        ok: 에러 없이 구문 검사 통과 여부
+        diagnostics: 진단 메시지 리스트
+        stderr: 컴파일러 원본 출력
+        seconds: 검사 소요 시간 (캐시 적중이면 원래 검사 시간)
+        cached: 캐시 적중 여부
+    """
+    source: str
+    ok: bool
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+    stderr: str = ''
+    seconds: float = 0.0
+    cached: bool = False
+
+    @property
+    def errors(self) -> List[Diagnostic]:
+        """에러 진단만"""
+        return [d for d in self.diagnostics if d.severity in ('error', 'fatal error')]
+
+
+@dataclass
+class CheckReport:
+    """업로드 소스 전체 컴파일 적합성 결과"""
+    verdicts: List[FileVerdict] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(verdict.ok for verdict in self.verdicts)
+
+    @property
+    def n_cached(self) -> int:
+        return sum(verdict.cached for verdict in self.verdicts)
+
+
+def parse_diagnostics(stderr: str) -> List[Diagnostic]:
+    """gcc/clang 출력에서 진단 메시지 추출 ('파일:행:열: error: 메시지' 형식 줄만)"""
+    diagnostics = []
+    for line in stderr.splitlines():
+        match = DIAGNOSTIC_PATTERN.match(line.strip())
+        if match:
+            column = match.group('column')
+            diagnostics.append(Diagnostic(match.group('file'), int(match.group('line')),
+                                          int(column) if column else None,
+                                          match.group('severity'), match.group('message')))
+    return diagnostics
+
+
+def _headers_hash(src_dir: Path) -> str:
+    """폴더 내 헤더 파일 전체 해시 (헤더가 바뀌면 모든 소스 재검사)"""
+    digest = hashlib.sha1()
+    for header in sorted(f for f in src_dir.iterdir() if f.suffix.lower() in HEADER_SUFFIXES):
+        digest.update(f"{header.name}:{hash_file(header)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _cache_key(toolchain: Toolchain, flags: List[str], source: str, source_hash: str, headers_hash: str) -> str:
+    """검사 결과 캐시 키 (컴파일러, 플래그, 파일 이름과 내용, 헤더 내용)"""
+    key = json.dumps([toolchain.compiler, flags, source, source_hash, headers_hash])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _load_verdict(cache_file: Path) -> Optional[FileVerdict]:
+    """캐시된 검사 결과 로드 (없거나 손상되면 None)"""
+    if not cache_file.is_file():
+        return None
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            data = json.load(f)
+        data['diagnostics'] = [Diagnostic(**d) for d in data['diagnostics']]
+        return FileVerdict(**{**data, 'cached': True})
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _check_file(toolchain: Toolchain, flags: List[str], src_dir: Path, source: str, cache_file: Path) -> FileVerdict:
+    """소스 파일 하나 구문 검사 (-fsyntax-only, 프로세스 작업 폴더는 바꾸지 않음)"""
+    verdict = _load_verdict(cache_file)
+    if verdict is not None:
+        return verdict
+
+    start = time.perf_counter()
+    command = [toolchain.compiler, *flags, SYNTAX_ONLY_FLAG, '-I', str(src_dir), source]
+    try:
+        proc = subprocess.run(command, cwd=src_dir, capture_output=True, text=True)
+        ok, stderr = proc.returncode == 0, proc.stderr
+    except OSError as e:
+        # 컴파일러 실행 실패는 소스 문제가 아니므로 캐시하지 않음
+        return FileVerdict(source, False, stderr=f"{toolchain.compiler} 실행 실패: {e}\n")
+
+    verdict = FileVerdict(source, ok, parse_diagnostics(stderr), stderr, time.perf_counter() - start)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump({k: v for k, v in asdict(verdict).items() if k != 'cached'}, f, ensure_ascii=False)
+    return verdict
+
+
+def check_sources(src_dir: Path, sources: List[str], toolchain: Toolchain) -> CheckReport:
+    """소스 파일별 컴파일 적합성 병렬 검사 (파일 내용 + 플래그 기준 결과 캐시)
+
+    링크 없이 파일마다 -fsyntax-only 로 검사하므로 파일 하나를 수정하면 그 파일만 다시
+    검사합니다. 헤더가 바뀌면 모든 소스를 다시 검사합니다.
+
+    Args:
+        src_dir: 소스/헤더 폴더 (업로드 폴더)
+        sources: 검사할 소스 파일 이름 리스트
+        toolchain: 컴파일러와 플래그
+
+    Returns:
+        CheckReport 객체 (sources 순서)
+    """
+    src_dir = Path(src_dir).resolve()
+    headers_hash = _headers_hash(src_dir)
+    flags = [flag for flag in toolchain.flags if flag != SYNTAX_ONLY_FLAG]
+    cache_files = [Path(CHECK_CACHE_PATH) / (_cache_key(toolchain, flags, source, hash_file(src_dir / source),
+                                                         headers_hash) + CHECK_SUFFIX)
+                   for source in sources]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(toolchain.jobs, len(sources)))) as executor:
+        verdicts = list(executor.map(_check_file, [toolchain] * len(sources), [flags] * len(sources),
+                                     [src_dir] * len(sources), sources, cache_files))
+    return CheckReport(verdicts)
@@ -0,0 +1,337 @@
+import io
+import copy
+import shutil
+import hashlib
+import threading
+import yaml
+import numpy as np
+import openpyxl
+import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from Lib.commons import LAST_TEST_CASE_FILE, TEST_CASE_FILE
+from Lib.resultStore import hash_file
+
+# 상수 정의
+KIND_YAML = 'yaml'
+KIND_TESTCASE = 'testcase'
+KIND_REPORT = 'report'
+KIND_ROWS = 'rows'
+KIND_HASH = 'hash'
+SHEET_HEADER_ROWS = 1  # 테스트 케이스 시트 헤더 행 수
+SHEET_SKIP_COLS = 1  # DataFrame 에서 제외한 시트 앞쪽 열 수
+TEST_NUM_TITLE = 'Test#'  # 테스트 케이스 시트 헤더
+SOURCE_TITLE = 'Source(소스파일)'
+FUNCTION_TITLE = 'Function(함수)'
+YAML_HEADER = "# To disable the code, add a semicolon at the beginning\n\n"
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class TestcaseRows:
+    """테스트 케이스 시트 행 (첫 번째 열 제외, 빈 행 제외)
+
+    Attributes:
+        header: 헤더 행
+        rows: 테스트 행 (헤더 열 수에 맞춘 튜플)
+        cell_hash: 정규화한 셀 값 해시 (다시 저장만 한 같은 내용의 파일 비교용)
+    """
+    header: Tuple
+    rows: List[Tuple]
+    cell_hash: str
+
+
+@dataclass
+class CacheStats:
+    """종류별 캐시 적중/실패 횟수"""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+# 프로세스 전체(모든 페이지/세션)에서 공유하는 캐시: (종류, 경로) → (파일 서명, 값)
+_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+_stats: Dict[str, CacheStats] = {kind: CacheStats() for kind in (KIND_YAML, KIND_TESTCASE, KIND_REPORT,
+                                                                    KIND_ROWS, KIND_HASH)}
+_lock = threading.Lock()
+
+
+def file_signature(path: PathLike) -> Optional[Tuple[int, int]]:
+    """캐시 키용 파일 서명 (수정 시각 ns, 크기), 파일이 없으면 None"""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_key(kind: str, path: PathLike) -> Tuple[str, str]:
+    return kind, str(Path(path).resolve())
+
+
+def _cached(kind: str, path: PathLike, loader: Callable[[Path], Any]) -> Any:
+    """파일 서명이 같으면 캐시 값을, 다르면 다시 로드한 값을 반환"""
+    key = _cache_key(kind, path)
+    signature = file_signature(path)
+    if signature is None:
+        raise FileNotFoundError(f"파일이 없습니다: {path}")
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == signature:
+            _stats[kind].hits += 1
+            return entry[1]
+        _stats[kind].misses += 1
+
+    value = loader(Path(path))
+    with _lock:
+        _cache[key] = (signature, value)
+    return value
+
+
+def _peek(kind: str, path: PathLike) -> Optional[Any]:
+    """파일 서명이 같은 캐시 값 (없으면 로드하지 않고 None)"""
+    signature = file_signature(path)
+    with _lock:
+        entry = _cache.get(_cache_key(kind, path))
+        if signature is None or entry is None or entry[0] != signature:
+            return None
+        _stats[kind].hits += 1
+        return entry[1]
+
+
+def load_yaml(path: PathLike) -> Dict[str, Any]:
+    """설정 YAML 로드 (캐시, 호출자가 수정해도 되도록 복사본 반환)"""
+    def _load(file_path: Path) -> Dict[str, Any]:
+        with open(file_path, encoding='utf-8-sig') as f:
+            return yaml.load(f, Loader=yaml.SafeLoader) or {}
+
+    return copy.deepcopy(_cached(KIND_YAML, path, _load))
+
+
+def save_yaml(path: PathLike, data: Dict[str, Any], header: str = YAML_HEADER) -> None:
+    """설정 YAML 저장 후 캐시 무효화"""
+    with open(path, 'w') as file:
+        file.write(header)
+        yaml.dump(data, file, default_flow_style=False, sort_keys=False)
+    invalidate(path)
+
+
+def load_testcase(path: PathLike = TEST_CASE_FILE) -> pd.DataFrame:
+    """테스트 케이스 시트 DataFrame 로드 (첫 번째 열 제외, 캐시, 복사본 반환)"""
+    return _cached(KIND_TESTCASE, path,
+                   lambda file_path: pd.read_excel(file_path, engine='openpyxl').iloc[:, SHEET_SKIP_COLS:]).copy()
+
+
+def _prime(kind: str, path: PathLike, value: Any) -> None:
+    """방금 쓴 파일의 파싱 결과를 캐시에 등록 (다음 로드에서 다시 파싱하지 않음)"""
+    signature = file_signature(path)
+    if signature is not None:
+        with _lock:
+            _cache[_cache_key(kind, path)] = (signature, value)
+
+
+def normalize_cell(val: Any) -> str:
+    """해시용 셀 값 문자열 (openpyxl / pandas 로드 결과가 같도록 정규화)"""
+    if val is None or (isinstance(val, float) and np.isnan(val)):
+        return ''
+    if isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    return str(val)
+
+
+def cells_hash(rows: Iterable[Sequence]) -> str:
+    """정규화한 셀 값 해시 (행 끝의 빈 셀 무시)"""
+    sha1 = hashlib.sha1()
+    for row in rows:
+        cells = [normalize_cell(val) for val in row]
+        while cells and not cells[-1]:
+            cells.pop()
+        sha1.update('\x1f'.join(cells).encode('utf-8') + b'\x1e')
+    return sha1.hexdigest()
+
+
+def _iter_sheet(wb: openpyxl.Workbook) -> Iterator[Tuple]:
+    """read-only 워크북 시트 행 순회 (헤더 행 먼저, 첫 번째 열 제외, 빈 행 제외, 끝나면 워크북 닫음)"""
+    try:
+        sheet_rows = wb.active.iter_rows(values_only=True)
+        first = next(sheet_rows, ())
+        width = len(first)  # 헤더 열 수
+        yield tuple(first[SHEET_SKIP_COLS:width])
+        for row in sheet_rows:
+            values = tuple(row[SHEET_SKIP_COLS:width])
+            values += (None,) * (width - SHEET_SKIP_COLS - len(values))
+            if all(val is None for val in values):
+                continue  # 빈 행
+            yield values
+    finally:
+        wb.close()
+
+
+def read_testcase_rows(source: Union[PathLike, BinaryIO]) -> TestcaseRows:
+    """테스트 케이스 시트 행 파싱 (openpyxl read-only, 첫 번째 열 제외, 빈 행 제외)"""
+    header, *rows = _iter_sheet(openpyxl.load_workbook(source, read_only=True, data_only=True))
+    return TestcaseRows(header, rows, cells_hash([header] + rows))
+
+
+def load_testcase_rows(path: PathLike = TEST_CASE_FILE) -> TestcaseRows:
+    """테스트 케이스 시트 행 로드 (캐시, 테스트 생성과 업로드 비교에서 공유, 수정 금지)"""
+    return _cached(KIND_ROWS, path, read_testcase_rows)
+
+
+def iter_testcase_rows(path: PathLike = TEST_CASE_FILE) -> Iterator[Tuple]:
+    """테스트 케이스 시트 행 순회 (첫 번째 열 제외, 빈 행 제외)
+
+    업로드 등으로 같은 파일의 파싱 결과가 이미 캐시에 있으면 그 행을 공유하고, 없으면
+    전체 행을 메모리에 올리지 않도록 openpyxl read-only 로 한 행씩 읽습니다 (캐시하지 않음).
+    """
+    cached = _peek(KIND_ROWS, path)
+    if cached is not None:
+        return iter(cached.rows)
+    rows = _iter_sheet(openpyxl.load_workbook(path, read_only=True, data_only=True))
+    next(rows)  # 헤더 행
+    return rows
+
+
+def file_hash(path: PathLike) -> Optional[str]:
+    """파일 내용 sha1 (캐시)"""
+    return _cached(KIND_HASH, path, hash_file)
+
+
+def upload_testcase(data: bytes, path: PathLike = TEST_CASE_FILE,
+                    backup: Optional[PathLike] = LAST_TEST_CASE_FILE) -> Optional[pd.DataFrame]:
+    """업로드한 테스트 케이스 적용 (변경이 없으면 파일을 건드리지 않음)
+
+    파일 내용 해시가 같으면 파싱 없이 변경 없음으로 판단하고, 다르면 셀 값 해시로
+    다시 저장만 한 같은 내용인지 확인합니다. 변경된 경우 파싱 결과를 캐시에 등록하여
+    이어지는 테스트 실행이 다시 파싱하지 않도록 합니다.
+
+    Args:
+        data: 업로드 파일 내용
+        path: 테스트 케이스 파일
+        backup: 교체 전 백업 파일 (None 이면 백업하지 않음)
+
+    Returns:
+        새 테스트 케이스 DataFrame 또는 변경이 없으면 None
+    """
+    exists = file_signature(path) is not None
+    if exists and hashlib.sha1(data).hexdigest() == file_hash(path):
+        return None
+
+    new_rows = read_testcase_rows(io.BytesIO(data))
+    if exists and new_rows.cell_hash == load_testcase_rows(path).cell_hash:
+        return None
+
+    df_new = pd.read_excel(io.BytesIO(data), engine='openpyxl').iloc[:, SHEET_SKIP_COLS:]
+    if exists and backup is not None:
+        shutil.copyfile(path, backup)
+        invalidate(backup)
+    with open(path, mode='wb') as f:
+        f.write(data)
+    invalidate(path)
+    _prime(KIND_ROWS, path, new_rows)
+    _prime(KIND_TESTCASE, path, df_new)
+    _prime(KIND_HASH, path, hashlib.sha1(data).hexdigest())
+    return df_new.copy()
+
+
+def changed_cells(df_before: pd.DataFrame, df_after: pd.DataFrame) -> List[Tuple[int, int, Any]]:
+    """두 DataFrame 의 다른 셀 목록 (행 위치, 열 위치, 새 값), NaN 끼리는 같은 값으로 취급
+
+    df_after 가 더 길면 추가된 행을 전부, 더 짧으면 사라진 행을 빈 값으로 포함합니다.
+    """
+    before = df_before.to_numpy(dtype=object)
+    after = df_after.to_numpy(dtype=object)
+    n_rows, n_cols = max(len(before), len(after)), max(before.shape[1], after.shape[1])
+    before = _pad(before, n_rows, n_cols)
+    after = _pad(after, n_rows, n_cols)
+
+    missing = pd.isna(after)
+    changed = ~((before == after) | (pd.isna(before) & missing))
+    return [(row, col, None if missing[row, col] else _to_cell(after[row, col])) for row, col in np.argwhere(changed)]
+
+
+def _pad(values: np.ndarray, n_rows: int, n_cols: int) -> np.ndarray:
+    """빈 값(None)으로 채워 크기 맞추기"""
+    padded = np.full((n_rows, n_cols), None, dtype=object)
+    padded[:values.shape[0], :values.shape[1]] = values
+    return padded
+
+
+def _to_cell(val: Any) -> Any:
+    """numpy 스칼라를 openpyxl 셀 값으로 변환"""
+    return val.item() if isinstance(val, np.generic) else val
+
+
+def save_testcase(df_before: pd.DataFrame, df_after: pd.DataFrame, path: PathLike = TEST_CASE_FILE,
+                  backup: Optional[PathLike] = LAST_TEST_CASE_FILE) -> int:
+    """테스트 케이스 편집 내용 저장 (바뀐 셀만 기록, 서식 유지, 한 번만 저장)
+
+    Args:
+        df_before: 편집 전 DataFrame (load_testcase 결과)
+        df_after: 편집 후 DataFrame
+        path: 테스트 케이스 파일
+        backup: 저장 전 백업 파일 (None 이면 백업하지 않음)
+
+    Returns:
+        기록한 셀 수 (0 이면 파일을 건드리지 않음)
+    """
+    changes = changed_cells(df_before, df_after)
+    if not changes:
+        return 0
+
+    if backup is not None:
+        shutil.copyfile(path, backup)
+        invalidate(backup)
+
+    wb = openpyxl.load_workbook(path)
+    try:
+        ws = wb.active
+        for row, col, val in changes:
+            ws.cell(row=row + SHEET_HEADER_ROWS + 1, column=col + SHEET_SKIP_COLS + 1).value = val
+        wb.save(path)
+    finally:
+        wb.close()
+    invalidate(path)
+    return len(changes)
+
+
+def load_report(path: PathLike) -> pd.DataFrame:
+    """결과 보고서 xlsx 첫 시트를 문자열 DataFrame 으로 로드 (캐시, 복사본 반환)"""
+    return _cached(KIND_REPORT, path,
+                   lambda file_path: pd.read_excel(file_path, engine='openpyxl', dtype=str)).copy()
+
+
+def invalidate(path: Optional[PathLike] = None) -> None:
+    """캐시 무효화 (앱이 파일을 쓴 직후 호출, path 가 없으면 전체)"""
+    with _lock:
+        if path is None:
+            keys = list(_cache)
+        else:
+            resolved = str(Path(path).resolve())
+            keys = [key for key in _cache if key[1] == resolved]
+        for key in keys:
+            _stats[key[0]].invalidations += 1
+            del _cache[key]
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """종류별 캐시 통계 (복사본)"""
+    with _lock:
+        return {kind: copy.copy(stats) for kind, stats in _stats.items()}
+
+
+def render_cache_stats() -> None:
+    """사이드바 디버그 영역에 캐시 적중/실패 횟수 표시"""
+    import streamlit as st  # 화면에서만 필요 (CLI 실행 시 streamlit 로드 방지)
+
+    with st.sidebar.expander("🐞 캐시 통계"):
+        stats = cache_stats()
+        st.dataframe(pd.DataFrame({'kind': list(stats), 'hits': [s.hits for s in stats.values()],
+                                   'misses': [s.misses for s in stats.values()],
+                                   'invalidations': [s.invalidations for s in stats.values()]}),
+                     hide_index=True, use_container_width=True)
+        if st.button("캐시 비우기", key="clear_data_cache"):
+            invalidate()
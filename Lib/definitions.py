@@ -0,0 +1,80 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# 상수 정의
+DEFAULT_DEFINITIONS = ['OFF : 0', 'ON : 1', 'FALSE : 0', 'TRUE : 1', 'NULL_16 : 65535']
+DEFINITION_CACHE_SIZE = 256  # 캐시할 서로 다른 Note(정의 목록) 개수
+WORD_CHARS = r"A-Za-z0-9_"
+TOKEN_PATTERN = re.compile(rf"[{WORD_CHARS}]+")
+
+
+@dataclass(frozen=True)
+class DefinitionSet:
+    """컴파일된 정의 목록 (키 → 값 치환 엔진)
+
+    텍스트를 한 번만 훑으며 치환합니다. 키가 모두 식별자면 토큰 단위 딕셔너리 조회를,
+    공백/기호가 포함된 키가 있으면 키 전체를 묶은 정규식을 사용합니다.
+    키는 식별자 경계에서만 일치하므로 'ON : 1' 이 'MOTOR_ON_FLAG' 를 바꾸지 않습니다.
+
+    Attributes:
+        mapping: 키 → 치환 값 딕셔너리
+        pattern: 키 매칭 정규식 (키가 없으면 None)
+    """
+    mapping: Dict[str, str]
+    pattern: Optional[Pattern]
+
+    def apply(self, code_str: Optional[str]) -> str:
+        """정의 치환 (단일 패스)"""
+        if not code_str:
+            return ""
+        if self.pattern is None:
+            return code_str
+        return self.pattern.sub(lambda m: self.mapping.get(m.group(0), m.group(0)), code_str)
+
+
+def parse_definitions(note: Optional[str]) -> List[Tuple[str, str]]:
+    """Note 셀과 기본 정의에서 (키, 값) 리스트 생성 (Note 정의가 우선)"""
+    lines = [n for n in note.split('\n') if n] if note else []
+    pairs = []
+    for definition in lines + DEFAULT_DEFINITIONS:
+        if ':' in definition:
+            key, value = map(str.strip, definition.split(':', 1))
+            if key:
+                pairs.append((key, value))
+    return pairs
+
+
+def _build_pattern(keys: List[str]) -> Pattern:
+    """키 목록을 식별자 경계 정규식으로 컴파일 (긴 키 우선)"""
+    alternation = '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+    return re.compile(rf"(?<![{WORD_CHARS}])(?:{alternation})(?![{WORD_CHARS}])")
+
+
+@lru_cache(maxsize=DEFINITION_CACHE_SIZE)
+def compile_definitions(note: Optional[str]) -> DefinitionSet:
+    """Note 셀 내용으로 치환 엔진 생성 (같은 Note 를 공유하는 행은 캐시 재사용)
+
+    앞선 정의의 값에 뒤 정의의 키가 있으면 미리 치환해 두어, 정의를 순서대로
+    적용하던 방식과 같은 결과를 한 번의 치환으로 얻습니다.
+
+    Args:
+        note: 테스트 케이스의 Note 셀 (줄마다 "키 : 값")
+
+    Returns:
+        DefinitionSet 객체
+    """
+    mapping: Dict[str, str] = {}
+    for key, value in reversed(parse_definitions(note)):
+        # 뒤 정의부터 처리해 값에 포함된 이후 정의의 키를 미리 치환
+        value = TOKEN_PATTERN.sub(lambda m: mapping.get(m.group(0), m.group(0)), value)
+        mapping[key] = value  # 중복 키는 앞선 정의가 우선
+
+    if not mapping:
+        pattern = None
+    elif all(TOKEN_PATTERN.fullmatch(key) for key in mapping):
+        pattern = TOKEN_PATTERN
+    else:
+        pattern = _build_pattern(list(mapping))
+    return DefinitionSet(mapping, pattern)
@@ -0,0 +1,210 @@
+import json
+import numpy as np
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+from Lib.sweep import SweepExpectation
+
+# 상수 정의
+EXPECT_FILE = 'expect.npz'
+NO_POINT = -1  # 스윕 행이 아닌 예상값의 지점 번호
+
+LegacyExpect = Union[Dict[int, List[Tuple[str, str]]], SweepExpectation]
+
+
+class ExpectationError(Exception):
+    """예상값 테이블 관련 커스텀 예외"""
+    pass
+
+
+@dataclass(frozen=True)
+class ExpectationEntries:
+    """테스트 하나의 예상값 (테이블 구간, 기술 순서 유지)
+
+    Attributes:
+        cycles: 사이클 번호 배열 (255 = 마지막 행)
+        var_ids: 변수 id 배열
+        values: 예상값 배열
+        points: 스윕 지점 번호 배열 (스윕 행이 아니면 NO_POINT)
+        variables: 변수 id → 이름 리스트 (테이블 공용)
+    """
+    cycles: np.ndarray
+    var_ids: np.ndarray
+    values: np.ndarray
+    points: np.ndarray
+    variables: List[str]
+
+    def __len__(self) -> int:
+        return len(self.cycles)
+
+    def names(self) -> List[str]:
+        """항목별 변수 이름"""
+        return [self.variables[var_id] for var_id in self.var_ids.tolist()]
+
+    def select(self, mask: np.ndarray) -> 'ExpectationEntries':
+        """조건에 맞는 항목만 선택"""
+        return ExpectationEntries(self.cycles[mask], self.var_ids[mask], self.values[mask],
+                                  self.points[mask], self.variables)
+
+
+class ExpectationTable:
+    """전체 테스트의 예상값 컬럼형 테이블
+
+    테스트별 딕셔너리 대신 변수 이름을 id 로 바꾸어 두고 (테스트 인덱스, 사이클, 변수 id,
+    예상값, 스윕 지점) 정수 배열로 저장합니다. 항목은 테스트 순서로 저장되며 offsets 로
+    테스트별 구간을 찾습니다.
+
+    Attributes:
+        variables: 변수 id → 이름 리스트
+        offsets: 테스트별 항목 시작 위치 (길이: 테스트 수 + 1)
+        sweeps: 스윕 행의 (스윕 변수, 지점 값 리스트) (테스트 인덱스별)
+        rows: 재실행 대상 행 번호 (전체 실행이면 None)
+    """
+
+    def __init__(self, variables: List[str], test: np.ndarray, cycle: np.ndarray, var: np.ndarray,
+                 value: np.ndarray, point: np.ndarray, n_tests: int,
+                 sweeps: Optional[Dict[int, Tuple[str, List[int]]]] = None, rows: Optional[List[int]] = None):
+        self.variables = variables
+        self.test, self.cycle, self.var, self.value, self.point = test, cycle, var, value, point
+        self.offsets: np.ndarray = np.searchsorted(test, np.arange(n_tests + 1))
+        self.sweeps: Dict[int, Tuple[str, List[int]]] = sweeps or {}
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """배열 메모리 사용량 (바이트)"""
+        return sum(arr.nbytes for arr in (self.test, self.cycle, self.var, self.value, self.point, self.offsets))
+
+    def entries(self, index: int) -> ExpectationEntries:
+        """테스트 하나의 예상값 구간"""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return ExpectationEntries(self.cycle[start:end], self.var[start:end], self.value[start:end],
+                                  self.point[start:end], self.variables)
+
+    def get_sweep(self, index: int) -> Optional[Tuple[str, List[int]]]:
+        """스윕 행이면 (스윕 변수, 지점 값 리스트), 아니면 None"""
+        return self.sweeps.get(index)
+
+    def legacy(self) -> 'ExpectationView':
+        """기존 형식(테스트별 딕셔너리) 읽기 전용 보기"""
+        return ExpectationView(self)
+
+    def to_legacy(self, index: int) -> LegacyExpect:
+        """테스트 하나를 기존 형식으로 변환 (사이클 → [(변수, 값 문자열)])"""
+        entries = self.entries(index)
+        sweep = self.get_sweep(index)
+        expects: List[Dict[int, List[Tuple[str, str]]]] = [{} for _ in (sweep[1] if sweep else [None])]
+        for cycle, name, value, point in zip(entries.cycles.tolist(), entries.names(),
+                                             entries.values.tolist(), entries.points.tolist()):
+            expects[max(point, 0)].setdefault(cycle, []).append((name, str(value)))
+
+        if sweep:
+            return SweepExpectation(sweep[0], list(sweep[1]), expects)
+        return expects[0]
+
+    def save(self, file_path: Path) -> None:
+        """npz 파일로 저장 (재생성 없이 재분석용)"""
+        meta = {'n_tests': len(self), 'rows': self.rows,
+                'sweeps': {str(index): [var, points] for index, (var, points) in self.sweeps.items()}}
+        np.savez_compressed(file_path, variables=np.array(self.variables, dtype=str), test=self.test,
+                            cycle=self.cycle, var=self.var, value=self.value, point=self.point,
+                            meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, file_path: Union[Path, BinaryIO]) -> 'ExpectationTable':
+        """npz 파일(또는 파일 객체)에서 로드
+
+        Raises:
+            ExpectationError: 파일이 없거나 형식이 잘못된 경우
+        """
+        if isinstance(file_path, (str, Path)) and not Path(file_path).is_file():
+            raise ExpectationError(f"저장된 예상값 파일이 없습니다: {file_path}")
+        try:
+            with np.load(file_path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                return cls(data['variables'].tolist(), data['test'], data['cycle'], data['var'],
+                           data['value'], data['point'], meta['n_tests'],
+                           {int(index): (var, points) for index, (var, points) in meta['sweeps'].items()},
+                           meta.get('rows'))
+        except (KeyError, ValueError) as e:
+            raise ExpectationError(f"예상값 파일 형식이 잘못되었습니다: {file_path}") from e
+
+    @classmethod
+    def from_legacy(cls, exp_res: Iterable[LegacyExpect], rows: Optional[List[int]] = None) -> 'ExpectationTable':
+        """기존 형식 예상값 리스트로 테이블 생성"""
+        builder = ExpectationBuilder()
+        for expect in exp_res:
+            builder.append(expect)
+        return builder.build(rows)
+
+
+class ExpectationView(Sequence):
+    """ExpectationTable 의 기존 형식 읽기 전용 보기 (접근 시마다 딕셔너리 생성)"""
+
+    def __init__(self, table: ExpectationTable):
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[LegacyExpect, List[LegacyExpect]]:
+        if isinstance(index, slice):
+            return [self.table.to_legacy(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.table.to_legacy(index)
+
+
+class ExpectationBuilder:
+    """생성 중인 테스트 예상값을 컬럼형 배열로 누적하는 클래스 (변수 이름 intern)"""
+
+    def __init__(self):
+        self._var_ids: Dict[str, int] = {}
+        self._test = array('i')
+        self._cycle = array('i')
+        self._var = array('i')
+        self._value = array('q')
+        self._point = array('i')
+        self._sweeps: Dict[int, Tuple[str, List[int]]] = {}
+        self._count = 0
+
+    def _intern(self, name: str) -> int:
+        """변수 이름 id"""
+        var_id = self._var_ids.get(name)
+        if var_id is None:
+            var_id = self._var_ids[name] = len(self._var_ids)
+        return var_id
+
+    def _append_dict(self, expect: Dict[int, List[Tuple[str, str]]], point: int) -> None:
+        """사이클별 예상값 딕셔너리 항목 추가"""
+        for cycle, exp_list in expect.items():
+            for var, value in exp_list:
+                self._test.append(self._count)
+                self._cycle.append(int(cycle))
+                self._var.append(self._intern(var))
+                self._value.append(int(value))
+                self._point.append(point)
+
+    def append(self, expect: LegacyExpect) -> None:
+        """테스트 하나의 예상값 추가 (사이클 → [(변수, 값)] 또는 SweepExpectation)"""
+        if isinstance(expect, SweepExpectation):
+            self._sweeps[self._count] = (expect.variable, list(expect.points))
+            for point, exp_dict in enumerate(expect.expects):
+                self._append_dict(exp_dict, point)
+        else:
+            self._append_dict(expect, NO_POINT)
+        self._count += 1
+
+    def build(self, rows: Optional[List[int]] = None) -> ExpectationTable:
+        """numpy 배열 테이블 생성"""
+        return ExpectationTable(list(self._var_ids), np.array(self._test, dtype=np.int32),
+                                np.array(self._cycle, dtype=np.int32), np.array(self._var, dtype=np.int32),
+                                np.array(self._value, dtype=np.int64), np.array(self._point, dtype=np.int32),
+                                self._count, dict(self._sweeps), rows)
@@ -1,22 +1,43 @@
+import io
 import os
+import copy
 import time
 import re
 from collections import defaultdict
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Iterator, Optional, Set, TextIO, Tuple, Union
+from dataclasses import dataclass, replace
 from pathlib import Path
 import pandas as pd
 from Lib.stubFile import StubFile
-from Lib.commons import RESULT_PATH, STUB_PATH, TEST_CASE_FILE, copyfile_if_different, remove_leading_newlines
+from Lib.definitions import DefinitionSet, compile_definitions
+from Lib.expectations import ExpectationBuilder, ExpectationTable, ExpectationView, EXPECT_FILE
+from Lib.pchCache import PchCache, PCH_HEADER, PCH_WARNING_FLAG
+from Lib.sharedLib import SharedLibDriver, SharedLibError, find_unsupported
+from Lib.stimulus import (StimulusBlock, StimulusError, STIM_CACHE_SIZE, clear_stim_cache, load_stimulus,
+                           split_stimulus_inputs, write_stim_loader)
+from Lib.sweep import (SweepBlock, SweepError, SweepExpectation, SWEEP_POINT_VAR, SWEEP_STATE_CODE,
+                       SWEEP_STATE_HEADER, parse_sweep_expect, split_sweep_inputs, write_sweep_state)
+from Lib.toolchain import Toolchain, BuildMetrics, PROFILE_FAITHFUL, METRICS_SUFFIX
+from Lib.commons import (DEFAULT_CYCLE_NUMBER, RESULT_PATH, STUB_PATH, TEST_CASE_FILE, copyfile_if_different,
+                         remove_leading_newlines)
+from Lib.dataAccess import iter_testcase_rows, load_testcase
+from Lib.compileBisect import CompileBisector, TestUnit, code_columns
+from Lib.rowValidator import RowIssue, SEVERITY_WARNING, ValidationContext, save_symbols, validate_rows
 
 # Constants
 DRIVER_CODE = 'test_driver.c'
-DEFAULT_DEFINITIONS = ['OFF : 0', 'ON : 1', 'FALSE : 0', 'TRUE : 1', 'NULL_16 : 65535']
-DEFAULT_CYCLE_NUMBER = 255
+EXE_BACKEND = 'exe'
+SHARED_BACKEND = 'shared'
+PARALLEL_MIN_ROWS = 500  # 이 행 수 이상일 때 프로세스 풀에서 병렬 생성
+GENERATE_CHUNK_SIZE = 50  # 작업 프로세스 하나에 전달하는 행 수
+GENERATE_WINDOW_CHUNKS = 8  # 작업 프로세스당 한 번에 생성해 두는 청크 수 (메모리 상한)
 
 # Compiled regex patterns for better performance
 EXPECT_PATTERN = re.compile(r"(\d+)\)\s*(\w+)\s*=\s*(\d+)")
 VAR_VAL_PATTERN = re.compile(r"(\w+)\s*=\s*(\d+)")
+CYCLE_INPUT_PATTERN = re.compile(r"^(\d+)(?:\s*~\s*(\d+))?\s*\)\s*(.+)$")
 
 
 @dataclass
@@ -32,20 +53,103 @@ class TestCase:
     c_file: str
 
 
+@dataclass
+class TestProgram:
+    """공유 라이브러리 실행용 테스트 시퀀스 (드라이버 Test_NNN 함수 본문과 동일한 C 문장)"""
+    test_num: str
+    outputs: List[str]
+    statements: List[str]
+
+
+@dataclass
+class GeneratedTest:
+    """테스트 행 하나의 생성 결과"""
+    test_num: str
+    code: str
+    pre_body: str  # 이후 행의 Test_NNN() 사전 조건으로 삽입되는 본문
+    outputs: List[str]
+    expect: Union[Dict[int, List[Tuple[str, str]]], SweepExpectation]
+    statements: List[str]
+    stim_block: Optional[StimulusBlock] = None
+    sweep_block: Optional[SweepBlock] = None
+    pre_code: str = ''  # 함수 코드에 삽입된 사전 조건 코드 (컴파일 에러 행/컬럼 판정용)
+    func: str = ''  # 함수 호출 코드
+
+
 class GenSWTest(StubFile):
     def __init__(self, gcc_option: str, pjt: str, compil_option: str,
-                 source: List[str], header: List[str], testcase: str = TEST_CASE_FILE):
-        super().__init__(pjt=pjt, c_option=compil_option, source=source, header=header)
+                 source: List[str], header: List[str], testcase: str = TEST_CASE_FILE,
+                 rows: Optional[List[int]] = None, backend: str = EXE_BACKEND,
+                 compiler: str = 'gcc', profile: str = PROFILE_FAITHFUL):
+        metrics = BuildMetrics()
+        with metrics.phase('stub'):
+            super().__init__(pjt=pjt, c_option=compil_option, source=source, header=header)
         copyfile_if_different(testcase, TEST_CASE_FILE)
 
+        write_stim_loader(STUB_PATH)
+        clear_stim_cache(keep=STIM_CACHE_SIZE)  # 이번 실행에서 쓰는 테이블은 변환/사용 시 다시 갱신됨
         self.include: List[str] = self._get_header_files()
         self.time: str = time.strftime('%Y%m%d_%H%M%S', time.localtime())
-        self.df_test: pd.DataFrame = pd.DataFrame()
-        self.exp_result: List[Dict[int, List[str]]] = []
+        self._df_test: Optional[pd.DataFrame] = None
+        self._sheet_rows: Optional[List[Tuple]] = None  # 테스트 케이스 시트 행 (실행당 한 번 파싱)
+        self._dependencies: Optional[Tuple[List[str], List[List[int]]]] = None  # 행 검사 순회에서 수집
+        self.expect_table: ExpectationTable = ExpectationBuilder().build()  # 컬럼형 예상값 (선택된 행 순서)
+        self.rows: Optional[List[int]] = sorted(set(rows)) if rows else None  # 재실행 대상 행 (1부터 시작)
+        self.backend: str = backend
+        self.programs: List[TestProgram] = []
+        self.traces: Optional[List[pd.DataFrame]] = None  # 공유 라이브러리 실행 결과
+        self.fallback: Dict[int, str] = {}  # 공유 라이브러리로 해석할 수 없어 exe 로 실행한 행 (행 번호 → 사유)
+        self.stim_blocks: Dict[int, StimulusBlock] = {}  # 외부 자극 파일 루프 (행 인덱스별)
+        self.sweep_blocks: Dict[int, SweepBlock] = {}  # 스윕 지점 루프 (행 인덱스별)
+        self.toolchain: Toolchain = Toolchain.from_setting(gcc_option, compiler, profile)
+        self.metrics: BuildMetrics = metrics
+        self.built: bool = False  # 드라이버 컴파일 성공 여부
+        self.compile_issues: List[RowIssue] = []  # 컴파일 실패 원인 행
+        self.excluded: Dict[int, str] = {}  # 컴파일 에러로 제외한 행 (행 번호 → 에러 메시지)
+        self.units: List[TestUnit] = []  # 드라이버에 기록한 행별 테스트 함수 (컴파일 실패 원인 진단용)
+        self.warnings: List[RowIssue] = []  # 빌드를 막지 않는 행 검사 경고
+
+        save_symbols(self.dict_symbol)
+        with self.metrics.phase('validate'):
+            self.issues: List[RowIssue] = self._validate_rows()
+
+        self.status: bool = False
+        if self.issues:
+            self._write_issue_log()  # 컴파일 전 빠른 실패 (행/컬럼 단위 메시지)
+        else:
+            with self.metrics.phase('generate'):
+                self._create_driver_file()
+                self._save_expectations()
 
-        code = self._generate_test_code()
-        self._create_driver_file(code)
-        self.status: bool = self._run_driver(gcc_option)
+            if self.backend == SHARED_BACKEND:
+                self.status = self._run_shared_library()
+            else:
+                self.status = self._run_driver()
+                if not self.status and not self.built:
+                    self.status = self._exclude_compile_errors()
+
+        self.metrics.save(Path(RESULT_PATH) / f"{self.time}{METRICS_SUFFIX}")
+
+    def _validate_rows(self) -> List[RowIssue]:
+        """테스트 코드 생성 전 행 검사 (재실행이면 대상 행만, 경고는 self.warnings 에 기록하고 알림만)
+
+        공유 라이브러리 백엔드에서 심볼 테이블에 없는 변수를 사용하는 행은 exe 로 실행합니다.
+        """
+        issues = validate_rows(self._scan_rows(),  # 의존성 스캔과 같은 순회에서 검사
+                               ValidationContext.from_symbols(self.dict_symbol, self.lst_source))
+        if self.rows is not None:
+            issues = [issue for issue in issues if issue.row in self.rows]
+        self.warnings = [issue for issue in issues if issue.severity == SEVERITY_WARNING]
+        for issue in self.warnings:
+            print(f"Warning: row {issue.row} (Test_{issue.test_num}) [{issue.column}]: {issue.message}")
+        return [issue for issue in issues if issue.severity != SEVERITY_WARNING]
+
+    def _write_issue_log(self) -> None:
+        """행 검사 결과를 에러 로그에 기록"""
+        lines = [f"row {issue.row} (Test_{issue.test_num}) [{issue.column}]: {issue.message}" for issue in self.issues]
+        print('\n'.join(f"Error: {line}" for line in lines))
+        with open(Path(STUB_PATH) / self.toolchain.error_log, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
 
     def _get_header_files(self) -> List[str]:
         """헤더 파일 목록 생성"""
@@ -55,42 +159,105 @@ class GenSWTest(StubFile):
             print(f"Warning: Could not read stub directory: {e}")
             return []
 
-    def _run_driver(self, gcc_option: str) -> bool:
-        """테스트 드라이버 실행"""
+    def _run_driver(self) -> bool:
+        """테스트 드라이버 빌드 및 실행"""
         result_time_path = Path(RESULT_PATH) / self.time
         result_time_path.mkdir(parents=True, exist_ok=True)
 
-        current_dir = Path.cwd()
-        stub_dir = current_dir / "data" / "stub"
+        stub_dir = Path(STUB_PATH)
+        sources = sorted(f.name for f in stub_dir.glob('*.c'))
 
         try:
-            os.chdir(stub_dir)
-            os.system(f"gcc {gcc_option}")
-
-            # exe 파일 확인 및 실행
-            test_exe = next((cmd for cmd in gcc_option.split() if cmd.endswith('.exe')), None)
-
-            if test_exe and Path(test_exe).is_file():
-                os.system(test_exe)
-                return True
+            pch = PchCache(self.include, self.toolchain.flags, self.toolchain.compiler, stub_dir)
+            use_pch = False
+            if self.toolchain.supports_pch:
+                with self.metrics.phase('pch'):
+                    use_pch = pch.prepare()
+
+            toolchain = replace(self.toolchain, flags=self.toolchain.flags + [PCH_WARNING_FLAG]) \
+                if use_pch else self.toolchain
+            built = toolchain.build(stub_dir, sources, self.metrics)
+
+            if use_pch and not built:
+                # PCH 로 인한 실패 가능성 배제를 위해 헤더 원문으로 재컴파일
+                print("Warning: PCH 사용 컴파일 실패, 헤더 원문으로 재컴파일합니다")
+                pch.discard()
+                built = self.toolchain.build(stub_dir, sources, self.metrics)
+
+            self.built = built
+            if built:
+                return self.toolchain.run(stub_dir, self.metrics)
 
         except Exception as e:
             print(f"Error running driver: {e}")
-        finally:
-            os.chdir(current_dir)
 
         return False
 
-    def _load_test_data(self) -> List[TestCase]:
-        """테스트 데이터 로드 및 파싱"""
-        try:
-            self.df_test = pd.read_excel(TEST_CASE_FILE, engine='openpyxl').iloc[:, 1:]
-        except Exception as e:
-            raise RuntimeError(f"Failed to load test case file: {e}")
+    def _exclude_compile_errors(self) -> bool:
+        """드라이버 컴파일 실패 시 원인 행을 찾아 제외하고 나머지 행만 다시 빌드 및 실행
+
+        행별 테스트 함수를 묶음 단위로 병렬 구문 검사하며 실패한 묶음만 반으로 나누어
+        원인 행을 찾습니다. 원인 행을 찾지 못하면 (스텁 소스 에러 등) 실패로 둡니다.
+        """
+        with self.metrics.phase('diagnose'):
+            units = self.units  # 드라이버 생성 시 기록한 코드 재사용 (다시 생성하지 않음)
+            self.compile_issues = CompileBisector(self.toolchain, Path(STUB_PATH)).run(units)
+        if not self.compile_issues:
+            return False
+
+        for issue in self.compile_issues:
+            print(f"Error: row {issue.row} (Test_{issue.test_num}) [{issue.column}]: {issue.message}")
+            self.excluded.setdefault(issue.row, f"[{issue.column}] {issue.message}")
+        kept = [unit.row for unit in units if unit.row not in self.excluded]
+        if not kept:
+            return False
+
+        print(f"Warning: 컴파일 에러 행 {len(self.excluded)}개를 제외하고 {len(kept)}개 행을 다시 빌드합니다")
+        self.rows = kept
+        self.stim_blocks, self.sweep_blocks = {}, {}
+        with self.metrics.phase('generate'):
+            self._create_driver_file()
+            self._save_expectations()
+        return self._run_driver()
+
+    def _run_shared_library(self) -> bool:
+        """공유 라이브러리로 테스트 시퀀스 직접 실행 (해석할 수 없는 행은 exe 드라이버로 실행)"""
+        result_time_path = Path(RESULT_PATH) / self.time
+        result_time_path.mkdir(parents=True, exist_ok=True)
 
-        test_cases = []
-        for unit_test in self.df_test.values:
-            test_case = TestCase(
+        if self.programs:
+            try:
+                driver = SharedLibDriver(self.include, self.dict_symbol, self.toolchain, self.metrics)
+                with self.metrics.phase('run'):
+                    self.traces = driver.run(self.programs, result_time_path, self.stim_blocks, self.sweep_blocks)
+            except SharedLibError as e:
+                print(f"Error running shared library: {e}")
+                return False
+        if not self.fallback:
+            return True
+
+        for row, reason in self.fallback.items():
+            print(f"Warning: row {row} ({reason}): 공유 라이브러리로 해석할 수 없어 exe 백엔드로 실행합니다")
+        self.traces = None  # 두 백엔드의 결과 CSV 를 행 순서대로 분석
+        return self._run_driver()
+
+    def _iter_sheet_rows(self) -> Iterator[Tuple]:
+        """테스트 케이스 시트 행 단위 순회 (첫 번째 열 제외)
+
+        시트는 실행당 한 번만 읽어 (캐시된 파싱 결과가 있으면 공유) 행 검사, 의존성 스캔,
+        코드 생성이 같은 행 리스트를 사용합니다.
+        """
+        if self._sheet_rows is None:
+            try:
+                self._sheet_rows = list(iter_testcase_rows(TEST_CASE_FILE))
+            except Exception as e:
+                raise RuntimeError(f"Failed to load test case file: {e}")
+        return iter(self._sheet_rows)
+
+    def _iter_test_cases(self) -> Iterator[TestCase]:
+        """테스트 데이터 행 단위 파싱"""
+        for unit_test in self._iter_sheet_rows():
+            yield TestCase(
                 test_num=str(int(unit_test[0])).zfill(3),
                 funcs='' if pd.isna(unit_test[4]) else unit_test[4],
                 pre_condition=unit_test[6],
@@ -100,27 +267,21 @@ class GenSWTest(StubFile):
                 cycle=int(unit_test[5]),
                 c_file=unit_test[3]
             )
-            test_cases.append(test_case)
-
-        return test_cases
 
-    def _get_definitions(self, note: str) -> List[str]:
-        """정의 목록 생성"""
-        custom_definitions = [n for n in note.split('\n') if n] if note else []
-        return custom_definitions + DEFAULT_DEFINITIONS
+    @property
+    def df_test(self) -> pd.DataFrame:
+        """테스트 케이스 DataFrame (화면 표시용, 처음 접근 시 로드)"""
+        if self._df_test is None:
+            self._df_test = load_testcase(TEST_CASE_FILE)  # 테스트 케이스 페이지와 캐시 공유
+        return self._df_test
 
-    def _apply_definitions(self, code_str: Optional[str], definitions: List[str]) -> str:
-        """정의 적용"""
-        if not code_str:
-            return ""
+    def _get_definitions(self, note: str) -> DefinitionSet:
+        """정의 목록 생성 (같은 Note 를 공유하는 행은 컴파일된 정의를 재사용)"""
+        return compile_definitions(note or None)
 
-        result = code_str
-        for definition in definitions:
-            if ':' in definition:
-                key, value = map(str.strip, definition.split(':', 1))
-                result = result.replace(key, value)
-
-        return result
+    def _apply_definitions(self, code_str: Optional[str], definitions: DefinitionSet) -> str:
+        """정의 적용 (식별자 단위 단일 패스 치환)"""
+        return definitions.apply(code_str)
 
     def _parse_preconditions(self, pre_condition: Optional[str],
                              dict_test: Dict[str, str], c_file: str) -> List[str]:
@@ -224,6 +385,61 @@ class GenSWTest(StubFile):
 
         return lst_cond, lst_cond_for_pre
 
+    def _generate_stimulus_code(self, test_case: TestCase, index: int, stim_refs: List[str], inputs: str,
+                                func: str, lst_var: List[str]) -> Tuple[List[str], List[str], StimulusBlock]:
+        """외부 자극 파일 조건 코드 생성 (사이클 수와 무관한 크기의 루프)"""
+        try:
+            tables = [load_stimulus(ref) for ref in stim_refs]
+        except StimulusError as e:
+            raise RuntimeError(f"Test_{test_case.test_num}: {e}")
+
+        lst_single, cycle_inputs = [], []
+        for inp in inputs.split('\n'):
+            inp = inp.strip()
+            if not inp:
+                continue
+
+            match = CYCLE_INPUT_PATTERN.match(inp)
+            if match:
+                start, end, stmt = match.groups()
+                cycle_inputs.append((int(start), int(end or start), stmt.strip()))
+            else:
+                lst_single.append(f"    {inp};")
+
+        sub_symbol = ','.join(['%d'] * len(lst_var))
+        block = StimulusBlock(
+            block_id=index,
+            tables=tables,
+            cycles=test_case.cycle,
+            calls=[f.strip() for f in func.split('\n') if f.strip()],
+            cycle_inputs=cycle_inputs,
+            output=f"fprintf(fptr, \"{sub_symbol}\\n\", {', '.join(lst_var)});"
+        )
+
+        return lst_single + block.to_c(record=True), lst_single + block.to_c(record=False), block
+
+    def _generate_sweep_code(self, test_case: TestCase, index: int, sweep: Tuple[str, List[int]],
+                             inputs: str, expect: str, func: str) -> Tuple[List[str], SweepExpectation,
+                                                                          List[str], List[str], SweepBlock]:
+        """스윕 행 조건 코드 생성 (지점마다 상태 복원 후 입력/함수 호출을 반복하는 단일 루프)
+
+        Returns:
+            Tuple[출력 변수 리스트 (스윕 지점 컬럼 포함), 지점별 예상값, 조건 코드,
+                  사전 조건용 조건 코드, 스윕 루프]
+        """
+        variable, points = sweep
+        try:
+            expectation = parse_sweep_expect(expect, variable, points)
+        except SweepError as e:
+            raise RuntimeError(f"Test_{test_case.test_num}: {e}")
+
+        lst_var = [SWEEP_POINT_VAR] + expectation.variables
+        lst_cond, _ = self._generate_condition_code(replace(test_case, inputs=inputs),
+                                                    self._parse_inputs(inputs), func, lst_var)
+        block = SweepBlock(block_id=index, variable=variable, points=points, body=lst_cond)
+
+        return lst_var, expectation, block.to_c(record=True), block.to_c(record=False), block
+
     def _generate_function_code(self, test_case: TestCase, lst_var: List[str],
                                 pre_code: str, condition: str) -> str:
         """함수 코드 생성"""
@@ -240,32 +456,100 @@ Void Test_{test_case.test_num}()
     fclose(fptr);
 }}"""
 
-    def _generate_test_code(self) -> str:
-        """테스트 코드 생성"""
-        lst_code = ['#include <stdio.h>'] + [f'#include "{inc}"' for inc in self.include]
-        main_test = []
-        dict_test = {}
+    @staticmethod
+    def _get_precondition_tests(pre_condition: Optional[str]) -> List[str]:
+        """사전 조건에서 참조하는 Test_NNN 번호 목록"""
+        if not pre_condition or pd.isna(pre_condition):
+            return []
+
+        return [pre_cond.strip().replace('Test_', '').replace('()', '').zfill(3)
+                for pre_cond in pre_condition.split('\n') if 'Test' in pre_cond]
+
+    def _scan_rows(self) -> Iterator[Tuple]:
+        """시트 행을 순회하며 테스트 번호와 사전 조건 Test_NNN 참조 행 인덱스 수집 (행 검사와 같은 순회)
+
+        직렬 생성과 동일하게 각 참조는 앞선 행 중 가장 마지막 동일 번호 행을 가리키며,
+        뒤쪽 행이나 존재하지 않는 번호는 참조하지 않습니다 (빈 사전 조건). 테스트 번호나
+        사전 조건을 읽을 수 없는 행은 행 검사에서 에러로 보고되므로 빈 값으로 기록합니다.
+        """
+        test_nums, dependencies = [], []
+        latest: Dict[str, int] = {}
+
+        for index, unit_test in enumerate(self._iter_sheet_rows()):
+            try:
+                test_num = str(int(unit_test[0])).zfill(3)
+                refs = self._get_precondition_tests(unit_test[6])
+            except (TypeError, ValueError, AttributeError):
+                test_num, refs = '', []
+            test_nums.append(test_num)
+            dependencies.append([latest[num] for num in refs if num in latest])
+            latest[test_num] = index
+            yield unit_test
+
+        self._dependencies = (test_nums, dependencies)
+
+    def _scan_dependencies(self) -> Tuple[List[str], List[List[int]]]:
+        """테스트 번호와 사전 조건 Test_NNN 참조 행 인덱스 (행 검사 순회에서 수집한 결과 재사용)
+
+        Returns:
+            Tuple[행별 테스트 번호, 행별 참조 행 인덱스 리스트]
+        """
+        if self._dependencies is None:
+            for _ in self._scan_rows():
+                pass
+        return self._dependencies
+
+    def _collect_required_rows(self, dependencies: List[List[int]]) -> Set[int]:
+        """재실행 대상 행과 사전 조건으로 참조되는 선행 행 인덱스 수집 (0부터 시작)"""
+        if self.rows is None:
+            return set(range(len(dependencies)))
+
+        required = set()
+        stack = [row - 1 for row in self.rows]
+        while stack:
+            index = stack.pop()
+            if index in required:
+                continue
+            required.add(index)
+            stack.extend(dependencies[index])
 
-        test_cases = self._load_test_data()
+        return required
 
-        for test_case in test_cases:
-            # 함수 코드 포맷팅
-            func = '\n'.join([f"    {f.strip()};" for f in test_case.funcs.split('\n') if f.strip()])
+    def _generate_test(self, test_case: TestCase, dict_test: Dict[str, str], index: int) -> GeneratedTest:
+        """단일 테스트 행 코드 생성"""
+        # 함수 코드 포맷팅
+        func = '\n'.join([f"    {f.strip()};" for f in test_case.funcs.split('\n') if f.strip()])
 
-            # 정의 적용
-            definitions = self._get_definitions(test_case.note)
+        # 정의 적용
+        definitions = self._get_definitions(test_case.note)
 
-            # 사전 조건 처리
-            lst_pre = self._parse_preconditions(test_case.pre_condition, dict_test, test_case.c_file)
-            pre_code = remove_leading_newlines(lst_pre)
-            pre_code = self._apply_definitions(pre_code, definitions)
+        # 사전 조건 처리
+        lst_pre = self._parse_preconditions(test_case.pre_condition, dict_test, test_case.c_file)
+        pre_code = remove_leading_newlines(lst_pre)
+        pre_code = self._apply_definitions(pre_code, definitions)
 
-            # 입력 및 예상 결과 처리
-            inputs = self._apply_definitions(test_case.inputs, definitions)
-            expect = self._apply_definitions(test_case.expect, definitions)
+        # 입력 및 예상 결과 처리 (자극 파일 경로에는 정의를 적용하지 않음)
+        stim_refs, inputs = split_stimulus_inputs(test_case.inputs)
+        inputs = self._apply_definitions(inputs, definitions)
+        expect = self._apply_definitions(test_case.expect, definitions)
 
+        try:
+            sweep, inputs = split_sweep_inputs(inputs)
+        except SweepError as e:
+            raise RuntimeError(f"Test_{test_case.test_num}: {e}")
+
+        stim_block, sweep_block = None, None
+        if sweep:
+            if stim_refs:
+                raise RuntimeError(f"Test_{test_case.test_num}: 스윕 행에는 자극 파일을 사용할 수 없습니다")
+            lst_var, result, lst_cond, lst_cond_for_pre, sweep_block = self._generate_sweep_code(
+                test_case, index, sweep, inputs, expect, func)
+        elif stim_refs:
+            lst_var, result = self._parse_expected_results(expect)
+            lst_cond, lst_cond_for_pre, stim_block = self._generate_stimulus_code(
+                test_case, index, stim_refs, inputs, func, lst_var)
+        else:
             lst_var, result = self._parse_expected_results(expect)
-            self.exp_result.append(result)
 
             # 입력 처리
             lst_input = self._parse_inputs(inputs)
@@ -274,18 +558,146 @@ Void Test_{test_case.test_num}()
             lst_cond, lst_cond_for_pre = self._generate_condition_code(
                 test_case, lst_input, func, lst_var)
 
-            condition = '\n'.join(lst_cond)
-
-            # 함수 코드 생성
-            func_code_for_pre = '\n'.join(lst_cond_for_pre)
-            if pre_code:
-                func_code_for_pre = f"{pre_code}\n{func_code_for_pre}"
-
-            func_code = self._generate_function_code(test_case, lst_var, pre_code, condition)
-
-            lst_code.append(func_code)
-            main_test.append(f"    Test_{test_case.test_num}();")
-            dict_test[test_case.test_num] = func_code_for_pre
+        condition = '\n'.join(lst_cond)
+
+        # 함수 코드 생성
+        func_code_for_pre = '\n'.join(lst_cond_for_pre)
+        if pre_code:
+            func_code_for_pre = f"{pre_code}\n{func_code_for_pre}"
+
+        statements = []
+        if self.backend == SHARED_BACKEND:
+            statements = [line for line in pre_code.split('\n') if line.strip()] + lst_cond
+
+        return GeneratedTest(
+            test_num=test_case.test_num,
+            code=self._generate_function_code(test_case, lst_var, pre_code, condition),
+            pre_body=func_code_for_pre,
+            outputs=lst_var,
+            expect=result,
+            statements=statements,
+            stim_block=stim_block,
+            sweep_block=sweep_block,
+            pre_code=pre_code,
+            func=func
+        )
+
+    def _worker_copy(self) -> 'GenSWTest':
+        """병렬 생성 작업 프로세스에 전달할 생성기 사본 (실행 결과 상태 제외)"""
+        worker = copy.copy(self)
+        worker.programs, worker.stim_blocks, worker.sweep_blocks = [], {}, {}
+        worker._df_test, worker.traces = None, None
+        return worker
+
+    def _generate_window(self, executor: ProcessPoolExecutor, window: List[Tuple[int, TestCase]],
+                         dependencies: List[List[int]], test_nums: List[str],
+                         bodies: Dict[int, str], last_use: Dict[int, int]) -> Dict[int, GeneratedTest]:
+        """행 묶음을 사전 조건 의존 순서(DAG 단계)대로 병렬 생성
+
+        같은 단계의 행은 서로 참조하지 않으므로 동시에 생성하고, 각 행에는
+        참조하는 선행 행의 사전 조건 본문만 전달합니다.
+        """
+        pending = dict(window)
+        generated: Dict[int, GeneratedTest] = {}
+
+        while pending:
+            ready = [index for index in pending if not any(dep in pending for dep in dependencies[index])]
+            tasks = [(index, pending.pop(index), {test_nums[dep]: bodies[dep] for dep in dependencies[index]})
+                     for index in ready]
+            chunks = [tasks[i:i + GENERATE_CHUNK_SIZE] for i in range(0, len(tasks), GENERATE_CHUNK_SIZE)]
+
+            for results in executor.map(_generate_chunk, chunks):
+                for index, test in results:
+                    generated[index] = test
+                    if index in last_use:
+                        bodies[index] = test.pre_body
+
+        return generated
+
+    def _iter_generated_tests(self, required_rows: Set[int], dependencies: List[List[int]],
+                              test_nums: List[str]) -> Iterator[Tuple[int, GeneratedTest]]:
+        """필요한 행의 생성 결과를 행 순서대로 반환
+
+        사전 조건 본문은 이후 행에서 참조되는 동안만 유지하여 시트 크기와 관계없이
+        메모리 사용량을 제한합니다. 행 수가 PARALLEL_MIN_ROWS 이상이면 프로세스 풀에서
+        생성하며, 각 행은 직렬 생성과 같은 입력으로 생성되므로 결과 코드는 동일합니다.
+        """
+        # 참조되는 행의 마지막 참조 위치에서 사전 조건 본문 해제
+        last_use: Dict[int, int] = {}
+        for index in sorted(required_rows):
+            for dep in dependencies[index]:
+                last_use[dep] = index
+        release: Dict[int, List[int]] = defaultdict(list)
+        for dep, index in last_use.items():
+            release[index].append(dep)
+
+        bodies: Dict[int, str] = {}
+        cases = ((index, test_case) for index, test_case in enumerate(self._iter_test_cases())
+                 if index in required_rows)
+        jobs = self.toolchain.jobs if len(required_rows) >= PARALLEL_MIN_ROWS else 1
+
+        if jobs <= 1:
+            for index, test_case in cases:
+                dict_test = {test_nums[dep]: bodies[dep] for dep in dependencies[index]}
+                generated = self._generate_test(test_case, dict_test, index)
+                if index in last_use:
+                    bodies[index] = generated.pre_body
+                yield index, generated
+                for dep in release.pop(index, []):
+                    del bodies[dep]
+            return
+
+        window_size = jobs * GENERATE_CHUNK_SIZE * GENERATE_WINDOW_CHUNKS
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_generate_worker,
+                                 initargs=(self._worker_copy(),)) as executor:
+            while True:
+                window = list(islice(cases, window_size))
+                if not window:
+                    break
+
+                generated = self._generate_window(executor, window, dependencies, test_nums, bodies, last_use)
+                for index, _ in window:
+                    yield index, generated.pop(index)
+                    for dep in release.pop(index, []):
+                        del bodies[dep]
+
+    def _write_test_code(self, out: TextIO) -> None:
+        """테스트 코드를 생성되는 대로 기록"""
+        out.write(f'#include "{PCH_HEADER}"')  # 스텁 헤더 묶음 (미리 컴파일된 헤더 대상)
+        main_test = []
+        expectations = ExpectationBuilder()
+        self.units = []
+        self.fallback = {}
+        variables = {sym.name for symbols in self.dict_symbol.values() for sym in symbols}
+
+        test_nums, dependencies = self._scan_dependencies()
+        if self.rows is not None:
+            self.rows = [row for row in self.rows if 0 < row <= len(test_nums)]
+        required_rows = self._collect_required_rows(dependencies)
+        selected_rows = required_rows if self.rows is None else {row - 1 for row in self.rows}
+
+        for index, generated in self._iter_generated_tests(required_rows, dependencies, test_nums):
+            if generated.stim_block is not None:
+                self.stim_blocks[index] = generated.stim_block
+            if generated.sweep_block is not None:
+                self.sweep_blocks[index] = generated.sweep_block
+
+            if index in selected_rows:
+                expectations.append(generated.expect)
+                out.write(f"\n{generated.code}")
+                if self.backend == SHARED_BACKEND:
+                    reason = find_unsupported(generated.statements, generated.outputs, variables,
+                                              self.stim_blocks, self.sweep_blocks)
+                    if reason is None:
+                        self.programs.append(TestProgram(generated.test_num, generated.outputs,
+                                                         generated.statements))
+                        continue
+                    self.fallback[index + 1] = f"Test_{generated.test_num}: {reason}"
+                self.units.append(TestUnit(index + 1, generated.test_num, generated.code,
+                                           code_columns(generated.code, generated.pre_code, generated.func)))
+                main_test.append(f"    Test_{generated.test_num}();")  # exe 드라이버에서 실행할 행만 호출
+
+        self.expect_table = expectations.build(self.rows)
 
         # 메인 함수 생성
         main_code = f"""
@@ -295,22 +707,59 @@ int main(void)
     return 0;
 }}"""
 
-        lst_code.append(main_code)
-        return '\n'.join(lst_code)
+        out.write(f"\n{main_code}")
 
-    def _create_driver_file(self, code: str) -> None:
-        """드라이버 파일 생성"""
+    @property
+    def exp_result(self) -> ExpectationView:
+        """테스트별 예상값 (기존 딕셔너리 형식 읽기 전용 보기, expect_table 기반)"""
+        return self.expect_table.legacy()
+
+    def _save_expectations(self) -> None:
+        """예상값 테이블을 결과 폴더에 저장 (재생성 없이 재분석용)"""
+        result_time_path = Path(RESULT_PATH) / self.time
+        result_time_path.mkdir(parents=True, exist_ok=True)
+        self.expect_table.save(result_time_path / EXPECT_FILE)
+
+    def _generate_test_code(self) -> str:
+        """테스트 코드 생성"""
+        code = io.StringIO()
+        self._write_test_code(code)
+        return code.getvalue()
+
+    def _create_driver_file(self, code: Optional[str] = None) -> None:
+        """드라이버 파일 생성 (code 미지정 시 테스트 코드를 생성하며 기록)"""
         main_c = Path(STUB_PATH) / DRIVER_CODE
         try:
             with open(main_c, 'w', encoding='utf-8') as f:
-                f.write(code)
+                if code is None:
+                    self._write_test_code(f)
+                else:
+                    f.write(code)
+            self._write_sweep_state()
+            PchCache(self.include, self.toolchain.flags, stub_path=STUB_PATH).write_header()
         except IOError as e:
             raise RuntimeError(f"Failed to create driver file: {e}")
 
+    def _write_sweep_state(self) -> None:
+        """스윕 행이 있을 때만 스윕 상태 저장/복원 코드 생성 및 include (없으면 빌드에서 제외)"""
+        stub_path = Path(STUB_PATH)
+        if self.sweep_blocks:
+            write_sweep_state(stub_path, self.dict_symbol)
+            if SWEEP_STATE_HEADER not in self.include:
+                self.include.append(SWEEP_STATE_HEADER)
+        else:
+            for name in (SWEEP_STATE_CODE, SWEEP_STATE_HEADER):
+                (stub_path / name).unlink(missing_ok=True)
+            if SWEEP_STATE_HEADER in self.include:
+                self.include.remove(SWEEP_STATE_HEADER)
+
     # Deprecated methods for backward compatibility
     def run_driver(self, gcc_option: str) -> bool:
         """Deprecated: Use _run_driver instead"""
-        return self._run_driver(gcc_option)
+        # 새 경로와 같은 gcc_option 해석 (플래그, 실행 파일, 에러 로그), 컴파일러/프로파일/작업 수는 유지
+        self.toolchain = Toolchain.from_setting(gcc_option, self.toolchain.compiler, self.toolchain.profile,
+                                                self.toolchain.jobs)
+        return self._run_driver()
 
     def get_code(self) -> str:
         """Deprecated: Use _generate_test_code instead"""
@@ -319,3 +768,18 @@ int main(void)
     def create_file(self, code: str) -> None:
         """Deprecated: Use _create_driver_file instead"""
         self._create_driver_file(code)
+
+
+_WORKER_GENERATOR: Optional[GenSWTest] = None  # 병렬 생성 작업 프로세스의 생성기 사본
+
+
+def _init_generate_worker(generator: GenSWTest) -> None:
+    """병렬 생성 작업 프로세스 초기화"""
+    global _WORKER_GENERATOR
+    _WORKER_GENERATOR = generator
+
+
+def _generate_chunk(tasks: List[Tuple[int, TestCase, Dict[str, str]]]) -> List[Tuple[int, GeneratedTest]]:
+    """작업 프로세스에서 행 묶음 코드 생성 (행 인덱스, 테스트 케이스, 참조 사전 조건 본문)"""
+    return [(index, _WORKER_GENERATOR._generate_test(test_case, dict_test, index))
+            for index, test_case, dict_test in tasks]
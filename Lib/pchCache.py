@@ -0,0 +1,110 @@
+import os
+import shutil
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+from Lib.commons import STUB_PATH, PCH_PATH
+
+# 상수 정의
+PCH_HEADER = 'stub_headers.h'
+PCH_SUFFIX = '.gch'
+PCH_WARNING_FLAG = '-Winvalid-pch'
+PCH_CACHE_SIZE = 5  # 유지할 캐시 .gch 개수
+
+
+class PchCache:
+    """스텁 헤더 묶음의 미리 컴파일된 헤더(.gch) 생성 및 캐시 클래스
+
+    드라이버는 PCH_HEADER 하나만 include 하며, 헤더 내용과 컴파일 플래그의 해시로
+    캐시된 .gch 를 스텁 폴더에 배치합니다. gcc 는 호환되지 않는 .gch 를 무시하고
+    헤더 원문을 사용하므로 PCH 사용 여부와 관계없이 빌드 결과는 동일합니다.
+
+    Attributes:
+        header_path: 스텁 폴더의 PCH 대상 헤더 경로
+        gch_path: 스텁 폴더에 배치되는 .gch 경로
+    """
+
+    def __init__(self, include: List[str], flags: List[str], compiler: str = 'gcc',
+                 stub_path: Path = STUB_PATH):
+        """PchCache 클래스 초기화
+
+        Args:
+            include: 드라이버가 사용하는 헤더 파일 리스트
+            flags: 드라이버 컴파일 플래그 리스트 (.gch 는 동일 플래그에서만 사용됨)
+            compiler: 컴파일러 이름
+            stub_path: 스텁 코드 폴더
+        """
+        self.stub_path = Path(stub_path)
+        self.include = include
+        self.flags = flags
+        self.compiler = compiler
+        self.header_path: Path = self.stub_path / PCH_HEADER
+        self.gch_path: Path = self.stub_path / f"{PCH_HEADER}{PCH_SUFFIX}"
+
+    @staticmethod
+    def get_header_code(include: List[str]) -> str:
+        """PCH 대상 헤더 코드 (드라이버 include 묶음)"""
+        return '\n'.join(['#include <stdio.h>'] + [f'#include "{inc}"' for inc in include]) + '\n'
+
+    def _get_cache_key(self) -> str:
+        """헤더 내용과 컴파일 플래그 기반 캐시 키"""
+        digest = hashlib.sha1(' '.join([self.compiler, *self.flags]).encode('utf-8'))
+        for file in sorted(self.stub_path.glob('*.h')):
+            digest.update(file.name.encode('utf-8'))
+            digest.update(file.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def write_header(self) -> None:
+        """PCH 대상 헤더 파일 생성"""
+        with open(self.header_path, 'w', encoding='utf-8') as f:
+            f.write(self.get_header_code(self.include))
+
+    def prepare(self) -> bool:
+        """캐시된 .gch 를 스텁 폴더에 배치 (없으면 생성)
+
+        Returns:
+            .gch 배치 성공 여부
+        """
+        self.write_header()
+        cached_gch = Path(PCH_PATH) / f"{self._get_cache_key()}{PCH_SUFFIX}"
+
+        if not cached_gch.is_file():
+            cached_gch.parent.mkdir(parents=True, exist_ok=True)
+            command = [self.compiler, *self.flags, '-x', 'c-header', PCH_HEADER, '-o', str(cached_gch.resolve())]
+            try:
+                proc = subprocess.run(command, cwd=self.stub_path, capture_output=True, text=True)
+            except OSError as e:
+                print(f"Warning: PCH 생성 실패: {e}")
+                return False
+
+            if proc.returncode != 0 or not cached_gch.is_file():
+                print(f"Warning: PCH 생성 실패, 헤더 원문으로 컴파일합니다\n{proc.stderr}")
+                return False
+
+            clear_pch_cache(keep=PCH_CACHE_SIZE)
+        else:
+            os.utime(cached_gch)  # 최근 사용 시각 갱신
+
+        shutil.copyfile(cached_gch, self.gch_path)
+        return True
+
+    def discard(self) -> None:
+        """스텁 폴더의 .gch 제거 (헤더 원문으로 재컴파일 시)"""
+        if self.gch_path.exists():
+            os.remove(self.gch_path)
+
+
+def clear_pch_cache(keep: Optional[int] = None) -> None:
+    """캐시된 .gch 정리
+
+    Args:
+        keep: 최근 사용 순으로 유지할 개수 (None 이면 전부 삭제)
+    """
+    pch_path = Path(PCH_PATH)
+    if not pch_path.exists():
+        return
+
+    cached = sorted(pch_path.glob(f"*{PCH_SUFFIX}"), key=lambda f: f.stat().st_mtime, reverse=True)
+    for gch in cached[keep or 0:]:
+        os.remove(gch)
@@ -0,0 +1,302 @@
+import io
+import os
+import lzma
+import re
+import json
+import shutil
+import hashlib
+import pandas as pd
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+from Lib.commons import ARCHIVE_PATH, RESULT_PATH
+
+# 상수 정의
+ARCHIVE_SUFFIX = '.zip'
+MANIFEST_NAME = 'manifest.json'
+CHUNK_NAME = 'chunk_{index:04d}.xz'
+CHUNK_BYTES = 4 << 20  # xz 묶음 최대 원본 크기 (파일 하나를 읽을 때 압축 해제하는 최대 크기)
+XZ_PRESET = 6
+RUN_ID_PATTERN = re.compile(r"^\d{8}_\d{6}$")  # 결과 폴더명 (실행 시간)
+RUN_PREFIX_PATTERN = re.compile(r"^(\d{8}_\d{6})(?:/|_)")  # 결과 파일 경로의 실행 시간
+RUN_TIME_FORMAT = '%Y%m%d_%H%M%S'
+STORED_SUFFIXES = {'.xlsx', '.npz', '.zip'}  # 이미 압축된 형식은 재압축하지 않음
+MB = 1 << 20
+
+DEFAULT_RETENTION = {
+    'keep_runs': 20,  # 압축하지 않고 유지할 최근 실행 수
+    'archive_max_mb': 2048,  # 압축 보관 용량 한도 (초과 시 오래된 보관부터 삭제)
+    'archive_max_age_days': None,  # 압축 보관 기간 한도 (None: 제한 없음)
+}
+
+
+class ResultArchiveError(Exception):
+    """결과 압축 보관 관련 커스텀 예외"""
+    pass
+
+
+@dataclass
+class RetentionPolicy:
+    """결과 보관 정책 (setting.yaml 의 retention 항목)"""
+    keep_runs: int = DEFAULT_RETENTION['keep_runs']
+    archive_max_mb: Optional[float] = DEFAULT_RETENTION['archive_max_mb']
+    archive_max_age_days: Optional[float] = DEFAULT_RETENTION['archive_max_age_days']
+
+    @classmethod
+    def from_setting(cls, setting: Optional[Dict[str, Any]]) -> 'RetentionPolicy':
+        """설정 딕셔너리에서 정책 생성 (없는 항목은 기본값)"""
+        retention = {**DEFAULT_RETENTION, **((setting or {}).get('retention') or {})}
+        return cls(int(retention['keep_runs']), retention['archive_max_mb'], retention['archive_max_age_days'])
+
+
+@dataclass
+class ArchiveManifest:
+    """실행 하나의 압축 보관 목록
+
+    Attributes:
+        run_id: 실행 시간
+        archived_at: 보관 시각 (ISO)
+        files: 보관 파일 (RESULT_PATH 기준 경로 → 원본 크기/sha1/저장 항목/묶음 내 위치)
+        original_bytes: 원본 전체 크기
+    """
+    run_id: str
+    archived_at: str
+    files: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    original_bytes: int = 0
+
+
+@dataclass
+class RetentionReport:
+    """보관 정책 적용 결과"""
+    archived: List[str] = field(default_factory=list)
+    evicted: List[str] = field(default_factory=list)
+
+
+def _archive_file(run_id: str) -> Path:
+    """실행 보관 파일 경로"""
+    return Path(ARCHIVE_PATH) / f"{run_id}{ARCHIVE_SUFFIX}"
+
+
+def _run_files(run_id: str) -> List[Path]:
+    """실행에 속한 결과 파일 (결과 폴더 전체 + '<실행 시간>_' 로 시작하는 보고서/빌드 정보)"""
+    result_path = Path(RESULT_PATH)
+    files = sorted(f for f in (result_path / run_id).rglob('*') if f.is_file())
+    files += sorted(f for f in result_path.glob(f"{run_id}_*") if f.is_file())
+    return files
+
+
+def list_live_runs() -> List[str]:
+    """압축되지 않은 실행 목록 (오래된 순)"""
+    result_path = Path(RESULT_PATH)
+    if not result_path.exists():
+        return []
+    return sorted(f.name for f in result_path.iterdir() if f.is_dir() and RUN_ID_PATTERN.match(f.name))
+
+
+def list_archived_runs() -> List[str]:
+    """압축 보관된 실행 목록 (오래된 순)"""
+    archive_path = Path(ARCHIVE_PATH)
+    if not archive_path.exists():
+        return []
+    return sorted(f.name[:-len(ARCHIVE_SUFFIX)] for f in archive_path.glob(f"*{ARCHIVE_SUFFIX}"))
+
+
+def is_archived(run_id: str) -> bool:
+    """실행이 압축 보관되었는지 여부"""
+    return _archive_file(run_id).is_file()
+
+
+def archive_run(run_id: str) -> ArchiveManifest:
+    """실행 결과를 압축 보관 파일 하나로 묶고 원본 삭제
+
+    CSV 등은 최대 CHUNK_BYTES 단위 묶음으로 xz(LZMA) 압축하여 작은 파일이 많아도
+    압축률을 유지하고, 파일 하나를 읽을 때는 해당 묶음만 압축 해제합니다.
+    xlsx/npz 처럼 이미 압축된 파일은 그대로 저장합니다.
+
+    Args:
+        run_id: 실행 시간
+
+    Returns:
+        ArchiveManifest 객체
+
+    Raises:
+        ResultArchiveError: 보관할 파일이 없는 경우
+    """
+    files = _run_files(run_id)
+    if not files:
+        raise ResultArchiveError(f"보관할 결과 파일이 없습니다: {run_id}")
+
+    result_path = Path(RESULT_PATH)
+    manifest = ArchiveManifest(run_id, datetime.now().isoformat(timespec='seconds'))
+    archive_file = _archive_file(run_id)
+    archive_file.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_file = archive_file.with_suffix(f".{os.getpid()}.tmp")
+    with ZipFile(tmp_file, 'w', ZIP_STORED) as zf:
+        chunk: List[bytes] = []
+        chunk_size, chunk_index = 0, 0
+
+        def _flush() -> None:
+            nonlocal chunk, chunk_size, chunk_index
+            if chunk:
+                zf.writestr(CHUNK_NAME.format(index=chunk_index), lzma.compress(b''.join(chunk), preset=XZ_PRESET))
+                chunk, chunk_size, chunk_index = [], 0, chunk_index + 1
+
+        for file in files:
+            arcname = file.relative_to(result_path).as_posix()
+            data = file.read_bytes()
+            entry = {'size': len(data), 'sha1': hashlib.sha1(data).hexdigest()}
+            if file.suffix.lower() in STORED_SUFFIXES:
+                zf.writestr(arcname, data)
+                entry.update(member=arcname, offset=0)
+            else:
+                if chunk_size + len(data) > CHUNK_BYTES:
+                    _flush()
+                entry.update(member=CHUNK_NAME.format(index=chunk_index), offset=chunk_size)
+                chunk.append(data)
+                chunk_size += len(data)
+            manifest.files[arcname] = entry
+            manifest.original_bytes += len(data)
+        _flush()
+        zf.writestr(MANIFEST_NAME, json.dumps(asdict(manifest), ensure_ascii=False), compress_type=ZIP_DEFLATED)
+    os.replace(tmp_file, archive_file)
+
+    # 보관 파일이 완성된 뒤 원본 삭제
+    shutil.rmtree(result_path / run_id, ignore_errors=True)
+    for file in files:
+        file.unlink(missing_ok=True)
+    return manifest
+
+
+class RunArchive:
+    """압축 보관된 실행 읽기 (필요한 묶음만 압축 해제, 마지막 묶음 재사용)
+
+    Attributes:
+        run_id: 실행 시간
+        path: 보관 파일 경로
+    """
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.path = _archive_file(run_id)
+        if not self.path.is_file():
+            raise ResultArchiveError(f"압축 보관된 실행이 아닙니다: {run_id}")
+        self._manifest: Optional[ArchiveManifest] = None
+        self._chunk: Tuple[Optional[str], bytes] = (None, b'')
+
+    @property
+    def manifest(self) -> ArchiveManifest:
+        """보관 목록 (처음 접근 시 로드)"""
+        if self._manifest is None:
+            with ZipFile(self.path) as zf:
+                self._manifest = ArchiveManifest(**json.loads(zf.read(MANIFEST_NAME)))
+        return self._manifest
+
+    def names(self, suffix: str = '') -> List[str]:
+        """보관 파일 이름 목록 (RESULT_PATH 기준 경로)"""
+        return sorted(name for name in self.manifest.files if name.endswith(suffix))
+
+    def read_bytes(self, name: str) -> bytes:
+        """보관 파일 하나 읽기
+
+        Raises:
+            ResultArchiveError: 보관 목록에 없는 파일인 경우
+        """
+        entry = self.manifest.files.get(name)
+        if entry is None:
+            raise ResultArchiveError(f"보관 파일에 없습니다 ({self.run_id}): {name}")
+
+        member = entry['member']
+        if member != name:  # xz 묶음
+            if self._chunk[0] != member:
+                with ZipFile(self.path) as zf:
+                    self._chunk = (member, lzma.decompress(zf.read(member)))
+            return self._chunk[1][entry['offset']:entry['offset'] + entry['size']]
+        with ZipFile(self.path) as zf:
+            return zf.read(member)
+
+    def read_csv(self, name: str, **kwargs) -> pd.DataFrame:
+        """보관된 CSV 파일을 DataFrame 으로 읽기"""
+        return pd.read_csv(io.BytesIO(self.read_bytes(name)), **kwargs)
+
+    def restore(self) -> None:
+        """보관 파일을 결과 폴더로 복원하고 보관 파일 삭제"""
+        result_path = Path(RESULT_PATH)
+        for name in self.names():
+            file_path = result_path / name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(self.read_bytes(name))
+        self.path.unlink()
+
+
+def read_result_file(name: str) -> Optional[bytes]:
+    """결과 파일 읽기 (RESULT_PATH 기준 경로, 압축 보관된 실행이면 보관 파일에서 읽음)
+
+    Returns:
+        파일 내용 또는 결과 폴더와 보관 파일 모두 없으면 None
+    """
+    file_path = Path(RESULT_PATH) / name
+    if file_path.is_file():
+        return file_path.read_bytes()
+
+    match = RUN_PREFIX_PATTERN.match(name)
+    if match is None or not is_archived(match.group(1)):
+        return None
+    try:
+        return RunArchive(match.group(1)).read_bytes(name)
+    except ResultArchiveError:
+        return None
+
+
+def _run_time(run_id: str) -> Optional[datetime]:
+    """실행 시간 문자열을 datetime 으로 변환"""
+    try:
+        return datetime.strptime(run_id, RUN_TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def apply_retention(policy: RetentionPolicy) -> RetentionReport:
+    """보관 정책 적용
+
+    최근 keep_runs 개를 제외한 실행을 압축 보관하고, 보관 용량/기간 한도를 넘는
+    오래된 보관 파일을 삭제합니다. 결과 이력 저장소의 기록은 유지됩니다.
+
+    Args:
+        policy: 결과 보관 정책
+
+    Returns:
+        RetentionReport 객체 (보관/삭제된 실행 시간)
+    """
+    report = RetentionReport()
+    live_runs = list_live_runs()
+    for run_id in live_runs[:max(len(live_runs) - policy.keep_runs, 0)]:
+        try:
+            archive_run(run_id)
+            report.archived.append(run_id)
+        except (ResultArchiveError, OSError) as e:
+            print(f"Warning: 실행 결과 보관 실패 ({run_id}): {e}")
+
+    archived = list_archived_runs()
+    if policy.archive_max_age_days is not None:
+        limit = datetime.now() - timedelta(days=float(policy.archive_max_age_days))
+        for run_id in list(archived):
+            run_time = _run_time(run_id)
+            if run_time is not None and run_time < limit:
+                _archive_file(run_id).unlink(missing_ok=True)
+                archived.remove(run_id)
+                report.evicted.append(run_id)
+
+    if policy.archive_max_mb is not None:
+        sizes = {run_id: _archive_file(run_id).stat().st_size for run_id in archived}
+        total = sum(sizes.values())
+        for run_id in archived:  # 오래된 순으로 삭제
+            if total <= float(policy.archive_max_mb) * MB:
+                break
+            _archive_file(run_id).unlink(missing_ok=True)
+            total -= sizes[run_id]
+            report.evicted.append(run_id)
+
+    return report
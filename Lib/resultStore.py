@@ -0,0 +1,397 @@
+import sqlite3
+import hashlib
+import pandas as pd
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, astuple, fields
+from operator import attrgetter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+from Lib.commons import RESULT_DB
+
+# 상수 정의
+RUN_TIME_FORMAT = '%Y%m%d_%H%M%S'
+HASH_CHUNK_SIZE = 1 << 20
+PASS_RESULT = 'Pass'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    base_run TEXT,
+    report TEXT,
+    testcase_hash TEXT,
+    n_tests INTEGER NOT NULL,
+    n_fail INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    row_index INTEGER NOT NULL,
+    test_num TEXT NOT NULL,
+    function TEXT,
+    c_file TEXT,
+    result TEXT NOT NULL,
+    measured TEXT,
+    trace_path TEXT,
+    trace_hash TEXT,
+    row_hash TEXT,
+    source_hash TEXT,
+    PRIMARY KEY (run_id, row_index)
+);
+CREATE TABLE IF NOT EXISTS test_stats (
+    test_key TEXT PRIMARY KEY,
+    test_num TEXT NOT NULL,
+    function TEXT,
+    c_file TEXT,
+    n_runs INTEGER NOT NULL,
+    n_pass INTEGER NOT NULL,
+    flips INTEGER NOT NULL,
+    flaky_flips INTEGER NOT NULL,
+    first_run TEXT NOT NULL,
+    last_run TEXT NOT NULL,
+    last_result TEXT,
+    last_row_hash TEXT,
+    last_source_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_test ON results(test_num, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_function ON results(function);
+CREATE INDEX IF NOT EXISTS idx_results_c_file ON results(c_file);
+"""
+
+# 기존 데이터베이스에 추가할 컬럼 (테이블 → [(컬럼, 타입)])
+MIGRATIONS = {
+    'results': [('row_hash', 'TEXT'), ('source_hash', 'TEXT')],
+}
+
+
+class ResultStoreError(Exception):
+    """ResultStore 관련 커스텀 예외"""
+    pass
+
+
+@dataclass
+class RunRecord:
+    """테스트 실행 메타데이터 (runs 테이블 행)"""
+    run_id: str
+    created_at: str
+    base_run: Optional[str]
+    report: Optional[str]
+    testcase_hash: Optional[str]  # 테스트 케이스 파일 내용 sha1
+    n_tests: int
+    n_fail: int
+
+
+@dataclass
+class TestRecord:
+    """테스트 행 결과 (results 테이블 행)"""
+    row_index: int  # 테스트 케이스 행 번호 (1부터 시작)
+    test_num: str
+    function: Optional[str]
+    c_file: Optional[str]
+    result: str
+    measured: Optional[str]
+    trace_path: Optional[str]  # RESULT_PATH 기준 측정값 CSV 상대 경로
+    trace_hash: Optional[str]  # 측정값 CSV 내용 sha1
+    row_hash: Optional[str] = None  # 테스트 케이스 행 내용 sha1
+    source_hash: Optional[str] = None  # 테스트 대상 소스(stub) 파일 sha1
+
+
+@dataclass
+class TestStats:
+    """테스트별 누적 통계 (test_stats 테이블 행, 실행마다 증분 갱신)
+
+    Attributes:
+        flips: 직전 실행 대비 결과가 바뀐 횟수
+        flaky_flips: 행 내용과 소스가 그대로인데 결과가 바뀐 횟수
+    """
+    test_key: str
+    test_num: str
+    function: Optional[str]
+    c_file: Optional[str]
+    n_runs: int
+    n_pass: int
+    flips: int
+    flaky_flips: int
+    first_run: str
+    last_run: str
+    last_result: Optional[str]
+    last_row_hash: Optional[str]
+    last_source_hash: Optional[str]
+
+    @classmethod
+    def first(cls, test_key: str, run_id: str, test: TestRecord) -> 'TestStats':
+        """첫 실행 결과로 통계 생성"""
+        return cls(test_key, test.test_num, test.function, test.c_file, 1, int(test.result == PASS_RESULT),
+                   0, 0, run_id, run_id, test.result, test.row_hash, test.source_hash)
+
+    def update(self, run_id: str, test: TestRecord) -> None:
+        """다음 실행 결과 반영"""
+        if test.result != self.last_result:
+            self.flips += 1
+            unchanged = (test.row_hash is not None and test.row_hash == self.last_row_hash
+                         and test.source_hash is not None and test.source_hash == self.last_source_hash)
+            if unchanged:
+                self.flaky_flips += 1
+
+        self.function, self.c_file = test.function, test.c_file
+        self.n_runs += 1
+        self.n_pass += int(test.result == PASS_RESULT)
+        self.last_run, self.last_result = run_id, test.result
+        self.last_row_hash, self.last_source_hash = test.row_hash, test.source_hash
+
+
+RESULT_FIELDS = [f.name for f in fields(TestRecord)]
+STATS_FIELDS = [f.name for f in fields(TestStats)]
+_result_values = attrgetter(*RESULT_FIELDS)  # astuple 은 필드마다 deepcopy 하므로 대량 저장에 사용하지 않음
+_stats_values = attrgetter(*STATS_FIELDS)
+
+
+def test_keys(tests: List[TestRecord]) -> List[str]:
+    """실행 내 테스트 식별 키 (테스트 번호, 중복 번호는 두 번째부터 '#순번' 추가)"""
+    counts: Dict[str, int] = {}
+    keys = []
+    for test in tests:
+        occurrence = counts.get(test.test_num, 0)
+        counts[test.test_num] = occurrence + 1
+        keys.append(test.test_num if occurrence == 0 else f"{test.test_num}#{occurrence}")
+    return keys
+
+
+def run_signature(tests: List[TestRecord]) -> Optional[str]:
+    """중복 실행 판별용 서명 (행 내용, 소스, 결과, 측정값이 모두 같으면 같은 서명)
+
+    행 또는 소스 해시가 없는 테스트가 있으면 입력이 같은지 알 수 없으므로 None 을 반환합니다.
+    """
+    digest = hashlib.sha1()
+    for key, test in zip(test_keys(tests), tests):
+        if test.row_hash is None or test.source_hash is None:
+            return None
+        digest.update('\x1f'.join([key, test.result, test.trace_hash or '', test.row_hash,
+                                    test.source_hash]).encode('utf-8') + b'\x1e')
+    return digest.hexdigest()
+
+
+def hash_file(file_path: Path) -> Optional[str]:
+    """파일 내용 sha1 (파일이 없으면 None)"""
+    file_path = Path(file_path)
+    if not file_path.is_file():
+        return None
+
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_created_at(run_id: str) -> str:
+    """실행 시간 문자열(결과 폴더명)을 ISO 시각으로 변환 (형식이 다르면 현재 시각)"""
+    try:
+        return datetime.strptime(run_id, RUN_TIME_FORMAT).isoformat()
+    except ValueError:
+        return datetime.now().isoformat(timespec='seconds')
+
+
+class ResultStore:
+    """테스트 결과 이력 저장소 (SQLite)
+
+    AnalyzeRes 가 실행마다 실행 메타데이터와 테스트별 결과/산출값/측정값 CSV 참조를
+    추가하며, 실행·테스트 번호·함수·소스 파일 인덱스로 이력을 조회합니다.
+    결과 파일 정리와 관계없이 이력은 유지됩니다.
+
+    Attributes:
+        db_path: 데이터베이스 파일 경로
+    """
+
+    def __init__(self, db_path: Path = RESULT_DB):
+        self.db_path = Path(db_path)
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 연결 (정상 종료 시 커밋, 예외 시 롤백)"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+                conn.execute('PRAGMA foreign_keys = ON')
+                conn.execute('PRAGMA journal_mode = WAL')
+                conn.executescript(SCHEMA)
+                self._migrate(conn)
+                with conn:
+                    yield conn
+        except sqlite3.Error as e:
+            raise ResultStoreError(f"결과 저장소 오류: {e}") from e
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """이전 버전 데이터베이스에 없는 컬럼 추가"""
+        for table, columns in MIGRATIONS.items():
+            existing = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+            for column, column_type in columns:
+                if column not in existing:
+                    conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}')
+
+    def add_run(self, run: RunRecord, tests: List[TestRecord]) -> None:
+        """실행 결과 추가 (같은 실행이 있으면 교체)
+
+        테스트별 누적 통계는 이 실행 결과만으로 증분 갱신하며, 기존 실행을 교체하거나
+        최근 실행보다 이전 실행을 추가한 경우에만 전체 이력으로 다시 계산합니다.
+        직전 실행과 입력과 결과가 모두 같은 중복 실행은 이력에만 남기고 통계에는 반영하지 않습니다.
+        """
+        with self.connect() as conn:
+            replaced = conn.execute('SELECT 1 FROM runs WHERE run_id = ?', (run.run_id,)).fetchone()
+            latest = conn.execute('SELECT MAX(run_id) FROM runs').fetchone()[0]
+
+            conn.execute('DELETE FROM runs WHERE run_id = ?', (run.run_id,))
+            conn.execute('INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)', astuple(run))
+            conn.executemany(f'INSERT INTO results (run_id, {", ".join(RESULT_FIELDS)}) '
+                             f'VALUES ({", ".join("?" * (len(RESULT_FIELDS) + 1))})',
+                             [(run.run_id, *_result_values(test)) for test in tests])
+
+            if replaced or (latest is not None and run.run_id < latest):
+                self._rebuild_stats(conn)
+            elif latest is None or run_signature(tests) is None \
+                    or run_signature(self._load_tests(conn, latest)) != run_signature(tests):
+                self._update_stats(conn, run.run_id, tests)
+
+    def delete_run(self, run_id: str) -> None:
+        """실행 결과 삭제 (누적 통계 재계산)"""
+        with self.connect() as conn:
+            conn.execute('DELETE FROM runs WHERE run_id = ?', (run_id,))
+            self._rebuild_stats(conn)
+
+    @staticmethod
+    def _load_tests(conn: sqlite3.Connection, run_id: str) -> List[TestRecord]:
+        """실행 하나의 테스트 결과 (행 순서)"""
+        return [TestRecord(*row) for row in conn.execute(
+            f'SELECT {", ".join(RESULT_FIELDS)} FROM results WHERE run_id = ? ORDER BY row_index', (run_id,))]
+
+    @staticmethod
+    def _load_stats(conn: sqlite3.Connection) -> Dict[str, TestStats]:
+        """테스트별 누적 통계 로드"""
+        return {row[0]: TestStats(*row) for row in conn.execute(f'SELECT {", ".join(STATS_FIELDS)} FROM test_stats')}
+
+    @staticmethod
+    def _apply_run(stats: Dict[str, TestStats], run_id: str, tests: List[TestRecord]) -> List[TestStats]:
+        """실행 하나의 결과를 누적 통계에 반영하고 변경된 통계 반환"""
+        changed = []
+        for key, test in zip(test_keys(tests), tests):
+            if key in stats:
+                stats[key].update(run_id, test)
+            else:
+                stats[key] = TestStats.first(key, run_id, test)
+            changed.append(stats[key])
+        return changed
+
+    @staticmethod
+    def _save_stats(conn: sqlite3.Connection, stats: List[TestStats]) -> None:
+        """누적 통계 저장"""
+        conn.executemany(f'INSERT OR REPLACE INTO test_stats ({", ".join(STATS_FIELDS)}) '
+                         f'VALUES ({", ".join("?" * len(STATS_FIELDS))})', [_stats_values(stat) for stat in stats])
+
+    def _update_stats(self, conn: sqlite3.Connection, run_id: str, tests: List[TestRecord]) -> None:
+        """새 실행 결과로 누적 통계 증분 갱신"""
+        self._save_stats(conn, self._apply_run(self._load_stats(conn), run_id, tests))
+
+    def _rebuild_stats(self, conn: sqlite3.Connection) -> None:
+        """전체 실행 이력으로 누적 통계 재계산 (직전 실행과 같은 중복 실행 제외)"""
+        stats: Dict[str, TestStats] = {}
+        previous: Optional[str] = None  # 직전 실행 서명
+
+        def apply(run_id: str, tests: List[TestRecord]) -> None:
+            nonlocal previous
+            signature = run_signature(tests)
+            if signature is None or signature != previous:
+                self._apply_run(stats, run_id, tests)
+            previous = signature
+
+        run_id, tests = None, []
+        cursor = conn.execute(f'SELECT run_id, {", ".join(RESULT_FIELDS)} FROM results ORDER BY run_id, row_index')
+        for row in cursor:
+            if row[0] != run_id:
+                if tests:
+                    apply(run_id, tests)
+                run_id, tests = row[0], []
+            tests.append(TestRecord(*row[1:]))
+        if tests:
+            apply(run_id, tests)
+
+        conn.execute('DELETE FROM test_stats')
+        self._save_stats(conn, list(stats.values()))
+
+    def get_run_ids(self) -> Set[str]:
+        """저장된 실행 시간 목록"""
+        with self.connect() as conn:
+            return {row[0] for row in conn.execute('SELECT run_id FROM runs')}
+
+    def get_c_files(self) -> List[str]:
+        """결과에 기록된 소스 파일 이름 목록"""
+        with self.connect() as conn:
+            return [row[0] for row in conn.execute(
+                'SELECT DISTINCT c_file FROM results WHERE c_file IS NOT NULL ORDER BY c_file')]
+
+    def list_runs(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """실행 목록 (최근 순)"""
+        query = 'SELECT * FROM runs ORDER BY run_id DESC'
+        with self.connect() as conn:
+            if limit is not None:
+                return pd.read_sql_query(f'{query} LIMIT ?', conn, params=(limit,))
+            return pd.read_sql_query(query, conn)
+
+    def get_results(self, run_id: str) -> pd.DataFrame:
+        """실행 하나의 테스트 결과 (테스트 케이스 행 순서)"""
+        with self.connect() as conn:
+            return pd.read_sql_query('SELECT * FROM results WHERE run_id = ? ORDER BY row_index',
+                                     conn, params=(run_id,))
+
+    def query_results(self, test_num: Optional[str] = None, function: Optional[str] = None,
+                      c_file: Optional[str] = None, result: Optional[str] = None,
+                      run_id: Optional[str] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """조건별 테스트 결과 이력 조회 (최근 실행 순)
+
+        Args:
+            test_num: 테스트 번호 (예: "001")
+            function: 함수 이름 (부분 일치)
+            c_file: 소스 파일 이름
+            result: Pass / Fail
+            run_id: 실행 시간
+            limit: 최대 행 수
+        """
+        clauses, params = [], []
+        for column, value in (('test_num', test_num), ('c_file', c_file), ('result', result), ('run_id', run_id)):
+            if value:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if function:
+            clauses.append('function LIKE ?')
+            params.append(f'%{function}%')
+
+        query = 'SELECT * FROM results'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY run_id DESC, row_index'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        with self.connect() as conn:
+            return pd.read_sql_query(query, conn, params=params)
+
+    def get_test_stats(self, flaky_only: bool = False) -> pd.DataFrame:
+        """테스트별 누적 통계 (통과율 포함, 불안정 횟수 순)
+
+        Args:
+            flaky_only: 행 내용과 소스 변경 없이 결과가 바뀐 테스트만 조회
+        """
+        query = 'SELECT *, CAST(n_pass AS REAL) / n_runs AS pass_rate FROM test_stats'
+        if flaky_only:
+            query += ' WHERE flaky_flips > 0'
+        query += ' ORDER BY flaky_flips DESC, flips DESC, test_key'
+        with self.connect() as conn:
+            return pd.read_sql_query(query, conn)
+
+    def get_run_trend(self) -> pd.DataFrame:
+        """실행별 통과율 추이 (실행 순)"""
+        with self.connect() as conn:
+            return pd.read_sql_query('SELECT run_id, created_at, n_tests, n_fail, '
+                                     'CAST(n_tests - n_fail AS REAL) / MAX(n_tests, 1) AS pass_rate '
+                                     'FROM runs ORDER BY run_id', conn)
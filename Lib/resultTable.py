@@ -0,0 +1,159 @@
+import math
+import numpy as np
+import pandas as pd
+import streamlit as st
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+from Lib.analyzeRes import RESULT_TITLE
+from Lib.commons import colorize
+from Lib.dataAccess import FUNCTION_TITLE, SOURCE_TITLE, TEST_NUM_TITLE
+
+# 상수 정의
+PAGE_SIZES = [50, 100, 200, 500]  # 한 페이지 행 수 선택지
+INDEX_STATE_KEY = '{key}_index'  # session_state 에 보관하는 인덱스 키
+
+
+class ResultTableError(Exception):
+    """ResultTable 관련 커스텀 예외"""
+    pass
+
+
+@dataclass(frozen=True)
+class ResultColumns:
+    """결과 표의 필터 대상 컬럼 이름"""
+    result: str
+    function: str
+    c_file: str
+    test_num: str
+
+
+RUN_RESULT_COLUMNS = ResultColumns(RESULT_TITLE, FUNCTION_TITLE, SOURCE_TITLE, TEST_NUM_TITLE)  # 테스트 케이스 시트 헤더
+STORE_RESULT_COLUMNS = ResultColumns('result', 'function', 'c_file', 'test_num')
+
+
+def _normalize_test_num(value) -> str:
+    """테스트 번호 비교용 문자열 ('001', 1, '1' → '1')"""
+    text = str(value).strip()
+    if text.endswith('.0'):
+        text = text[:-2]
+    if text.isdigit():
+        return text.lstrip('0') or '0'
+    return text
+
+
+class ResultIndex:
+    """결과 표 필터용 역색인 (컬럼 값 → 행 위치 배열)
+
+    표를 한 번 훑어 만들어 두고, 필터는 행 위치 배열의 합/교집합으로 계산하므로
+    수만 행에서도 재실행마다 전체 표를 다시 비교하지 않습니다.
+
+    Attributes:
+        n_rows: 전체 행 수
+        columns: 필터 대상 컬럼 이름
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: ResultColumns):
+        """ResultIndex 클래스 초기화
+
+        Raises:
+            ResultTableError: 표에 필터 대상 컬럼이 없는 경우
+        """
+        missing = [name for name in (columns.result, columns.function, columns.c_file, columns.test_num)
+                   if name not in df.columns]
+        if missing:
+            raise ResultTableError(f"결과 표에 필터 컬럼이 없습니다: {', '.join(missing)}")
+
+        self.n_rows = len(df)
+        self.columns = columns
+        self._postings: Dict[str, Dict[str, np.ndarray]] = {}
+        for name in (columns.result, columns.function, columns.c_file):
+            values = df[name].fillna('').astype(str)
+            self._postings[name] = {value: np.asarray(positions, dtype=np.intp)
+                                    for value, positions in values.groupby(values.to_numpy()).indices.items()}
+
+        self._test_nums = np.array([_normalize_test_num(value) for value in df[columns.test_num]], dtype=object)
+        self._test_postings = {value: np.asarray(positions, dtype=np.intp)
+                               for value, positions in pd.Series(self._test_nums).groupby(self._test_nums).indices.items()}
+
+    def values(self, name: str) -> List[str]:
+        """컬럼의 고유 값 목록 (필터 선택지)"""
+        return sorted(value for value in self._postings.get(name, {}) if value)
+
+    def _union(self, name: str, selected: Sequence[str]) -> np.ndarray:
+        """선택 값 중 하나라도 일치하는 행 위치"""
+        postings = self._postings[name]
+        arrays = [postings[value] for value in selected if value in postings]
+        return np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=np.intp)
+
+    def filter(self, results: Sequence[str] = (), functions: Sequence[str] = (), c_files: Sequence[str] = (),
+               test_num: str = '') -> np.ndarray:
+        """필터 조건을 모두 만족하는 행 위치 (오름차순, 빈 조건은 전체)
+
+        Args:
+            results: 결과 값 (Pass/Fail 등)
+            functions: 함수 이름
+            c_files: 소스 파일
+            test_num: 테스트 번호 (숫자면 일치 검색, 아니면 부분 검색)
+        """
+        positions = np.arange(self.n_rows)
+        for name, selected in ((self.columns.result, results), (self.columns.function, functions),
+                               (self.columns.c_file, c_files)):
+            if selected:
+                positions = np.intersect1d(positions, self._union(name, selected), assume_unique=True)
+
+        test_num = test_num.strip()
+        if test_num:
+            if test_num.isdigit():
+                matched = self._test_postings.get(_normalize_test_num(test_num), np.empty(0, dtype=np.intp))
+            else:
+                matched = np.flatnonzero([test_num in value for value in self._test_nums])
+            positions = np.intersect1d(positions, matched, assume_unique=True)
+        return positions
+
+
+def get_result_index(df: pd.DataFrame, columns: ResultColumns, key: str, token: str) -> ResultIndex:
+    """세션에 보관한 결과 표 인덱스 (token 이 바뀐 경우에만 재생성)
+
+    Args:
+        df: 결과 표
+        columns: 필터 대상 컬럼 이름
+        key: 페이지 내 위젯 키 접두사
+        token: 표 식별자 (예: 실행 시간)
+    """
+    state_key = INDEX_STATE_KEY.format(key=key)
+    cached = st.session_state.get(state_key)
+    if cached is None or cached[0] != token or cached[1].n_rows != len(df):
+        cached = (token, ResultIndex(df, columns))
+        st.session_state[state_key] = cached
+    return cached[1]
+
+
+def render_result_table(df: pd.DataFrame, columns: ResultColumns, key: str, token: str) -> None:
+    """필터/페이지 단위 결과 표 (현재 페이지 행만 화면으로 전송)
+
+    Args:
+        df: 결과 표
+        columns: 필터 대상 컬럼 이름
+        key: 페이지 내 위젯 키 접두사
+        token: 표 식별자 (예: 실행 시간, 바뀌면 인덱스 재생성)
+    """
+    index = get_result_index(df, columns, key, token)
+
+    col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
+    results = col1.multiselect('Result', index.values(columns.result), key=f"{key}_result")
+    functions = col2.multiselect('Function', index.values(columns.function), key=f"{key}_function")
+    c_files = col3.multiselect('Source', index.values(columns.c_file), key=f"{key}_c_file")
+    test_num = col4.text_input('Test Number', key=f"{key}_test_num")
+    positions = index.filter(results, functions, c_files, test_num)
+
+    col1, col2, _ = st.columns([1, 1, 2])
+    page_rows = col1.selectbox('페이지 행 수', PAGE_SIZES, index=1, key=f"{key}_page_rows")
+    n_pages = max(math.ceil(len(positions) / page_rows), 1)
+    if st.session_state.get(f"{key}_page", 1) > n_pages:  # 필터 변경으로 페이지 수가 줄어든 경우
+        st.session_state[f"{key}_page"] = 1
+    page = col2.number_input(f"페이지 (총 {n_pages})", min_value=1, max_value=n_pages, value=1, key=f"{key}_page")
+
+    df_page = df.iloc[positions[(int(page) - 1) * page_rows:int(page) * page_rows]]
+    style = df_page.style.map(colorize, subset=[columns.result]) if columns.result in df_page.columns else df_page
+    st.caption(f"{len(positions)} / {index.n_rows} 행")
+    st.dataframe(style, hide_index=True, use_container_width=True)
@@ -0,0 +1,199 @@
+import re
+import json
+import pandas as pd
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from Lib.commons import DEFAULT_CYCLE_NUMBER, SYMBOL_FILE
+from Lib.definitions import compile_definitions
+from Lib.stimulus import split_stimulus_inputs
+from Lib.sweep import SweepError, parse_sweep_expect, split_sweep_inputs
+
+# 상수 정의
+ROW_CACHE_SIZE = 65536  # 행 검사 결과 캐시 개수
+SEVERITY_ERROR = 'error'  # 빌드 전 중단
+SEVERITY_WARNING = 'warning'  # 알림만 하고 계속 진행
+EXPECT_PATTERN = re.compile(r"(\d+)\)\s*(\w+)\s*=\s*(\d+)")  # 테스트 코드 생성과 같은 규칙
+VAR_VAL_PATTERN = re.compile(r"(\w+)\s*=\s*(\d+)")
+TEST_NUM_COL, C_FILE_COL, CYCLE_COL, PRE_COL, INPUTS_COL, EXPECT_COL = 0, 3, 5, 6, 7, 8
+COLUMN_NAMES = {TEST_NUM_COL: 'Test#', C_FILE_COL: 'Source', CYCLE_COL: 'Cycle', PRE_COL: 'Pre',
+                INPUTS_COL: 'Inputs', EXPECT_COL: 'Expect'}
+
+
+@dataclass
+class RowIssue:
+    """테스트 케이스 행 검사 결과 하나
+
+    Attributes:
+        row: 행 번호 (1부터 시작, 빈 행 제외)
+        test_num: 테스트 번호
+        column: 문제가 있는 컬럼 이름
+        message: 설명
+        severity: 심각도 (SEVERITY_ERROR 이면 빌드 중단, SEVERITY_WARNING 이면 알림만)
+    """
+    row: int
+    test_num: str
+    column: str
+    message: str
+    severity: str = SEVERITY_ERROR
+
+
+@dataclass(frozen=True)
+class ValidationContext:
+    """행 검사 기준 (스텁 심볼 / 소스 파일), 바뀌면 행 검사 캐시를 다시 사용하지 않음"""
+    symbols: FrozenSet[str]
+    c_files: FrozenSet[str]
+
+    @classmethod
+    def from_symbols(cls, dict_symbol: Dict[str, Iterable[Any]], c_files: Iterable[str] = ()) -> 'ValidationContext':
+        """StubFile.dict_symbol (소스 파일 → Symbol 또는 이름 리스트)로 생성"""
+        symbols = {getattr(sym, 'name', sym) for syms in dict_symbol.values() for sym in syms}
+        return cls(frozenset(symbols), frozenset(dict_symbol) | frozenset(c_files))
+
+
+@dataclass(frozen=True)
+class _RowCheck:
+    """행 단독 검사 결과 (다른 행과 무관한 부분, 캐시 대상)"""
+    test_num: Optional[str]
+    refs: Tuple[str, ...]  # 사전 조건 Test_NNN 참조 번호
+    issues: Tuple[Tuple[int, str], ...]  # (컬럼 위치, 설명)
+    warnings: Tuple[Tuple[int, str], ...] = ()  # (컬럼 위치, 설명), 빌드를 막지 않음
+
+
+def _text(val: Any) -> str:
+    """셀 값 문자열 (빈 값/NaN 은 빈 문자열)"""
+    if val is None or (isinstance(val, float) and pd.isna(val)):
+        return ''
+    return str(val)
+
+
+def _to_int(val: Any) -> Optional[int]:
+    """정수 셀 값 (정수가 아니면 None)"""
+    try:
+        number = float(_text(val))
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else None
+
+
+def _expected_cycles(expect: str) -> Tuple[List[str], List[int]]:
+    """예상 결과 셀의 변수 이름과 사이클 번호 (테스트 코드 생성과 같은 규칙)"""
+    if ')' in expect:
+        matches = EXPECT_PATTERN.findall(expect)
+        return [var for _, var, _ in matches], [int(cycle) for cycle, _, _ in matches]
+    return [var for var, _ in VAR_VAL_PATTERN.findall(expect)], []
+
+
+@lru_cache(maxsize=ROW_CACHE_SIZE)
+def _check_row(context: ValidationContext, row: Tuple) -> _RowCheck:
+    """행 하나 단독 검사 (같은 행 내용과 검사 기준이면 캐시 재사용)"""
+    issues: List[Tuple[int, str]] = []
+    warnings: List[Tuple[int, str]] = []
+    cell = (lambda col: row[col] if col < len(row) else None)
+
+    number = _to_int(cell(TEST_NUM_COL))
+    test_num = str(number).zfill(3) if number is not None else None
+    if test_num is None:
+        issues.append((TEST_NUM_COL, f"테스트 번호가 정수가 아닙니다: {_text(cell(TEST_NUM_COL))!r}"))
+
+    c_file = _text(cell(C_FILE_COL)).strip()
+    if context.c_files and c_file not in context.c_files:
+        issues.append((C_FILE_COL, f"알 수 없는 소스 파일입니다: {c_file!r}"))
+
+    cycle = _to_int(cell(CYCLE_COL))
+    if cycle is None or cycle < 1:
+        issues.append((CYCLE_COL, f"사이클 수가 1 이상의 정수가 아닙니다: {_text(cell(CYCLE_COL))!r}"))
+
+    pre = _text(cell(PRE_COL))
+    refs = tuple(line.strip().replace('Test_', '').replace('()', '').zfill(3)
+                 for line in pre.split('\n') if 'Test' in line)
+
+    definitions = compile_definitions(_text(row[-1]) or None)
+    _, inputs = split_stimulus_inputs(_text(cell(INPUTS_COL)))
+    inputs = definitions.apply(inputs)
+    expect = definitions.apply(_text(cell(EXPECT_COL)))
+
+    variables, cycles = [], []
+    try:
+        sweep, _ = split_sweep_inputs(inputs)
+        if sweep:
+            expectation = parse_sweep_expect(expect, *sweep)
+            variables = expectation.variables
+            cycles = [key for expects in expectation.expects for key in expects if key != DEFAULT_CYCLE_NUMBER]
+        elif not expect.strip():
+            issues.append((EXPECT_COL, "예상 결과가 비어 있습니다"))
+        else:
+            variables, cycles = _expected_cycles(expect)
+            if not variables:
+                issues.append((EXPECT_COL, "예상 결과에서 '변수 = 값' 형식을 찾을 수 없습니다"))
+    except SweepError as e:
+        issues.append((INPUTS_COL, str(e)))
+
+    if context.symbols:
+        # 스텁 심볼은 초기화 대상 전역만 포함 (volatile/const 전역, 헤더 선언 변수는 없음) - 알림만
+        missing = [var for var in dict.fromkeys(variables) if var not in context.symbols]
+        if missing:
+            warnings.append((EXPECT_COL, f"스텁 심볼에 없는 출력 변수입니다: {', '.join(missing)}"))
+
+    if cycle is not None and cycles and max(cycles) > cycle:
+        issues.append((CYCLE_COL, f"사이클 수({cycle})가 예상값의 최대 사이클({max(cycles)})보다 작습니다"))
+
+    return _RowCheck(test_num, refs, tuple(issues), tuple(warnings))
+
+
+def validate_rows(rows: Iterable[Tuple], context: ValidationContext) -> List[RowIssue]:
+    """테스트 케이스 행 검사 (컴파일 전 빠른 실패용)
+
+    행 단독 검사는 행 내용 기준으로 캐시하므로 편집할 때마다 바뀐 행만 다시 검사하고,
+    사전 조건 Test_NNN 참조(앞선 행을 가리키는지)만 매번 전체 행 순서로 확인합니다.
+
+    Args:
+        rows: 시트 행 (첫 번째 열 제외, 테스트 케이스 컬럼 순서, 한 번만 순회)
+        context: 스텁 심볼 / 소스 파일 기준
+
+    Returns:
+        RowIssue 리스트 (행 순서, 경고 포함)
+    """
+    issues: List[RowIssue] = []
+    seen: Set[str] = set()
+    checks = [_check_row(context, tuple(None if _text(val) == '' else val for val in row))  # NaN → None (캐시 키)
+              for row in rows]
+    all_nums = {check.test_num for check in checks}
+
+    for index, check in enumerate(checks, start=1):
+        test_num = check.test_num or ''
+        issues.extend(RowIssue(index, test_num, COLUMN_NAMES[col], message) for col, message in check.issues)
+        for ref in check.refs:
+            if ref in seen:
+                continue
+            where = "뒤쪽 행에 있는" if ref in all_nums else "없는"
+            issues.append(RowIssue(index, test_num, COLUMN_NAMES[PRE_COL],
+                                   f"사전 조건 Test_{ref}() 가 {where} 테스트를 참조합니다"))
+        issues.extend(RowIssue(index, test_num, COLUMN_NAMES[col], message, SEVERITY_WARNING)
+                      for col, message in check.warnings)
+        if check.test_num is not None:
+            seen.add(check.test_num)
+    return issues
+
+
+def save_symbols(dict_symbol: Dict[str, Iterable[Any]], file_path: Path = SYMBOL_FILE) -> None:
+    """스텁 심볼 정보 저장 (테스트 케이스 화면에서 컴파일 없이 행 검사용)"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({c_file: [getattr(sym, 'name', sym) for sym in syms] for c_file, syms in dict_symbol.items()},
+                  f, ensure_ascii=False)
+
+
+def load_context(file_path: Path = SYMBOL_FILE, c_files: Iterable[str] = ()) -> ValidationContext:
+    """저장된 스텁 심볼 정보로 검사 기준 생성 (없으면 소스 파일만 기준)"""
+    dict_symbol: Dict[str, List[str]] = {}
+    if Path(file_path).is_file():
+        with open(file_path, encoding='utf-8') as f:
+            dict_symbol = json.load(f)
+    return ValidationContext.from_symbols(dict_symbol, c_files)
+
+
+def issues_frame(issues: List[RowIssue]) -> pd.DataFrame:
+    """검사 결과 DataFrame (화면 표시용)"""
+    return pd.DataFrame([asdict(issue) for issue in issues],
+                        columns=['row', 'test_num', 'column', 'message', 'severity'])
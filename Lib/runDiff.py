@@ -0,0 +1,195 @@
+import io
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import List, Optional
+from Lib.analyzeRes import PASS_RESULT, FAIL_RESULT
+from Lib.resultArchive import read_result_file
+from Lib.resultStore import ResultStore
+
+# 상수 정의
+STATUS_REGRESSED = 'Regressed'  # Pass → Fail
+STATUS_FIXED = 'Fixed'  # Fail → Pass
+STATUS_CHANGED = 'Changed'  # 결과는 같고 산출값/측정값 변경
+STATUS_ADDED = 'Added'
+STATUS_REMOVED = 'Removed'
+STATUS_SAME = 'Same'
+
+
+class RunDiffError(Exception):
+    """RunDiff 관련 커스텀 예외"""
+    pass
+
+
+@dataclass
+class ValueChange:
+    """사이클별 측정값 변경 (cycle: 측정값 CSV 행 번호, 1부터 시작)"""
+    cycle: int
+    variable: str
+    old: Optional[str]
+    new: Optional[str]
+
+
+@dataclass
+class TestDiff:
+    """테스트 하나의 두 실행 간 차이"""
+    test_num: str
+    function: Optional[str]
+    c_file: Optional[str]
+    status: str
+    old_result: Optional[str]
+    new_result: Optional[str]
+    old_measured: Optional[str]
+    new_measured: Optional[str]
+    trace_changed: bool
+    value_changes: List[ValueChange] = field(default_factory=list)
+
+
+@dataclass
+class RunDiff:
+    """두 실행 비교 결과 (변경된 테스트만 포함)
+
+    Attributes:
+        base: 기준 실행 시간
+        target: 비교 실행 시간
+        tests: 변경된 테스트 차이 리스트 (비교 실행 행 순서)
+        n_same: 변경 없는 테스트 수
+    """
+    base: str
+    target: str
+    tests: List[TestDiff]
+    n_same: int
+
+    def by_status(self, status: str) -> List[TestDiff]:
+        """상태별 테스트 차이"""
+        return [test for test in self.tests if test.status == status]
+
+    def to_frame(self) -> pd.DataFrame:
+        """화면 표시용 DataFrame"""
+        return pd.DataFrame([
+            {'test_num': t.test_num, 'function': t.function, 'c_file': t.c_file, 'status': t.status,
+             'old_result': t.old_result, 'new_result': t.new_result,
+             'old_measured': t.old_measured, 'new_measured': t.new_measured,
+             'trace_changed': t.trace_changed, 'value_changes': len(t.value_changes)}
+            for t in self.tests
+        ], columns=['test_num', 'function', 'c_file', 'status', 'old_result', 'new_result',
+                    'old_measured', 'new_measured', 'trace_changed', 'value_changes'])
+
+    def summary(self) -> str:
+        """상태별 개수 요약 문자열"""
+        counts = [f"{status} {len(self.by_status(status))}"
+                  for status in (STATUS_REGRESSED, STATUS_FIXED, STATUS_CHANGED, STATUS_ADDED, STATUS_REMOVED)]
+        return f"{self.base} → {self.target}: {', '.join(counts)}, {STATUS_SAME} {self.n_same}"
+
+
+def _load_run(store: ResultStore, run_id: str) -> pd.DataFrame:
+    """실행 결과를 (테스트 번호, 같은 번호 내 순번) 키로 로드"""
+    df = store.get_results(run_id)
+    if df.empty:
+        raise RunDiffError(f"결과 이력 저장소에 없는 실행입니다: {run_id}")
+    df['occurrence'] = df.groupby('test_num').cumcount()  # 중복 테스트 번호 구분
+    return df
+
+
+def _read_trace(trace_path: Optional[str]) -> Optional[pd.DataFrame]:
+    """측정값 CSV 로드 (압축 보관된 실행은 보관 파일에서 읽음, 삭제되었으면 None)"""
+    data = read_result_file(trace_path) if trace_path else None
+    if data is None:
+        return None
+    return pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False)
+
+
+def diff_traces(old_df: pd.DataFrame, new_df: pd.DataFrame) -> List[ValueChange]:
+    """두 측정값 DataFrame 의 사이클별 변수 값 차이
+
+    Args:
+        old_df: 기준 실행 측정값
+        new_df: 비교 실행 측정값
+
+    Returns:
+        ValueChange 리스트 (사이클, 변수 순서)
+    """
+    variables = list(new_df.columns) + [col for col in old_df.columns if col not in new_df.columns]
+    n_rows = max(len(old_df), len(new_df))
+
+    def _padded(df: pd.DataFrame) -> np.ndarray:
+        matrix = np.full((n_rows, len(variables)), None, dtype=object)
+        cols = [variables.index(col) for col in df.columns]
+        matrix[:len(df), cols] = df.to_numpy(dtype=object)
+        return matrix
+
+    old, new = _padded(old_df), _padded(new_df)
+    rows, cols = np.nonzero(old != new)
+    return [ValueChange(int(row) + 1, variables[col], old[row, col], new[row, col])
+            for row, col in zip(rows.tolist(), cols.tolist())]
+
+
+def _status(old_result: Optional[str], new_result: Optional[str]) -> str:
+    """변경된 테스트의 결과 변화 상태"""
+    if old_result is None:
+        return STATUS_ADDED
+    if new_result is None:
+        return STATUS_REMOVED
+    if old_result == PASS_RESULT and new_result == FAIL_RESULT:
+        return STATUS_REGRESSED
+    if old_result == FAIL_RESULT and new_result == PASS_RESULT:
+        return STATUS_FIXED
+    return STATUS_CHANGED
+
+
+def _differs(merged: pd.DataFrame, column: str) -> pd.Series:
+    """두 실행의 컬럼 값 변경 여부 (양쪽 모두 비어 있으면 같은 값)"""
+    old, new = merged[f'{column}_old'], merged[f'{column}_new']
+    return ~(old.eq(new) | (old.isna() & new.isna()))
+
+
+def diff_runs(base: str, target: str, values: bool = False, store: Optional[ResultStore] = None) -> RunDiff:
+    """두 실행 결과를 테스트 번호 기준으로 비교
+
+    결과와 산출값은 저장소에서 한 번에 비교하고, 측정값 CSV 는 내용 해시가 다른
+    테스트만 values 지정 시 사이클별로 비교합니다.
+
+    Args:
+        base: 기준 실행 시간
+        target: 비교 실행 시간
+        values: 해시가 다른 테스트의 사이클별 변수 값 비교 여부
+        store: 결과 이력 저장소 (기본: RESULT_DB)
+
+    Returns:
+        RunDiff 객체
+
+    Raises:
+        RunDiffError: 저장소에 없는 실행인 경우
+    """
+    store = store or ResultStore()
+    merged = pd.merge(_load_run(store, base), _load_run(store, target), how='outer',
+                      on=['test_num', 'occurrence'], suffixes=('_old', '_new'), indicator=True)
+    merged = merged.sort_values(['row_index_new', 'row_index_old'], na_position='last')
+
+    both = merged['_merge'] == 'both'
+    trace_changed = both & _differs(merged, 'trace_hash')
+    changed = ~both | trace_changed | _differs(merged, 'result') | _differs(merged, 'measured')
+    merged = merged.astype(object).where(merged.notna(), None)
+
+    tests = []
+    for row, is_trace_changed in zip(merged[changed].itertuples(index=False), trace_changed[changed].tolist()):
+        value_changes = []
+        if values and is_trace_changed:
+            old_df, new_df = _read_trace(row.trace_path_old), _read_trace(row.trace_path_new)
+            if old_df is not None and new_df is not None:
+                value_changes = diff_traces(old_df, new_df)
+
+        tests.append(TestDiff(
+            test_num=row.test_num,
+            function=row.function_new if row.function_new is not None else row.function_old,
+            c_file=row.c_file_new if row.c_file_new is not None else row.c_file_old,
+            status=_status(row.result_old, row.result_new),
+            old_result=row.result_old,
+            new_result=row.result_new,
+            old_measured=row.measured_old,
+            new_measured=row.measured_new,
+            trace_changed=is_trace_changed,
+            value_changes=value_changes,
+        ))
+
+    return RunDiff(base, target, tests, int((~changed).sum()))
@@ -0,0 +1,455 @@
+import os
+import re
+import ctypes
+import _ctypes
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Collection, Dict, List, Optional
+from Lib.commons import STUB_PATH, SHARED_LIB_PATH
+from Lib.toolchain import Toolchain, BuildMetrics
+from Lib.stubFile import Symbol
+from Lib.stimulus import StimulusBlock, STIM_BEGIN_PATTERN, STIM_END_MARK
+from Lib.sweep import (SweepBlock, SWEEP_BEGIN_PATTERN, SWEEP_END_MARK, SWEEP_POINT_VAR,
+                       SWEEP_SAVE_CALL, SWEEP_RESTORE_CALL)
+
+# 상수 정의
+SYMBOL_TABLE_CODE = 'symbol_table.c'
+EXCLUDED_SOURCES = {'test_driver.c'}
+LIB_PREFIX = 'libswtest_'
+LIB_SUFFIX = '.dll' if os.name == 'nt' else '.so'
+
+# 드라이버 문장 파싱 패턴
+CALL_PATTERN = re.compile(r"^(\w+)\s*\((.*)\)$")
+ASSIGN_PATTERN = re.compile(r"^(\w+)(?:\s*\[\s*(\w+)\s*\])?\s*=\s*(.+)$")
+INDEX_PATTERN = re.compile(r"^(\w+)\s*\[\s*(\w+)\s*\]$")
+INT_PATTERN = re.compile(r"^([-+]?)(0[xX][0-9a-fA-F]+|\d+)[uUlL]*$")
+OUTPUT_PREFIX = 'fprintf('
+UNKNOWN_VARIABLE = '심볼 테이블에 없는 변수'
+
+CTYPES_MAP = {
+    (1, True): ctypes.c_int8, (1, False): ctypes.c_uint8,
+    (2, True): ctypes.c_int16, (2, False): ctypes.c_uint16,
+    (4, True): ctypes.c_int32, (4, False): ctypes.c_uint32,
+    (8, True): ctypes.c_int64, (8, False): ctypes.c_uint64,
+}
+
+
+class SharedLibError(Exception):
+    """SharedLibDriver 관련 커스텀 예외"""
+    pass
+
+
+def _is_supported_value(expr: str, variables: Collection[str]) -> bool:
+    """SharedLibDriver._evaluate 로 계산할 수 있는 값인지 여부"""
+    expr = expr.strip()
+    if INT_PATTERN.match(expr) or expr in variables:
+        return True
+    match = INDEX_PATTERN.match(expr)
+    return bool(match) and match.group(1) in variables and _is_supported_value(match.group(2), variables)
+
+
+def _is_supported_statement(statement: str, variables: Collection[str]) -> bool:
+    """SharedLibDriver._execute 로 실행할 수 있는 문장인지 여부"""
+    match = ASSIGN_PATTERN.match(statement)
+    if match:
+        name, index, value = match.groups()
+        return (name in variables and (index is None or _is_supported_value(index, variables))
+                and (value.replace(' ', '') == '{0}' or _is_supported_value(value, variables)))
+
+    match = CALL_PATTERN.match(statement)
+    if match:
+        return all(_is_supported_value(arg, variables) for arg in match.group(2).split(',') if arg.strip())
+
+    return False
+
+
+def find_unsupported(statements: List[str], outputs: List[str], variables: Collection[str],
+                     stim_blocks: Dict[int, StimulusBlock], sweep_blocks: Dict[int, SweepBlock]) -> Optional[str]:
+    """공유 라이브러리로 실행할 수 없는 사유 (첫 문장 또는 심볼 테이블에 없는 변수, 모두 실행 가능하면 None)
+
+    SharedLibDriver 가 실행하는 순서대로 사전 조건/입력/함수 호출 문장과 자극 파일/스윕 루프
+    내부 문장을 확인합니다. 지원 문장은 SharedLibDriver 설명을 참고합니다.
+
+    Args:
+        statements: 테스트 시퀀스 C 문장 (TestProgram.statements)
+        outputs: 출력 변수 (TestProgram.outputs)
+        variables: 심볼 테이블의 전역 변수 이름
+        stim_blocks: 외부 자극 파일 루프 (GenSWTest.stim_blocks)
+        sweep_blocks: 스윕 지점 루프 (GenSWTest.sweep_blocks)
+    """
+    for var in outputs:
+        if var != SWEEP_POINT_VAR and var not in variables:
+            return f"{UNKNOWN_VARIABLE}: {var}"
+
+    end_mark = None
+    for line in statements:
+        if end_mark is not None:
+            if end_mark in line:
+                end_mark = None
+            continue
+        match = STIM_BEGIN_PATTERN.search(line)
+        if match:
+            block = stim_blocks[int(match.group(1))]
+            unknown = [var for table in block.tables for var in table.variables if var not in variables]
+            if unknown:
+                return f"{UNKNOWN_VARIABLE}: {unknown[0]}"
+            body = [stmt for _, _, stmt in block.cycle_inputs] + block.calls
+            end_mark = STIM_END_MARK
+        else:
+            match = SWEEP_BEGIN_PATTERN.search(line)
+            if match:
+                block = sweep_blocks[int(match.group(1))]
+                if block.variable not in variables:
+                    return f"{UNKNOWN_VARIABLE}: {block.variable}"
+                body = block.get_body(bool(match.group(2)))
+                end_mark = SWEEP_END_MARK
+            else:
+                body = [line]
+
+        for statement in body:
+            statement = statement.strip().rstrip(';').strip()
+            if statement and not statement.startswith(OUTPUT_PREFIX) \
+                    and not _is_supported_statement(statement, variables):
+                return statement
+    return None
+
+
+class _SwSymbol(ctypes.Structure):
+    """symbol_table.c 의 SwSymbol 구조체"""
+    _fields_ = [
+        ('name', ctypes.c_char_p),
+        ('addr', ctypes.c_void_p),
+        ('size', ctypes.c_uint),
+        ('elem_size', ctypes.c_uint),
+        ('is_signed', ctypes.c_int),
+    ]
+
+
+class _Variable:
+    """공유 라이브러리 전역 변수 접근자"""
+
+    def __init__(self, addr: int, size: int, elem_size: int, is_signed: bool):
+        c_type = CTYPES_MAP.get((elem_size, is_signed))
+        if c_type is None:
+            raise SharedLibError(f"지원하지 않는 변수 크기입니다: {elem_size}")
+        self.length = max(size // elem_size, 1)
+        self.values = (c_type * self.length).from_address(addr)
+
+    def get(self, index: int = 0) -> int:
+        return self.values[index]
+
+    def set(self, value: int, index: int = 0) -> None:
+        self.values[index] = value
+
+    def reset(self) -> None:
+        ctypes.memset(self.values, 0, ctypes.sizeof(self.values))
+
+
+class SharedLibDriver:
+    """스텁 소스를 공유 라이브러리로 빌드하고 테스트 시퀀스를 프로세스 내에서 직접 실행하는 클래스
+
+    전역 변수는 생성된 심볼 테이블을 통해 접근하며, 라이브러리는 C 소스 내용과
+    컴파일 플래그의 해시로 캐시되어 테스트 행이 변경되어도 다시 컴파일하지 않습니다.
+
+    드라이버 C 문장은 C 컴파일 없이 해석하므로 다음 형식만 실행합니다 (find_unsupported 로 사전 확인).
+        - 대입: 변수 = 값, 배열[첨자] = 값, 변수 = {0}
+        - 함수 호출: 함수(값, ...) (정수 인자만)
+        - 값: 정수 리터럴 (10진/16진, U/L 접미사), 전역 변수, 전역 배열[정수 또는 변수]
+    수식, 형 변환, 구조체 멤버, 포인터 인자, 심볼 테이블에 없는 변수(매크로, 헤더 선언 변수 등)를
+    사용하는 행은 GenSWTest 가 exe 백엔드로 실행합니다.
+
+    Attributes:
+        lib_file: 캐시된 공유 라이브러리 경로
+    """
+
+    def __init__(self, include: List[str], dict_symbol: Dict[str, List[Symbol]],
+                 toolchain: Toolchain, metrics: BuildMetrics, stub_path: Path = STUB_PATH):
+        """SharedLibDriver 클래스 초기화
+
+        Args:
+            include: 심볼 테이블에 포함할 헤더 파일 리스트
+            dict_symbol: 소스 파일별 전역 변수 심볼 (StubFile.dict_symbol)
+            toolchain: 빌드에 사용할 툴체인
+            metrics: 단계별 소요 시간 기록 객체
+            stub_path: 스텁 코드 폴더
+
+        Raises:
+            SharedLibError: 공유 라이브러리 빌드 실패 시
+        """
+        self.stub_path = Path(stub_path)
+        self.include = include
+        self.symbols: List[Symbol] = [sym for symbols in dict_symbol.values() for sym in symbols]
+        self.toolchain = toolchain
+        self.metrics = metrics
+
+        self._write_symbol_table()
+        self.lib_file: Path = self._build()
+
+        self.lib: Optional[ctypes.CDLL] = None
+        self._run_dir: Optional[tempfile.TemporaryDirectory] = None  # 로드한 임시 복사본 폴더
+        self.variables: Dict[str, _Variable] = {}
+        self.functions: Dict[str, ctypes._CFuncPtr] = {}
+
+    def _write_symbol_table(self) -> None:
+        """전역 변수 심볼 테이블 C 코드 생성"""
+        arrays = {sym.name: sym.is_array for sym in self.symbols}  # 중복 선언 제거
+
+        entries = []
+        for name, is_array in arrays.items():
+            elem = f"{name}[0]" if is_array else name
+            entries.append(f"    {{\"{name}\", (void *)&{name}, sizeof({name}), sizeof({elem}), "
+                           f"(__typeof__({elem}))-1 < (__typeof__({elem}))0}},")
+
+        code = '\n'.join(
+            [f'#include "{inc}"' for inc in self.include] +
+            ["",
+             "typedef struct { const char *name; void *addr; unsigned int size; "
+             "unsigned int elem_size; int is_signed; } SwSymbol;",
+             "",
+             "SwSymbol sw_symbols[] = {"] +
+            entries +
+            ["    {0, 0, 0, 0, 0}",
+             "};",
+             f"unsigned int sw_symbol_count = {len(entries)};",
+             ""])
+
+        with open(self.stub_path / SYMBOL_TABLE_CODE, 'w', encoding='utf-8') as f:
+            f.write(code)
+
+    def _get_sources(self) -> List[Path]:
+        """공유 라이브러리에 포함할 C 소스 목록"""
+        return sorted(f for f in self.stub_path.glob('*.c') if f.name not in EXCLUDED_SOURCES)
+
+    def _get_cache_key(self) -> str:
+        """C 소스/헤더 내용과 컴파일 플래그 기반 캐시 키"""
+        digest = hashlib.sha1(' '.join([self.toolchain.compiler, *self.toolchain.flags]).encode('utf-8'))
+        for file in sorted(self.stub_path.glob('*.[ch]')):
+            if file.name in EXCLUDED_SOURCES:
+                continue
+            digest.update(file.name.encode('utf-8'))
+            digest.update(file.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def _build(self) -> Path:
+        """공유 라이브러리 빌드 (캐시 적중 시 생략)
+
+        Raises:
+            SharedLibError: 컴파일 실패 시
+        """
+        lib_file = Path(SHARED_LIB_PATH) / f"{LIB_PREFIX}{self._get_cache_key()}{LIB_SUFFIX}"
+        if lib_file.is_file():
+            return lib_file
+
+        lib_file.parent.mkdir(parents=True, exist_ok=True)
+        pic = [] if os.name == 'nt' else ['-fPIC']
+        sources = [f.name for f in self._get_sources()]
+
+        if not self.toolchain.build(self.stub_path, sources, self.metrics, output=str(lib_file.resolve()),
+                                    extra_flags=pic, link_flags=['-shared']):
+            raise SharedLibError(f"공유 라이브러리 빌드 실패 (error.log 확인): {lib_file.name}")
+
+        return lib_file
+
+    def _load(self) -> None:
+        """공유 라이브러리 로드 및 심볼 테이블 구성
+
+        같은 경로의 라이브러리는 프로세스 내에서 한 번만 로드되므로, 실행마다 임시 복사본을
+        로드하여 exe 실행과 동일하게 초기화된 전역 변수 상태에서 시작합니다.
+        """
+        self._run_dir = tempfile.TemporaryDirectory(prefix='swtest_')
+        run_lib = Path(self._run_dir.name) / self.lib_file.name
+        shutil.copy2(self.lib_file, run_lib)
+
+        try:
+            self.lib = ctypes.CDLL(str(run_lib))
+            count = ctypes.c_uint.in_dll(self.lib, 'sw_symbol_count').value
+            table = (_SwSymbol * count).in_dll(self.lib, 'sw_symbols')
+        except (OSError, ValueError) as e:
+            self._unload()
+            raise SharedLibError(f"공유 라이브러리 로드 실패: {e}") from e
+
+        self.variables = {
+            sym.name.decode('utf-8'): _Variable(sym.addr, sym.size, sym.elem_size, bool(sym.is_signed))
+            for sym in table
+        }
+        self.functions = {}
+
+    def _unload(self) -> None:
+        """공유 라이브러리 해제 및 임시 복사본 삭제"""
+        self.variables, self.functions = {}, {}
+        if self.lib is not None:
+            handle, self.lib = self.lib._handle, None
+            try:
+                if os.name == 'nt':
+                    _ctypes.FreeLibrary(handle)
+                else:
+                    _ctypes.dlclose(handle)
+            except OSError as e:
+                print(f"Warning: 공유 라이브러리 해제 실패: {e}")
+        if self._run_dir is not None:
+            try:
+                self._run_dir.cleanup()
+            except OSError as e:
+                print(f"Warning: 임시 폴더 삭제 실패: {e}")
+            self._run_dir = None
+
+    def _get_function(self, name: str) -> ctypes._CFuncPtr:
+        """함수 심볼 조회"""
+        if name not in self.functions:
+            try:
+                func = getattr(self.lib, name)
+            except AttributeError as e:
+                raise SharedLibError(f"함수를 찾을 수 없습니다: {name}") from e
+            func.restype = None
+            self.functions[name] = func
+        return self.functions[name]
+
+    def _get_variable(self, name: str) -> _Variable:
+        """변수 심볼 조회"""
+        if name not in self.variables:
+            raise SharedLibError(f"변수를 찾을 수 없습니다: {name}")
+        return self.variables[name]
+
+    def _evaluate(self, expr: str) -> int:
+        """우변 값 계산 (정수 리터럴, 변수, 배열 원소)"""
+        expr = expr.strip()
+
+        match = INT_PATTERN.match(expr)
+        if match:
+            value = int(match.group(2), 0)
+            return -value if match.group(1) == '-' else value
+
+        match = INDEX_PATTERN.match(expr)
+        if match:
+            return self._get_variable(match.group(1)).get(self._evaluate(match.group(2)))
+
+        if expr in self.variables:
+            return self.variables[expr].get()
+
+        raise SharedLibError(f"지원하지 않는 값입니다: {expr}")
+
+    def _execute(self, statement: str) -> None:
+        """드라이버 C 문장 하나 실행 (함수 호출 또는 대입)"""
+        match = ASSIGN_PATTERN.match(statement)
+        if match:
+            name, index, value = match.groups()
+            variable = self._get_variable(name)
+            if value.replace(' ', '') == '{0}':
+                variable.reset()
+            else:
+                variable.set(self._evaluate(value), self._evaluate(index) if index else 0)
+            return
+
+        match = CALL_PATTERN.match(statement)
+        if match:
+            args = [ctypes.c_int(self._evaluate(arg)) for arg in match.group(2).split(',') if arg.strip()]
+            self._get_function(match.group(1))(*args)
+            return
+
+        raise SharedLibError(f"지원하지 않는 구문입니다: {statement}")
+
+    def _run_stimulus(self, block: StimulusBlock, record: bool,
+                      output_vars: List[_Variable], rows: List[List[int]]) -> None:
+        """외부 자극 테이블 루프 실행 (메모리 매핑된 테이블 직접 적용)"""
+        tables = [(table.load(), [self._get_variable(var) for var in table.variables])
+                  for table in block.tables]
+        calls = [call.rstrip(';') for call in block.calls]
+
+        for cyc in range(block.cycles):
+            for data, variables in tables:
+                if cyc < len(data):
+                    for variable, value in zip(variables, data[cyc].tolist()):
+                        variable.set(value)
+            for start, end, stmt in block.cycle_inputs:
+                if start <= cyc + 1 <= end:
+                    self._execute(stmt)
+            for call in calls:
+                self._execute(call)
+            if record:
+                rows.append([var.get() for var in output_vars])
+
+    def _run_sweep(self, block: SweepBlock, record: bool,
+                   output_vars: List[_Variable], rows: List[List[int]]) -> None:
+        """스윕 지점 루프 실행 (지점마다 sw_state_restore 로 사전 조건 직후 상태 복원)"""
+        self._execute(SWEEP_SAVE_CALL.rstrip(';'))
+        variable = self._get_variable(block.variable)
+        body = [line.strip().rstrip(';').strip() for line in block.get_body(record)]
+        for point, value in enumerate(block.points):
+            self._execute(SWEEP_RESTORE_CALL.rstrip(';'))
+            variable.set(value)
+            for statement in body:
+                if not statement:
+                    continue
+                if statement.startswith(OUTPUT_PREFIX):
+                    rows.append([point] + [var.get() for var in output_vars])
+                else:
+                    self._execute(statement)
+
+    def _run_program(self, statements: List[str], outputs: List[str],
+                     stim_blocks: Dict[int, StimulusBlock],
+                     sweep_blocks: Dict[int, SweepBlock]) -> np.ndarray:
+        """테스트 시퀀스 실행 및 출력 변수 기록"""
+        # 스윕 행의 지점 컬럼은 전역 변수가 아니므로 스윕 루프에서 기록
+        output_vars = [self._get_variable(var) for var in outputs if var != SWEEP_POINT_VAR]
+        rows: List[List[int]] = []
+        end_mark = None
+        for line in statements:
+            if end_mark is not None:
+                if end_mark in line:  # 루프 C 코드는 구조화된 블록으로 실행
+                    end_mark = None
+                continue
+            match = STIM_BEGIN_PATTERN.search(line)
+            if match:
+                self._run_stimulus(stim_blocks[int(match.group(1))], bool(match.group(2)), output_vars, rows)
+                end_mark = STIM_END_MARK
+                continue
+            match = SWEEP_BEGIN_PATTERN.search(line)
+            if match:
+                self._run_sweep(sweep_blocks[int(match.group(1))], bool(match.group(2)), output_vars, rows)
+                end_mark = SWEEP_END_MARK
+                continue
+            statement = line.strip().rstrip(';').strip()
+            if not statement:
+                continue
+            if statement.startswith(OUTPUT_PREFIX):
+                rows.append([var.get() for var in output_vars])
+            else:
+                self._execute(statement)
+        return np.array(rows, dtype=np.int64).reshape(-1, len(outputs))
+
+    def run(self, programs: List, res_path: Path,
+            stim_blocks: Optional[Dict[int, StimulusBlock]] = None,
+            sweep_blocks: Optional[Dict[int, SweepBlock]] = None) -> List[pd.DataFrame]:
+        """테스트 시퀀스 실행
+
+        Args:
+            programs: 테스트 시퀀스 리스트 (GenSWTest.programs)
+            res_path: 결과 CSV 저장 폴더
+            stim_blocks: 외부 자극 파일 루프 (GenSWTest.stim_blocks)
+            sweep_blocks: 스윕 지점 루프 (GenSWTest.sweep_blocks)
+
+        Returns:
+            테스트별 측정값 DataFrame 리스트 (문자열, CSV 결과와 동일한 형식)
+
+        Raises:
+            SharedLibError: 로드 또는 실행 실패 시
+        """
+        self._load()
+
+        traces = []
+        try:
+            for program in programs:
+                values = self._run_program(program.statements, program.outputs,
+                                           stim_blocks or {}, sweep_blocks or {})
+                np.savetxt(Path(res_path) / f"test_{program.test_num}.csv", values, fmt='%d',
+                           delimiter=',', header=','.join(program.outputs), comments='')
+                traces.append(pd.DataFrame(values, columns=program.outputs).astype(str))
+        finally:
+            self._unload()
+
+        return traces
+
@@ -0,0 +1,310 @@
+import os
+import re
+import csv
+import struct
+import hashlib
+import numpy as np
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from Lib.commons import STIM_CACHE_PATH, TEST_CASE_FILE
+
+# 상수 정의
+STIM_PREFIX = '@'
+STIM_SUFFIX = '.stim'
+STIM_MAGIC = b'SWST'
+STIM_VERSION = 1
+STIM_HEADER = struct.Struct('<4sIII')  # magic, version, n_vars, n_cycles
+STIM_DTYPE = '<i4'
+STIM_LOADER_CODE = 'stim_loader.c'
+STIM_LOADER_HEADER = 'stim_loader.h'
+STIM_CACHE_SIZE = 64  # 유지할 변환 테이블 개수 (최근 사용 순)
+STIM_ERROR_MARK = 'SW_STIM_ERROR'  # 자극 테이블을 열지 못한 테스트의 측정값 파일 표시
+
+# 입력 예: "@stim/speed_profile.bin speed" / "@stim/profile.csv Var1, Var2"
+STIM_REF_PATTERN = re.compile(r"^@(\S+)\s*(.*)$")
+STIM_BEGIN_MARK = '/* @stim {block_id}{record} */'
+STIM_BEGIN_PATTERN = re.compile(r"/\* @stim (\d+)( rec)? \*/")
+STIM_END_MARK = '/* @stim end */'
+
+STIM_LOADER_H = """#ifndef STIM_LOADER_H
+#define STIM_LOADER_H
+
+typedef struct
+{
+    const int *data;
+    unsigned int n_vars;
+    unsigned int n_cycles;
+    void *base;
+    unsigned long size;
+    void *handles[2];
+} SwStim;
+
+int sw_stim_open(const char *path, SwStim *stim);
+void sw_stim_close(SwStim *stim);
+
+#endif
+"""
+
+STIM_LOADER_C = """#include <string.h>
+#include "stim_loader.h"
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#endif
+
+#define SW_STIM_HEADER_WORDS 4u  /* magic, version, n_vars, n_cycles */
+
+int sw_stim_open(const char *path, SwStim *stim)
+{
+    const unsigned int *header;
+    memset(stim, 0, sizeof(*stim));
+#ifdef _WIN32
+    HANDLE file = CreateFileA(path, GENERIC_READ, FILE_SHARE_READ, NULL, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, NULL);
+    HANDLE mapping;
+    if (file == INVALID_HANDLE_VALUE) return -1;
+    stim->size = (unsigned long)GetFileSize(file, NULL);
+    mapping = CreateFileMappingA(file, NULL, PAGE_READONLY, 0, 0, NULL);
+    if (mapping == NULL) { CloseHandle(file); return -1; }
+    stim->base = MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0);
+    stim->handles[0] = file;
+    stim->handles[1] = mapping;
+    if (stim->base == NULL) { sw_stim_close(stim); return -1; }
+#else
+    struct stat st;
+    int fd = open(path, O_RDONLY);
+    if (fd < 0) return -1;
+    if (fstat(fd, &st) != 0) { close(fd); return -1; }
+    stim->size = (unsigned long)st.st_size;
+    stim->base = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (stim->base == MAP_FAILED) { stim->base = NULL; return -1; }
+#endif
+    header = (const unsigned int *)stim->base;
+    if (stim->size < SW_STIM_HEADER_WORDS * 4u || memcmp(header, "SWST", 4) != 0) { sw_stim_close(stim); return -1; }
+    stim->n_vars = header[2];
+    stim->n_cycles = header[3];
+    stim->data = (const int *)(header + SW_STIM_HEADER_WORDS);
+    return 0;
+}
+
+void sw_stim_close(SwStim *stim)
+{
+#ifdef _WIN32
+    if (stim->base != NULL) UnmapViewOfFile(stim->base);
+    if (stim->handles[1] != NULL) CloseHandle(stim->handles[1]);
+    if (stim->handles[0] != NULL) CloseHandle(stim->handles[0]);
+#else
+    if (stim->base != NULL) munmap(stim->base, (size_t)stim->size);
+#endif
+    memset(stim, 0, sizeof(*stim));
+}
+"""
+
+
+class StimulusError(Exception):
+    """외부 자극(stimulus) 파일 관련 커스텀 예외"""
+    pass
+
+
+@dataclass
+class StimulusTable:
+    """변환된 자극 테이블 (헤더 + int32 [cycle][var] 행렬)"""
+    path: Path
+    variables: List[str]
+    n_cycles: int
+
+    def load(self) -> np.ndarray:
+        """메모리 매핑으로 테이블 로드 (파싱 없음)"""
+        if self.n_cycles == 0:
+            return np.empty((0, len(self.variables)), dtype=STIM_DTYPE)
+        return np.memmap(self.path, dtype=STIM_DTYPE, mode='r', offset=STIM_HEADER.size,
+                         shape=(self.n_cycles, len(self.variables)))
+
+
+@dataclass
+class StimulusBlock:
+    """자극 테이블을 사이클마다 적용하는 드라이버 루프
+
+    Attributes:
+        block_id: 드라이버 내 블록 식별 번호 (공유 라이브러리 실행 시 조회용 주석 마커)
+        tables: 적용할 자극 테이블 리스트
+        cycles: 수행 사이클 수
+        calls: 사이클마다 호출할 함수 문장 리스트
+        cycle_inputs: 사이클 지정 입력 (시작 사이클, 끝 사이클, 문장)
+        output: 사이클마다 출력할 fprintf 문장
+    """
+    block_id: int
+    tables: List[StimulusTable]
+    cycles: int
+    calls: List[str]
+    cycle_inputs: List[Tuple[int, int, str]] = field(default_factory=list)
+    output: str = ''
+
+    def to_c(self, record: bool) -> List[str]:
+        """드라이버 C 코드 생성 (테이블 길이와 무관한 고정 크기)"""
+        begin = STIM_BEGIN_MARK.format(block_id=self.block_id, record=' rec' if record else '')
+        lines = [f"    {{ {begin}",
+                 f"    SwStim sw_stim[{len(self.tables)}];",
+                 "    unsigned int sw_cyc;",
+                 "    int sw_stim_ok = 1;"]
+        for i, table in enumerate(self.tables):
+            # 테이블을 열지 못하면 자극 없이 통과하지 않도록 측정값 파일에 표시하고 루프 생략
+            path = table.path.resolve().as_posix()
+            lines.append(f"    if (sw_stim_open(\"{path}\", &sw_stim[{i}]) != 0) "
+                         f"{{ fprintf(fptr, \"%s %s\\n\", \"{STIM_ERROR_MARK}\", \"{path}\"); sw_stim_ok = 0; }}")
+
+        lines.append(f"    for (sw_cyc = 0; sw_stim_ok && sw_cyc < {self.cycles}u; sw_cyc++) {{")
+        for i, table in enumerate(self.tables):
+            assigns = ' '.join(f"{var} = sw_stim[{i}].data[sw_cyc * sw_stim[{i}].n_vars + {j}];"
+                               for j, var in enumerate(table.variables))
+            lines.append(f"        if (sw_cyc < sw_stim[{i}].n_cycles) {{ {assigns} }}")
+        for start, end, stmt in self.cycle_inputs:
+            lines.append(f"        if (sw_cyc + 1 >= {start} && sw_cyc + 1 <= {end}) {{ {stmt}; }}")
+        lines.extend(f"        {call}" for call in self.calls)
+        if record:
+            lines.append(f"        {self.output}")
+        lines.append("    }")
+
+        for i in range(len(self.tables)):
+            lines.append(f"    sw_stim_close(&sw_stim[{i}]);")
+        lines.append(f"    }} {STIM_END_MARK}")
+        return lines
+
+
+def is_stimulus_input(line: str) -> bool:
+    """입력 라인이 외부 자극 파일 참조인지 여부"""
+    return line.strip().startswith(STIM_PREFIX)
+
+
+def split_stimulus_inputs(inputs: str) -> Tuple[List[str], str]:
+    """입력 셀에서 자극 파일 참조 라인 분리
+
+    Returns:
+        Tuple[자극 파일 참조 라인 리스트, 나머지 입력 문자열]
+    """
+    if not inputs or STIM_PREFIX not in inputs:
+        return [], inputs
+
+    stim_lines, other_lines = [], []
+    for line in inputs.split('\n'):
+        (stim_lines if is_stimulus_input(line) else other_lines).append(line.strip())
+    return stim_lines, '\n'.join(other_lines)
+
+
+def _stim_value(src: Path, line: int, column: str, text: str) -> int:
+    """CSV 자극 셀 값 (정수만 허용, 1.7 처럼 소수부가 있으면 잘라내지 않고 에러)"""
+    info = np.iinfo(STIM_DTYPE)
+    try:
+        number = float(text)
+    except ValueError:
+        number = None
+    if number is None or not number.is_integer() or not info.min <= number <= info.max:
+        raise StimulusError(f"자극 값은 {info.min}~{info.max} 범위의 정수만 지원합니다 "
+                            f"({src.name} {line}행 {column} 열): {text!r}")
+    return int(number)
+
+
+def _read_csv_stimulus(src: Path, variables: List[str]) -> Tuple[List[str], np.ndarray]:
+    """CSV 자극 파일 읽기 (헤더: 변수명, 행: 사이클, 값: 정수)"""
+    with open(src, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        columns = variables or header
+        missing = [var for var in columns if var not in header]
+        if missing:
+            raise StimulusError(f"자극 파일에 없는 변수입니다 ({src.name}): {', '.join(missing)}")
+        indices = [header.index(var) for var in columns]
+        values = [[_stim_value(src, reader.line_num, var, row[i] if i < len(row) else '')
+                   for var, i in zip(columns, indices)]
+                  for row in reader if row]
+
+    return columns, np.array(values, dtype=STIM_DTYPE).reshape(-1, len(columns))
+
+
+def _read_binary_stimulus(src: Path, variables: List[str]) -> Tuple[List[str], np.ndarray]:
+    """바이너리 자극 파일 읽기 (little-endian int32, 사이클별 변수 순서로 인터리브)"""
+    if not variables:
+        raise StimulusError(f"바이너리 자극 파일은 변수명을 지정해야 합니다: {src.name}")
+    values = np.fromfile(src, dtype=STIM_DTYPE)
+    if len(values) % len(variables):
+        raise StimulusError(f"바이너리 자극 파일 크기가 변수 수와 맞지 않습니다: {src.name}")
+    return variables, values.reshape(-1, len(variables))
+
+
+def load_stimulus(ref: str, base_dir: Optional[Path] = None) -> StimulusTable:
+    """자극 파일 참조를 변환된 테이블로 로드 (원본 경로/크기/수정 시각 기준으로 한 번만 변환)
+
+    Args:
+        ref: 입력 라인 (예: "@stim/speed_profile.bin speed")
+        base_dir: 상대 경로 기준 폴더 (기본: 테스트 케이스 파일 폴더)
+
+    Returns:
+        StimulusTable 객체
+
+    Raises:
+        StimulusError: 파일이 없거나 형식이 잘못된 경우
+    """
+    match = STIM_REF_PATTERN.match(ref.strip())
+    if not match:
+        raise StimulusError(f"잘못된 자극 파일 참조입니다: {ref}")
+
+    src = Path(base_dir or Path(TEST_CASE_FILE).parent) / match.group(1)
+    variables = [var.strip() for var in match.group(2).split(',') if var.strip()]
+    if not src.is_file():
+        raise StimulusError(f"자극 파일이 없습니다: {src}")
+
+    stat = src.stat()
+    key = hashlib.sha1(f"{src.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{','.join(variables)}"
+                       .encode('utf-8')).hexdigest()[:16]
+    table_path = Path(STIM_CACHE_PATH) / f"{key}{STIM_SUFFIX}"
+    names_path = table_path.with_suffix('.vars')
+
+    if table_path.is_file() and names_path.is_file():
+        os.utime(table_path)  # 최근 사용 시각 갱신
+    else:
+        reader = _read_csv_stimulus if src.suffix.lower() == '.csv' else _read_binary_stimulus
+        columns, values = reader(src, variables)
+        table_path.parent.mkdir(parents=True, exist_ok=True)
+        # 병렬 생성 시 같은 파일을 동시에 변환할 수 있으므로 임시 파일에 쓴 뒤 교체
+        tmp_suffix = f".{os.getpid()}.tmp"
+        with open(f"{table_path}{tmp_suffix}", 'wb') as f:
+            f.write(STIM_HEADER.pack(STIM_MAGIC, STIM_VERSION, len(columns), len(values)))
+            f.write(values.astype(STIM_DTYPE).tobytes())
+        Path(f"{names_path}{tmp_suffix}").write_text(','.join(columns), encoding='utf-8')
+        os.replace(f"{table_path}{tmp_suffix}", table_path)
+        os.replace(f"{names_path}{tmp_suffix}", names_path)
+
+    with open(table_path, 'rb') as f:
+        _, _, n_vars, n_cycles = STIM_HEADER.unpack(f.read(STIM_HEADER.size))
+    columns = names_path.read_text(encoding='utf-8').split(',')
+
+    return StimulusTable(table_path, columns[:n_vars], n_cycles)
+
+
+def write_stim_loader(stub_path: Path) -> None:
+    """드라이버용 자극 테이블 메모리 매핑 C 코드 생성"""
+    with open(Path(stub_path) / STIM_LOADER_HEADER, 'w', encoding='utf-8') as f:
+        f.write(STIM_LOADER_H)
+    with open(Path(stub_path) / STIM_LOADER_CODE, 'w', encoding='utf-8') as f:
+        f.write(STIM_LOADER_C)
+
+
+def clear_stim_cache(keep: Optional[int] = None) -> None:
+    """변환된 자극 테이블 캐시 정리
+
+    Args:
+        keep: 최근 사용 순으로 유지할 개수 (None 이면 전부 삭제)
+    """
+    cache_path = Path(STIM_CACHE_PATH)
+    if not cache_path.exists():
+        return
+
+    cached = sorted(cache_path.glob(f"*{STIM_SUFFIX}"), key=lambda f: f.stat().st_mtime, reverse=True)
+    for table_path in cached[keep or 0:]:
+        table_path.unlink(missing_ok=True)
+        table_path.with_suffix('.vars').unlink(missing_ok=True)
@@ -1,4 +1,5 @@
 import os
+import re
 import shutil
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
@@ -14,6 +15,14 @@ class CompileOptions:
     define: List[str]
 
 
+@dataclass
+class Symbol:
+    """스텁 소스의 전역 변수 정보"""
+    name: str
+    c_type: str
+    is_array: bool = False
+
+
 class StubFile:
     """C/C++ 프로젝트 파일을 스텁 형태로 변환하는 클래스"""
 
@@ -23,6 +32,7 @@ class StubFile:
     COMMON_HEADER = 'common.h'
     SKIP_KEYWORDS = {'const', 'inline', 'volatile'}
     DECLARATION_ENDINGS = {'};', ');'}
+    DECLARATOR_PATTERN = re.compile(r"(\w+)\s*$")  # '[', '=', ';' 앞의 마지막 식별자 (변수 이름)
 
     def __init__(self, pjt: str, c_option: str, source: List[str], header: List[str]):
         self.pjt_path = Path(pjt)
@@ -30,6 +40,7 @@ class StubFile:
         self.lst_header = header.copy()
         self.options = self._parse_options(c_option)
         self.dict_var: Dict[str, List[str]] = {}
+        self.dict_symbol: Dict[str, List[Symbol]] = {}
 
         # 메인 처리 실행
         self._process_stub_files()
@@ -73,6 +84,7 @@ class StubFile:
     def _process_source_files(self) -> None:
         """소스 파일들 처리"""
         self.dict_var.clear()
+        self.dict_symbol.clear()
         stub_path = Path(STUB_PATH)
 
         for c_file in self.lst_source:
@@ -91,6 +103,7 @@ class StubFile:
 
             # 결과 저장
             self.dict_var[source_path.name] = declaration_result.variables
+            self.dict_symbol[source_path.name] = declaration_result.symbols
 
             # 파일 업데이트
             self._write_file(source_path,
@@ -126,12 +139,14 @@ class StubFile:
         filtered_code: List[str]
         variables: List[str]
         extern_declarations: List[str]
+        symbols: List[Symbol]
 
     def _process_declarations(self, code_lines: List[str]) -> 'DeclarationResult':
         """선언부 처리 및 필터링"""
         filtered_code = []
         variables = []
         extern_declarations = []
+        symbols = []
 
         for line in code_lines:
             # #define 문은 그대로 유지
@@ -158,8 +173,9 @@ class StubFile:
             variable_init = self._generate_variable_initialization(line)
             if variable_init:
                 variables.append(variable_init)
+                symbols.append(self._generate_symbol(line))
 
-        return self.DeclarationResult(filtered_code, variables, extern_declarations)
+        return self.DeclarationResult(filtered_code, variables, extern_declarations, symbols)
 
     def _generate_variable_initialization(self, line: str) -> Optional[str]:
         """변수 초기화 코드 생성"""
@@ -171,15 +187,28 @@ class StubFile:
         if len(tokens) < 2:
             return None
 
-        var_name = tokens[1].replace(';', '')
+        symbol = self._generate_symbol(line)
 
-        if '[' in var_name and ']' in var_name:
+        if symbol.is_array:
             # 배열 초기화
-            array_name = var_name.split('[')[0]
-            return f"    {array_name} = {{0}};"
+            return f"    {symbol.name} = {{0}};"
         else:
             # 일반 변수 초기화
-            return f"    {var_name} = 0;"
+            return f"    {symbol.name} = 0;"
+
+    @staticmethod
+    def _generate_symbol(line: str) -> Symbol:
+        """변수 선언 라인에서 심볼 정보 생성 (_generate_variable_initialization 통과 라인 기준)
+
+        'unsigned char g_x;' 처럼 타입이 여러 단어여도 '[', '=', ';' 앞의 마지막 식별자를
+        변수 이름으로 사용합니다.
+        """
+        declarator = re.split(r"[=;]", line.strip(), maxsplit=1)[0]
+        head = declarator.split('[')[0]
+        match = StubFile.DECLARATOR_PATTERN.search(head)
+        name = match.group(1) if match else head.strip()
+        c_type = head[:match.start()].strip() if match else ''
+        return Symbol(name=name, c_type=c_type, is_array='[' in declarator)
 
     def _process_implementation(self, code_lines: List[str]) -> List[str]:
         """구현부 필터링 및 처리"""
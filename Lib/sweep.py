@@ -0,0 +1,278 @@
+import re
+import ast
+import operator
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from Lib.commons import DEFAULT_CYCLE_NUMBER
+from Lib.stubFile import Symbol
+
+# 상수 정의
+SWEEP_STATE_CODE = 'sw_state.c'
+SWEEP_STATE_HEADER = 'sw_state.h'
+SWEEP_SAVE_CALL = 'sw_state_save();'
+SWEEP_RESTORE_CALL = 'sw_state_restore();'
+SWEEP_POINT_VAR = 'sw_pt'  # 드라이버 루프 변수이자 결과 CSV 의 스윕 지점 컬럼
+OUTPUT_PREFIX = 'fprintf('
+
+# 입력 예: "speed = [0:10:1000]" (시작:간격:끝, 끝 포함) / "mode = [0, 2, 5]"
+SWEEP_INPUT_PATTERN = re.compile(r"^(\w+)\s*=\s*\[(.*)\]$")
+# 예상값 예: "Out = speed * 2" / "Out = [0, 1, 1]" / "3) Out = 1"
+SWEEP_EXPECT_PATTERN = re.compile(r"^(?:(\d+)\)\s*)?(\w+)\s*=\s*(.+)$")
+SWEEP_INDEXED_PATTERN = re.compile(r"^\d+\)")
+SWEEP_BEGIN_MARK = '/* @sweep {block_id}{record} */'
+SWEEP_BEGIN_PATTERN = re.compile(r"/\* @sweep (\d+)( rec)? \*/")
+SWEEP_END_MARK = '/* @sweep end */'
+
+SWEEP_STATE_H = """#ifndef SW_STATE_H
+#define SW_STATE_H
+
+void sw_state_save(void);
+void sw_state_restore(void);
+
+#endif
+"""
+
+
+class SweepError(Exception):
+    """스윕(parameter sweep) 행 관련 커스텀 예외"""
+    pass
+
+
+@dataclass
+class SweepExpectation:
+    """스윕 행의 지점별 예상값
+
+    Attributes:
+        variable: 스윕 입력 변수
+        points: 지점별 입력 값
+        expects: 지점별 예상값 딕셔너리 (사이클 → [(변수, 값)], 일반 행과 같은 형식)
+    """
+    variable: str
+    points: List[int]
+    expects: List[Dict[int, List[Tuple[str, str]]]]
+
+    @property
+    def variables(self) -> List[str]:
+        """예상값에 사용된 출력 변수 (기술 순서)"""
+        names: Dict[str, None] = {}
+        for exp_list in (self.expects[0].values() if self.expects else []):
+            for var, _ in exp_list:
+                names.setdefault(var)
+        return list(names)
+
+    def label(self, index: int) -> str:
+        """지점 표시 이름 (예: "speed=10")"""
+        return f"{self.variable}={self.points[index]}"
+
+
+@dataclass
+class SweepBlock:
+    """스윕 지점마다 상태를 복원하고 입력/함수 호출을 반복하는 드라이버 루프
+
+    Attributes:
+        block_id: 드라이버 내 블록 식별 번호 (공유 라이브러리 실행 시 조회용 주석 마커)
+        variable: 스윕 입력 변수
+        points: 지점별 입력 값
+        body: 지점마다 수행할 드라이버 C 문장 (fprintf 포함)
+    """
+    block_id: int
+    variable: str
+    points: List[int]
+    body: List[str] = field(default_factory=list)
+
+    def get_body(self, record: bool) -> List[str]:
+        """지점별 수행 문장 (record=False 면 출력 문장 제외)"""
+        return self.body if record else [line for line in self.body
+                                         if not line.strip().startswith(OUTPUT_PREFIX)]
+
+    def to_c(self, record: bool) -> List[str]:
+        """드라이버 C 코드 생성 (지점 수와 무관한 고정 크기 루프)"""
+        begin = SWEEP_BEGIN_MARK.format(block_id=self.block_id, record=' rec' if record else '')
+        values = ', '.join(str(point) for point in self.points)
+        return ([f"    {{ {begin}",
+                 f"    static const long long sw_sweep[{len(self.points)}] = {{{values}}};",
+                 f"    unsigned int {SWEEP_POINT_VAR};",
+                 f"    {SWEEP_SAVE_CALL}",
+                 f"    for ({SWEEP_POINT_VAR} = 0; {SWEEP_POINT_VAR} < {len(self.points)}u; {SWEEP_POINT_VAR}++) {{",
+                 f"    {SWEEP_RESTORE_CALL}",
+                 f"    {self.variable} = sw_sweep[{SWEEP_POINT_VAR}];"] +
+                self.get_body(record) +
+                ["    }",
+                 f"    }} {SWEEP_END_MARK}"])
+
+
+def parse_sweep_points(spec: str) -> List[int]:
+    """스윕 범위/목록 파싱
+
+    Args:
+        spec: 대괄호 안의 내용 ("0:10:1000" = 시작:간격:끝, "0:5" = 간격 1, "1, 3, 7" = 목록)
+
+    Raises:
+        SweepError: 형식이 잘못되었거나 지점이 없는 경우
+    """
+    try:
+        if ':' in spec:
+            parts = [int(part.strip(), 0) for part in spec.split(':')]
+            if len(parts) == 2:
+                parts.insert(1, 1)
+            start, step, stop = parts
+            if step == 0:
+                raise SweepError(f"스윕 간격은 0 이 될 수 없습니다: [{spec}]")
+            points = list(range(start, stop + (1 if step > 0 else -1), step))
+        else:
+            points = [int(value.strip(), 0) for value in spec.split(',') if value.strip()]
+    except ValueError as e:
+        raise SweepError(f"잘못된 스윕 범위입니다: [{spec}]") from e
+
+    if not points:
+        raise SweepError(f"스윕 지점이 없습니다: [{spec}]")
+    return points
+
+
+def split_sweep_inputs(inputs: str) -> Tuple[Optional[Tuple[str, List[int]]], str]:
+    """입력 셀에서 스윕 입력 라인 분리
+
+    Returns:
+        Tuple[(스윕 변수, 지점 값 리스트) 또는 None, 나머지 입력 문자열]
+
+    Raises:
+        SweepError: 한 행에 스윕 입력이 둘 이상인 경우
+    """
+    if not inputs or '[' not in inputs:
+        return None, inputs
+
+    sweep, other_lines = None, []
+    for line in inputs.split('\n'):
+        match = SWEEP_INPUT_PATTERN.match(line.strip())
+        if match is None:
+            other_lines.append(line)
+            continue
+        if sweep is not None:
+            raise SweepError("한 행에는 스윕 입력을 하나만 지정할 수 있습니다")
+        sweep = (match.group(1), parse_sweep_points(match.group(2)))
+
+    return sweep, '\n'.join(other_lines)
+
+
+def _c_div(a: int, b: int) -> int:
+    """C 정수 나눗셈 (0 방향 버림)"""
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+def _c_mod(a: int, b: int) -> int:
+    """C 정수 나머지 (피제수 부호)"""
+    return a - _c_div(a, b) * b
+
+
+BINARY_OPERATORS: Dict[type, Callable[[int, int], int]] = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: _c_div, ast.FloorDiv: _c_div, ast.Mod: _c_mod,
+    ast.LShift: operator.lshift, ast.RShift: operator.rshift,
+    ast.BitAnd: operator.and_, ast.BitOr: operator.or_, ast.BitXor: operator.xor,
+}
+UNARY_OPERATORS: Dict[type, Callable[[int], int]] = {
+    ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Invert: operator.invert,
+}
+COMPARE_OPERATORS: Dict[type, Callable[[int, int], bool]] = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+    ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+FUNCTIONS: Dict[str, Callable[..., int]] = {'min': min, 'max': max, 'abs': abs}
+
+
+def _evaluate(node: ast.AST, names: Dict[str, int]) -> int:
+    """예상값 수식 계산 (정수 산술/비교/조건식, min/max/abs 만 허용)"""
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body, names)
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return int(node.value)
+    if isinstance(node, ast.Name) and node.id in names:
+        return names[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        return BINARY_OPERATORS[type(node.op)](_evaluate(node.left, names), _evaluate(node.right, names))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        return UNARY_OPERATORS[type(node.op)](_evaluate(node.operand, names))
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in COMPARE_OPERATORS:
+        left, right = _evaluate(node.left, names), _evaluate(node.comparators[0], names)
+        return int(COMPARE_OPERATORS[type(node.ops[0])](left, right))
+    if isinstance(node, ast.BoolOp):
+        values = [_evaluate(value, names) for value in node.values]
+        return int(all(values) if isinstance(node.op, ast.And) else any(values))
+    if isinstance(node, ast.IfExp):
+        return _evaluate(node.body if _evaluate(node.test, names) else node.orelse, names)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS \
+            and not node.keywords:
+        return int(FUNCTIONS[node.func.id](*[_evaluate(arg, names) for arg in node.args]))
+    raise SweepError(f"지원하지 않는 예상값 수식입니다: {ast.dump(node)}")
+
+
+def parse_sweep_expect(expect: Optional[str], variable: str, points: List[int]) -> SweepExpectation:
+    """스윕 행 예상값 파싱 (지점별 값 목록 또는 스윕 변수 수식)
+
+    Args:
+        expect: 예상 결과 셀 (정의 적용 후)
+        variable: 스윕 입력 변수
+        points: 지점별 입력 값
+
+    Returns:
+        SweepExpectation 객체
+
+    Raises:
+        SweepError: 목록 길이가 지점 수와 다르거나 수식이 잘못된 경우
+    """
+    lines = [line.strip() for line in (expect or '').split('\n') if line.strip()]
+    indexed = any(SWEEP_INDEXED_PATTERN.match(line) for line in lines)
+    expects: List[Dict[int, List[Tuple[str, str]]]] = [{} for _ in points]
+
+    for line in lines:
+        match = SWEEP_EXPECT_PATTERN.match(line)
+        if match is None or bool(match.group(1)) != indexed:
+            continue  # 일반 행과 동일하게 사이클 지정 여부가 다른 라인은 무시
+        cycle = int(match.group(1)) if indexed else DEFAULT_CYCLE_NUMBER
+        var, value = match.group(2), match.group(3).strip()
+
+        table = SWEEP_INPUT_PATTERN.match(f"{var} = {value}")
+        if table:
+            values = [int(val.strip(), 0) for val in table.group(2).split(',') if val.strip()]
+            if len(values) != len(points):
+                raise SweepError(f"{var} 예상값 수({len(values)})가 스윕 지점 수({len(points)})와 다릅니다")
+        else:
+            try:
+                tree = ast.parse(value.replace('&&', ' and ').replace('||', ' or '), mode='eval')
+            except SyntaxError as e:
+                raise SweepError(f"잘못된 예상값 수식입니다: {value}") from e
+            values = [_evaluate(tree, {variable: point}) for point in points]
+
+        for exp, val in zip(expects, values):
+            exp.setdefault(cycle, []).append((var, str(val)))
+
+    return SweepExpectation(variable, points, expects)
+
+
+def write_sweep_state(stub_path: Path, dict_symbol: Dict[str, List[Symbol]]) -> None:
+    """스윕 지점 사이 전역 변수 상태 저장/복원 C 코드 생성
+
+    사전 조건 수행 직후 스텁 전역 변수를 한 번 복사해 두고, 지점마다 memcpy 로
+    복원하여 사전 조건을 다시 수행하지 않고 같은 초기 상태에서 시작합니다.
+    """
+    names: Dict[str, None] = {}  # 중복 선언 제거 (선언 순서 유지)
+    for symbols in dict_symbol.values():
+        for sym in symbols:
+            names.setdefault(sym.name)
+
+    headers = [src.replace('.c', '.h') for src in dict_symbol]
+    lines = ['#include <string.h>'] + [f'#include "{header}"' for header in headers] + \
+            [f'#include "{SWEEP_STATE_HEADER}"', ""]
+    lines += [f"static __typeof__({name}) sw_snap_{i};" for i, name in enumerate(names)]
+    lines += ["", "void sw_state_save(void)", "{"]
+    lines += [f"    memcpy(&sw_snap_{i}, &{name}, sizeof({name}));" for i, name in enumerate(names)]
+    lines += ["}", "", "void sw_state_restore(void)", "{"]
+    lines += [f"    memcpy(&{name}, &sw_snap_{i}, sizeof({name}));" for i, name in enumerate(names)]
+    lines += ["}", ""]
+
+    with open(Path(stub_path) / SWEEP_STATE_HEADER, 'w', encoding='utf-8') as f:
+        f.write(SWEEP_STATE_H)
+    with open(Path(stub_path) / SWEEP_STATE_CODE, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
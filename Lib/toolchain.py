@@ -0,0 +1,210 @@
+import os
+import json
+import time
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from Lib.commons import parse_gcc_flags, SHELL_REDIRECTIONS
+
+# 상수 정의
+COMPILERS = ['gcc', 'clang']
+PROFILE_FAITHFUL = 'faithful'
+PROFILE_FAST = 'fast'
+BUILD_PROFILES: Dict[str, List[str]] = {
+    PROFILE_FAITHFUL: [],  # 프로젝트 gcc_option 플래그 그대로 사용
+    PROFILE_FAST: ['-O0', '-g0', '-pipe'],  # 빠른 반복용 (최적화/디버그 정보 제외)
+}
+FAST_DROPPED_PREFIXES = ('-O', '-g')
+DEFAULT_OUTPUT = 'test.exe'
+DEFAULT_ERROR_LOG = 'error.log'
+OBJECT_DIR = 'obj'
+METRICS_SUFFIX = '_build.json'
+
+
+class ToolchainError(Exception):
+    """Toolchain 관련 커스텀 예외"""
+    pass
+
+
+@dataclass
+class BuildMetrics:
+    """빌드/실행 단계별 소요 시간 (초)"""
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """단계 소요 시간 측정"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        """단계 소요 시간 누적"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def save(self, file_path: Path) -> None:
+        """단계별 소요 시간 JSON 저장"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({name: round(sec, 4) for name, sec in self.phases.items()}, f, indent=2)
+
+    @staticmethod
+    def load(file_path: Path) -> Dict[str, float]:
+        """저장된 단계별 소요 시간 로드 (없으면 빈 딕셔너리)"""
+        if not Path(file_path).is_file():
+            return {}
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+@dataclass
+class Toolchain:
+    """C 컴파일러 툴체인 (gcc / clang)
+
+    소스 파일별 오브젝트 컴파일을 병렬로 수행한 뒤 링크하며, 단계별 소요 시간을 기록합니다.
+
+    Attributes:
+        compiler: 컴파일러 실행 파일 이름
+        flags: 컴파일 플래그 리스트
+        output: 실행 파일 이름
+        error_log: 컴파일 에러 로그 파일 이름
+        jobs: 병렬 컴파일 작업 수
+        profile: 빌드 프로파일 이름 (flags 에 반영됨)
+    """
+    compiler: str = 'gcc'
+    flags: List[str] = field(default_factory=list)
+    output: str = DEFAULT_OUTPUT
+    error_log: str = DEFAULT_ERROR_LOG
+    jobs: int = os.cpu_count() or 1
+    profile: str = PROFILE_FAITHFUL
+
+    @classmethod
+    def from_setting(cls, gcc_option: str, compiler: str = 'gcc',
+                     profile: str = PROFILE_FAITHFUL, jobs: Optional[int] = None) -> 'Toolchain':
+        """설정 파일의 gcc_option 문자열과 프로파일로 툴체인 생성
+
+        Args:
+            gcc_option: 설정 파일의 gcc 옵션 문자열 (예: "-g **.c -o test.exe 2> error.log")
+            compiler: 컴파일러 이름 (gcc / clang)
+            profile: 빌드 프로파일 이름 (faithful / fast)
+            jobs: 병렬 컴파일 작업 수 (None 이면 CPU 수)
+
+        Raises:
+            ToolchainError: 지원하지 않는 컴파일러 또는 프로파일
+        """
+        if compiler not in COMPILERS:
+            raise ToolchainError(f"지원하지 않는 컴파일러입니다: {compiler}")
+        if profile not in BUILD_PROFILES:
+            raise ToolchainError(f"지원하지 않는 빌드 프로파일입니다: {profile}")
+
+        flags = parse_gcc_flags(gcc_option)
+        if profile == PROFILE_FAST:
+            flags = [f for f in flags if not f.startswith(FAST_DROPPED_PREFIXES)] + BUILD_PROFILES[profile]
+
+        output, error_log = cls._parse_outputs(gcc_option)
+        return cls(compiler=compiler, flags=flags, output=output, error_log=error_log,
+                   jobs=jobs or os.cpu_count() or 1, profile=profile)
+
+    @staticmethod
+    def _parse_outputs(gcc_option: str) -> Tuple[str, str]:
+        """gcc_option 문자열에서 실행 파일과 에러 로그 파일 이름 추출"""
+        output, error_log = DEFAULT_OUTPUT, DEFAULT_ERROR_LOG
+        tokens = gcc_option.split()
+        for i, token in enumerate(tokens):
+            target = tokens[i + 1] if i + 1 < len(tokens) else None
+            if token == '-o' and target:
+                output = target
+            elif token in SHELL_REDIRECTIONS and token != '>' and target:
+                error_log = target
+            elif token.startswith('2>') and len(token) > 2:
+                error_log = token[2:]
+        return output, error_log
+
+    @property
+    def supports_pch(self) -> bool:
+        """#include 로 .gch 를 자동 사용하는 컴파일러 여부"""
+        return self.compiler == 'gcc'
+
+    def _compile_unit(self, cwd: Path, source: str, obj: Path,
+                      extra_flags: List[str]) -> Tuple[str, bool, str, float]:
+        """단일 소스 파일 오브젝트 컴파일"""
+        start = time.perf_counter()
+        command = [self.compiler, *self.flags, *extra_flags, '-c', source, '-o', str(obj)]
+        try:
+            proc = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+            ok, stderr = proc.returncode == 0, proc.stderr
+        except OSError as e:
+            ok, stderr = False, f"{self.compiler} 실행 실패: {e}\n"
+        return source, ok, stderr, time.perf_counter() - start
+
+    def build(self, cwd: Path, sources: List[str], metrics: BuildMetrics,
+              output: Optional[str] = None, extra_flags: Optional[List[str]] = None,
+              link_flags: Optional[List[str]] = None) -> bool:
+        """소스 파일 병렬 컴파일 및 링크
+
+        Args:
+            cwd: 빌드 폴더 (스텁 폴더)
+            sources: 컴파일할 소스 파일 이름 리스트
+            metrics: 단계별 소요 시간 기록 객체
+            output: 출력 파일 경로 (None 이면 self.output)
+            extra_flags: 컴파일 단계 추가 플래그
+            link_flags: 링크 단계 추가 플래그
+
+        Returns:
+            빌드 성공 여부 (에러 메시지는 cwd 의 error_log 파일에 기록)
+        """
+        cwd = Path(cwd)
+        obj_dir = cwd / OBJECT_DIR
+        obj_dir.mkdir(parents=True, exist_ok=True)
+        output_file = Path(output or self.output)
+        if (cwd / output_file).exists():
+            os.remove(cwd / output_file)  # 이전 빌드 결과로 성공 판단하지 않도록 제거
+
+        objects = [Path(OBJECT_DIR) / f"{Path(source).stem}.o" for source in sources]  # cwd 기준 상대 경로
+        with ThreadPoolExecutor(max_workers=max(1, min(self.jobs, len(sources)))) as executor:
+            results = list(executor.map(self._compile_unit, [cwd] * len(sources), sources,
+                                        objects, [extra_flags or []] * len(sources)))
+
+        lst_log = []
+        for source, ok, stderr, seconds in results:
+            metrics.add(f"compile:{source}", seconds)
+            lst_log.append(stderr)
+        success = all(ok for _, ok, _, _ in results)
+
+        if success:
+            with metrics.phase('link'):
+                command = [self.compiler, *self.flags, *(link_flags or []),
+                           *[str(obj) for obj in objects], '-o', str(output_file)]
+                try:
+                    proc = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+                    success, stderr = proc.returncode == 0, proc.stderr
+                except OSError as e:
+                    success, stderr = False, f"{self.compiler} 실행 실패: {e}\n"
+                lst_log.append(stderr)
+
+        with open(cwd / self.error_log, 'w', encoding='utf-8') as f:
+            f.write(''.join(lst_log))
+
+        return success and (cwd / output_file).is_file()
+
+    def run(self, cwd: Path, metrics: BuildMetrics) -> bool:
+        """빌드된 실행 파일 실행
+
+        Returns:
+            실행 여부
+        """
+        exe = (Path(cwd) / self.output).resolve()
+        with metrics.phase('run'):
+            try:
+                returncode = subprocess.run([str(exe)], cwd=cwd).returncode
+            except OSError as e:
+                print(f"Error running driver: {e}")
+                return False
+
+        if returncode != 0:
+            print(f"Warning: 테스트 드라이버 종료 코드 {returncode}")
+        return True
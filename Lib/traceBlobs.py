@@ -0,0 +1,115 @@
+import os
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from Lib.commons import BLOB_PATH, RESULT_PATH
+from Lib.resultArchive import RUN_ID_PATTERN
+from Lib.resultStore import hash_file
+
+# 상수 정의
+TRACE_REFS_FILE = 'traces.json'  # 실행 폴더의 측정값 참조 목록 (파일 이름 → sha1)
+TRACE_SUFFIX = '.csv'
+
+
+def blob_path(sha1: str) -> Path:
+    """측정값 내용 sha1 에 해당하는 blob 경로 (앞 두 글자로 폴더 분산)"""
+    return Path(BLOB_PATH) / sha1[:2] / f"{sha1}{TRACE_SUFFIX}"
+
+
+def _link_blob(trace: Path, sha1: str) -> None:
+    """실행 폴더의 측정값 파일을 blob 참조(하드 링크)로 교체
+
+    같은 내용의 blob 이 없으면 현재 파일을 blob 으로 등록하고, 있으면 현재 파일을
+    기존 blob 링크로 바꿉니다. 하드 링크를 지원하지 않는 파일 시스템에서는 원본을 유지합니다.
+    """
+    blob = blob_path(sha1)
+    try:
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.link(trace, blob)
+        elif not os.path.samefile(trace, blob):
+            tmp = trace.with_suffix(f".{os.getpid()}.tmp")
+            os.link(blob, tmp)
+            os.replace(tmp, trace)
+    except OSError as e:
+        print(f"Warning: 측정값 중복 제거 실패 ({trace.name}): {e}")
+
+
+def store_traces(run_path: Path) -> Dict[str, str]:
+    """실행 폴더의 측정값 CSV 를 내용 주소(sha1) blob 으로 저장하고 참조 목록 기록
+
+    내용이 같은 측정값은 실행이 달라도 blob 하나를 공유하므로, 저장 공간은 실행 횟수가
+    아니라 실제 동작 변화량만큼 늘어납니다.
+
+    Args:
+        run_path: 실행 결과 폴더
+
+    Returns:
+        측정값 파일 이름 → sha1 딕셔너리
+    """
+    refs = {}
+    for trace in sorted(Path(run_path).glob(f"*{TRACE_SUFFIX}")):
+        sha1 = hash_file(trace)
+        _link_blob(trace, sha1)
+        refs[trace.name] = sha1
+
+    with open(Path(run_path) / TRACE_REFS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(refs, f, indent=1)
+    return refs
+
+
+def load_trace_refs(run_id: str) -> Dict[str, str]:
+    """실행의 측정값 참조 목록 (없으면 빈 딕셔너리)"""
+    refs_file = Path(RESULT_PATH) / run_id / TRACE_REFS_FILE
+    if not refs_file.is_file():
+        return {}
+    with open(refs_file, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def previous_run(run_id: str) -> Optional[str]:
+    """참조 목록이 있는 직전 실행 시간 (없으면 None)"""
+    result_path = Path(RESULT_PATH)
+    runs = sorted(f.parent.name for f in result_path.glob(f"*/{TRACE_REFS_FILE}")
+                  if f.parent.name < run_id and RUN_ID_PATTERN.match(f.parent.name))
+    return runs[-1] if runs else None
+
+
+def unchanged_traces(refs: Dict[str, str], previous_refs: Dict[str, str]) -> List[str]:
+    """직전 실행과 내용이 같은 측정값 파일 이름 (해시 비교만으로 판정)"""
+    return [name for name, sha1 in refs.items() if previous_refs.get(name) == sha1]
+
+
+def collect_garbage() -> Tuple[int, int]:
+    """어느 실행에서도 참조하지 않는 blob 삭제
+
+    결과 폴더의 참조 목록에 없고 다른 하드 링크도 없는 blob 만 삭제합니다.
+    (압축 보관된 실행은 측정값 내용을 보관 파일에 포함하므로 blob 을 참조하지 않음)
+
+    Returns:
+        Tuple[삭제한 blob 수, 확보한 바이트]
+    """
+    blob_root = Path(BLOB_PATH)
+    if not blob_root.exists():
+        return 0, 0
+
+    referenced: Set[str] = set()
+    for refs_file in Path(RESULT_PATH).glob(f"*/{TRACE_REFS_FILE}"):
+        with open(refs_file, encoding='utf-8') as f:
+            referenced.update(json.load(f).values())
+
+    removed, freed = 0, 0
+    for blob in blob_root.glob(f"*/*{TRACE_SUFFIX}"):
+        stat = blob.stat()
+        if blob.stem in referenced or stat.st_nlink > 1:
+            continue
+        blob.unlink()
+        removed += 1
+        freed += stat.st_size
+    return removed, freed
+
+
+def blob_usage() -> Tuple[int, int]:
+    """blob 저장소 사용량 (blob 수, 바이트)"""
+    blobs = list(Path(BLOB_PATH).glob(f"*/*{TRACE_SUFFIX}"))
+    return len(blobs), sum(blob.stat().st_size for blob in blobs)
@@ -0,0 +1,159 @@
+import io
+import math
+import pandas as pd
+import streamlit as st
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from Lib.commons import RESULT_PATH
+from Lib.expectations import EXPECT_FILE, ExpectationError, ExpectationTable
+from Lib.resultArchive import RunArchive, is_archived, read_result_file
+from Lib.resultStore import ResultStore, ResultStoreError
+from Lib.waveform import render_waveform
+
+# 상수 정의
+TRACE_CACHE_SIZE = 32  # 파싱된 측정값 DataFrame 캐시 개수 (LRU)
+EXPECT_CACHE_SIZE = 4  # 실행별 예상값 테이블 캐시 개수
+TRACE_PAGE_ROWS = 500  # 측정값 표 한 페이지 행 수
+TRACE_ENCODING = 'cp1252'
+FAIL_RESULT = 'Fail'
+
+
+class TraceBrowserError(Exception):
+    """측정값 탐색 관련 커스텀 예외"""
+    pass
+
+
+@lru_cache(maxsize=TRACE_CACHE_SIZE)
+def load_trace(run_id: str, name: str) -> pd.DataFrame:
+    """측정값 CSV 하나 로드 (선택 시에만 읽고 최근 사용 순으로 캐시)
+
+    Args:
+        run_id: 실행 시간
+        name: 측정값 파일 이름 (예: test_001.csv)
+
+    Raises:
+        TraceBrowserError: 결과 폴더와 보관 파일 모두에 없는 경우
+    """
+    data = read_result_file(f"{run_id}/{name}")  # 압축 보관된 실행은 보관 파일에서 읽음
+    if data is None:
+        raise TraceBrowserError(f"측정값 파일이 없습니다: {run_id}/{name}")
+    return pd.read_csv(io.BytesIO(data), dtype=object, encoding=TRACE_ENCODING)
+
+
+@lru_cache(maxsize=EXPECT_CACHE_SIZE)
+def load_expectations(run_id: str) -> Optional[ExpectationTable]:
+    """실행 결과 폴더(또는 보관 파일)의 예상값 테이블 (없으면 None)"""
+    data = read_result_file(f"{run_id}/{EXPECT_FILE}")
+    if data is None:
+        return None
+    try:
+        return ExpectationTable.load(io.BytesIO(data))
+    except ExpectationError:
+        return None
+
+
+def list_traces(run_id: str) -> pd.DataFrame:
+    """실행의 측정값 목록 (name, test_num, result 컬럼, 테스트 행 순서)
+
+    결과 이력 저장소에 기록된 실행이면 테스트 결과를 함께 제공하고, 아니면 결과 폴더
+    (또는 보관 파일)의 CSV 이름만 나열합니다.
+    """
+    try:
+        df_res = ResultStore().get_results(run_id)
+    except ResultStoreError:
+        df_res = pd.DataFrame()
+
+    if not df_res.empty:
+        names = df_res['trace_path'].fillna('').str.rsplit('/', n=1).str[-1]
+        fallback = 'test_' + df_res['test_num'] + '.csv'
+        return pd.DataFrame({'name': names.where(names != '', fallback),
+                             'test_num': df_res['test_num'], 'result': df_res['result']})
+
+    run_path = Path(RESULT_PATH) / run_id
+    if run_path.is_dir():
+        names = sorted(f.name for f in run_path.glob('*.csv'))
+    elif is_archived(run_id):
+        names = [Path(name).name for name in RunArchive(run_id).names('.csv')]
+    else:
+        names = []
+    return pd.DataFrame({'name': names, 'test_num': [Path(name).stem.replace('test_', '') for name in names],
+                         'result': [None] * len(names)})
+
+
+def filter_traces(df_traces: pd.DataFrame, test_num: str = '', failed_only: bool = False) -> pd.DataFrame:
+    """테스트 번호 검색 / 실패 테스트 필터
+
+    Args:
+        df_traces: list_traces 결과
+        test_num: 테스트 번호 (숫자면 자리수를 맞춰 일치 검색, 아니면 부분 검색)
+        failed_only: 실패한 테스트만
+    """
+    mask = pd.Series(True, index=df_traces.index)
+    test_num = test_num.strip()
+    if test_num:
+        if test_num.isdigit():
+            mask &= df_traces['test_num'] == test_num.zfill(3)
+        else:
+            mask &= df_traces['test_num'].str.contains(test_num, regex=False)
+    if failed_only:
+        mask &= df_traces['result'] == FAIL_RESULT
+    return df_traces[mask]
+
+
+def page_count(n_rows: int, page_rows: int = TRACE_PAGE_ROWS) -> int:
+    """페이지 수 (최소 1)"""
+    return max(math.ceil(n_rows / page_rows), 1)
+
+
+def render_trace_browser(run_id: str, key: str) -> Optional[str]:
+    """측정값 탐색 화면 (검색/필터 → 선택한 측정값만 로드 → 파형 / 페이지 단위 표)
+
+    Args:
+        run_id: 실행 시간
+        key: 페이지 내 위젯 키 접두사
+
+    Returns:
+        선택한 측정값 파일 이름 (없으면 None)
+    """
+    df_traces = list_traces(run_id)
+    if df_traces.empty:
+        st.info("측정값 파일이 없습니다.")
+        return None
+
+    col1, col2 = st.columns([3, 1])
+    query = col1.text_input('Test Number 검색', key=f"{key}_query")
+    failed_only = col2.checkbox('실패 테스트만', key=f"{key}_failed")
+    df_view = filter_traces(df_traces, query, failed_only)
+
+    labels = dict(zip(df_view['name'], df_view['result']))
+    select_trace = st.selectbox(f"측정값 파일 ({len(df_view)}/{len(df_traces)})", list(labels),
+                                format_func=lambda name: f"{name} ({labels[name]})" if labels[name] else name,
+                                key=f"{key}_trace")
+    if select_trace is None:
+        return None
+
+    try:
+        df_trace = load_trace(run_id, select_trace)
+    except TraceBrowserError as e:
+        st.warning(str(e))
+        return None
+
+    tab_wave, tab_table = st.tabs(["📈 파형", "📋 측정값"])
+    with tab_wave:
+        expect_table = load_expectations(run_id)
+        index = int(df_traces.index[df_traces['name'] == select_trace][0])  # 테스트 행 순서
+        entries = expect_table.entries(index) if expect_table is not None and index < len(expect_table) else None
+        render_waveform(df_trace, entries, key=key)
+
+    with tab_table:
+        n_pages = page_count(len(df_trace))
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(f"페이지 (총 {n_pages}, {TRACE_PAGE_ROWS}사이클 단위)", min_value=1,
+                                   max_value=n_pages, value=1, key=f"{key}_page")
+        start = (page - 1) * TRACE_PAGE_ROWS
+        df_page = df_trace.iloc[start:start + TRACE_PAGE_ROWS]
+        df_page.index = pd.RangeIndex(start + 1, start + 1 + len(df_page), name='cycle')
+        st.dataframe(df_page, use_container_width=True)
+    return select_trace
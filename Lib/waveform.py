@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+import plotly.graph_objects as go
+from typing import Dict, List, Optional, Tuple
+from Lib.commons import DEFAULT_CYCLE_NUMBER
+from Lib.expectations import ExpectationEntries, NO_POINT
+from Lib.sweep import SWEEP_POINT_VAR
+
+# 상수 정의
+MAX_PLOT_POINTS = 2000  # 변수별 화면에 그릴 최대 점 수
+METHOD_MINMAX = 'min/max'
+METHOD_LTTB = 'LTTB'
+
+
+def minmax_downsample(y: np.ndarray, n_out: int) -> np.ndarray:
+    """구간별 최솟값/최댓값 인덱스로 다운샘플링 (피크 보존, 벡터 연산)
+
+    Args:
+        y: 값 배열 (NaN 허용)
+        n_out: 최대 출력 점 수
+
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    n_buckets = max(n_out // 2, 1)
+    size = -(-n // n_buckets)  # 올림 나눗셈
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(n_buckets, size)
+
+    base = np.arange(n_buckets) * size
+    lows = base + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = base + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    indices = np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+    return indices[indices < n]
+
+
+def lttb_downsample(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 다운샘플링 (파형 모양 보존)
+
+    Args:
+        y: 값 배열 (NaN 은 0 으로 취급)
+        n_out: 출력 점 수 (3 이상)
+
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    y = np.nan_to_num(y.astype(float))
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)  # 첫/마지막 점 제외 구간 경계
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        next_start, next_end = end, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = (next_start + max(next_end, next_start + 1) - 1) / 2
+        avg_y = y[next_start:max(next_end, next_start + 1)].mean()
+
+        xs = np.arange(start, end)
+        areas = np.abs((selected - avg_x) * (y[start:end] - y[selected])
+                       - (selected - xs) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    return indices
+
+
+def downsample(y: np.ndarray, n_out: int = MAX_PLOT_POINTS, method: str = METHOD_MINMAX) -> np.ndarray:
+    """다운샘플링 인덱스 (method: min/max 또는 LTTB)"""
+    if method == METHOD_LTTB:
+        return lttb_downsample(y, n_out)
+    return minmax_downsample(y, n_out)
+
+
+def expected_points(entries: ExpectationEntries, df_trace: pd.DataFrame) -> Dict[str, Tuple[List[int], List[int]]]:
+    """예상값을 측정값 사이클 위치로 변환 (변수 → (사이클 리스트, 값 리스트))
+
+    사이클 미지정 예상값은 마지막 행에, 스윕 행은 해당 지점의 시작 행 기준으로 배치합니다.
+    """
+    n_rows = len(df_trace)
+    starts = {}
+    if SWEEP_POINT_VAR in df_trace.columns:
+        points = pd.to_numeric(df_trace[SWEEP_POINT_VAR], errors='coerce').to_numpy()
+        changes = np.flatnonzero(np.r_[True, points[1:] != points[:-1]])
+        for start, end in zip(changes, np.r_[changes[1:], n_rows]):
+            starts[int(points[start])] = (int(start), int(end))
+
+    result: Dict[str, Tuple[List[int], List[int]]] = {}
+    for cycle, name, value, point in zip(entries.cycles.tolist(), entries.names(),
+                                         entries.values.tolist(), entries.points.tolist()):
+        start, end = starts.get(point, (0, n_rows)) if point != NO_POINT else (0, n_rows)
+        row = end if cycle == DEFAULT_CYCLE_NUMBER else start + cycle
+        if 0 < row <= n_rows:
+            xs, ys = result.setdefault(name, ([], []))
+            xs.append(row)
+            ys.append(value)
+    return result
+
+
+def build_waveform(df_trace: pd.DataFrame, entries: Optional[ExpectationEntries] = None,
+                   n_out: int = MAX_PLOT_POINTS, method: str = METHOD_MINMAX) -> go.Figure:
+    """측정값 파형 그림 생성 (변수별 다운샘플링 + 예상값 표시)
+
+    Args:
+        df_trace: 측정값 DataFrame (행: 사이클)
+        entries: 테스트 예상값 (없으면 측정값만 표시)
+        n_out: 변수별 최대 점 수
+        method: 다운샘플링 방식
+
+    Returns:
+        plotly Figure
+    """
+    fig = go.Figure()
+    cycles = np.arange(1, len(df_trace) + 1)
+    for column in df_trace.columns:
+        if column == SWEEP_POINT_VAR:
+            continue
+        y = pd.to_numeric(df_trace[column], errors='coerce').to_numpy(dtype=float)
+        indices = downsample(y, n_out, method)
+        fig.add_trace(go.Scattergl(x=cycles[indices], y=y[indices], mode='lines', name=column))
+
+    if entries is not None and len(entries):
+        for name, (xs, ys) in expected_points(entries, df_trace).items():
+            fig.add_trace(go.Scattergl(x=xs, y=ys, mode='markers', name=f"{name} 예상값",
+                                       marker=dict(symbol='x', size=10)))
+
+    fig.update_layout(xaxis_title='cycle', margin=dict(t=30, b=10, l=0, r=0), legend=dict(orientation='h'))
+    return fig
+
+
+@st.fragment
+def render_waveform(df_trace: pd.DataFrame, entries: Optional[ExpectationEntries], key: str) -> None:
+    """측정값 파형 화면 (다운샘플링 방식 선택, 방식 변경 시 파형만 다시 그림)"""
+    method = st.radio('다운샘플링', [METHOD_MINMAX, METHOD_LTTB], horizontal=True, key=f"{key}_method")
+    if len(df_trace) > MAX_PLOT_POINTS:
+        st.caption(f"{len(df_trace)} 사이클을 변수별 최대 {MAX_PLOT_POINTS}점으로 줄여 표시합니다.")
+    st.plotly_chart(build_waveform(df_trace, entries, method=method), use_container_width=True)
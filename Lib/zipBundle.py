@@ -0,0 +1,60 @@
+import io
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Tuple
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+from Lib.commons import DEFAULT_DIR
+
+# 상수 정의
+ZIP_CACHE_SIZE = 4  # 메모리에 유지할 묶음 수
+BUNDLE_SUFFIXES = ('.xlsx', '.yaml')  # 묶음에 포함하는 파일 형식
+STORED_SUFFIXES = {'.xlsx'}  # 이미 압축된 형식은 재압축하지 않음
+
+BundleEntries = Tuple[Tuple[str, int, int], ...]  # (경로, 수정 시각 ns, 크기)
+
+
+def bundle_entries(paths: Iterable[str]) -> BundleEntries:
+    """선택 파일의 묶음 캐시 키 (존재하는 xlsx/yaml 파일만, 경로 순)"""
+    entries = []
+    for path in sorted(set(paths)):
+        file_path = Path(path)
+        if file_path.suffix.lower() not in BUNDLE_SUFFIXES or not file_path.is_file():
+            continue
+        stat = file_path.stat()
+        entries.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def bundle_key(entries: BundleEntries) -> str:
+    """묶음 식별 해시 (선택 경로와 수정 시각)"""
+    return hashlib.sha1(repr(entries).encode('utf-8')).hexdigest()
+
+
+def _arcname(file_path: Path) -> str:
+    """묶음 내 경로 (프로젝트 폴더 기준, 밖의 파일은 파일 이름)"""
+    try:
+        return file_path.resolve().relative_to(Path(DEFAULT_DIR).resolve()).as_posix()
+    except ValueError:
+        return file_path.name
+
+
+@lru_cache(maxsize=ZIP_CACHE_SIZE)
+def build_zip(entries: BundleEntries) -> bytes:
+    """선택 파일을 메모리에서 zip 으로 묶기 (같은 선택/수정 시각이면 캐시 재사용)
+
+    xlsx 는 이미 압축된 형식이므로 그대로 저장하고 나머지만 deflate 압축합니다.
+
+    Args:
+        entries: bundle_entries 결과
+
+    Returns:
+        zip 파일 내용
+    """
+    buffer = io.BytesIO()
+    with ZipFile(buffer, 'w', ZIP_DEFLATED) as zf:
+        for path, _, _ in entries:
+            file_path = Path(path)
+            compress_type = ZIP_STORED if file_path.suffix.lower() in STORED_SUFFIXES else ZIP_DEFLATED
+            zf.write(file_path, _arcname(file_path), compress_type=compress_type)
+    return buffer.getvalue()
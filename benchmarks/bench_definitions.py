@@ -0,0 +1,89 @@
+"""정의 치환 벤치마크 (5,000 행 테스트 케이스 시트)
+
+기존 str.replace 순차 치환과 Lib.definitions 단일 패스 치환의 소요 시간을 비교합니다.
+
+    python benchmarks/bench_definitions.py [행 수] [Note 정의 수]
+"""
+import sys
+import time
+import random
+import tempfile
+from pathlib import Path
+import openpyxl
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from Lib.definitions import DEFAULT_DEFINITIONS, compile_definitions  # noqa: E402
+
+# 상수 정의
+DEFAULT_ROWS = 5000
+DEFAULT_NOTE_SIZE = 200
+NOTE_VARIANTS = 10  # 행들이 공유하는 서로 다른 Note 개수
+HEADER = ['No', 'Test Number', 'Requirement', 'Description', 'c_file', 'Function', 'Cycle',
+          'Pre-condition', 'Input', 'Expected', 'Note']
+
+
+def legacy_apply(code_str, definitions):
+    """기존 방식: 정의마다 전체 텍스트 str.replace"""
+    if not code_str:
+        return ""
+    result = code_str
+    for definition in definitions:
+        if ':' in definition:
+            key, value = map(str.strip, definition.split(':', 1))
+            result = result.replace(key, value)
+    return result
+
+
+def make_sheet(path: Path, n_rows: int, note_size: int) -> None:
+    """임의 테스트 케이스 시트 생성"""
+    rnd = random.Random(0)
+    notes = ['\n'.join(f"SIG_{v}_{i}_STATE : {rnd.randint(0, 255)}" for i in range(note_size))
+             for v in range(NOTE_VARIANTS)]
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(HEADER)
+    for row in range(n_rows):
+        v = rnd.randrange(NOTE_VARIANTS)
+        sigs = [f"SIG_{v}_{rnd.randrange(note_size)}_STATE" for _ in range(6)]
+        ws.append([row + 1, row + 1, '', '', 'app.c', 'App_Main()', 10,
+                   'reset\ng_Mode = OFF',
+                   '\n'.join(f"In_{i} = {s}" for i, s in enumerate(sigs[:3])) + '\nMOTOR_ON_FLAG = ON',
+                   '\n'.join(f"{i + 1}) Out_{i} = {s}" for i, s in enumerate(sigs[3:])),
+                   notes[v]])
+    wb.save(path)
+
+
+def main() -> None:
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    note_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_NOTE_SIZE
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sheet = Path(tmp) / 'testcase.xlsx'
+        make_sheet(sheet, n_rows, note_size)
+        wb = openpyxl.load_workbook(sheet, read_only=True)
+        rows = [row for row in wb.active.iter_rows(min_row=2, values_only=True)]
+        wb.close()
+
+    start = time.perf_counter()
+    for row in rows:
+        definitions = [n for n in row[10].split('\n') if n] + DEFAULT_DEFINITIONS
+        legacy = [legacy_apply(row[i], definitions) for i in (7, 8, 9)]
+    legacy_sec = time.perf_counter() - start
+
+    compile_definitions.cache_clear()
+    start = time.perf_counter()
+    for row in rows:
+        definitions = compile_definitions(row[10])
+        compiled = [definitions.apply(row[i]) for i in (7, 8, 9)]
+    compiled_sec = time.perf_counter() - start
+
+    print(f"rows={n_rows} note_definitions={note_size} distinct_notes={NOTE_VARIANTS}")
+    print(f"legacy str.replace : {legacy_sec:8.3f} s")
+    print(f"single-pass        : {compiled_sec:8.3f} s  ({legacy_sec / compiled_sec:.1f}x)")
+    print(f"cache: {compile_definitions.cache_info()}")
+    print(f"last row legacy  : {legacy[1]!r}")
+    print(f"last row compiled: {compiled[1]!r}")
+
+
+if __name__ == '__main__':
+    main()
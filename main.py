@@ -1,16 +1,63 @@
+import argparse
 import yaml
 from Lib.commons import SETTING_YAML
-from Lib.generateTest import GenSWTest
-from Lib.analyzeRes import AnalyzeRes
+from Lib.generateTest import GenSWTest, EXE_BACKEND
+from Lib.toolchain import PROFILE_FAITHFUL
+from Lib.analyzeRes import AnalyzeRes, get_latest_run, index_saved_runs, load_run_result
+from Lib.runDiff import RunDiffError, diff_runs
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SW Unit Test")
+    parser.add_argument("--rerun-failed", nargs='?', const='latest', default=None, metavar="TIME",
+                        help="이전 실행(기본: 최근 실행)에서 실패한 테스트만 재실행")
+    parser.add_argument("--reanalyze", default=None, metavar="TIME",
+                        help="코드 생성/실행 없이 저장된 예상값과 결과 CSV로 다시 분석")
+    parser.add_argument("--diff", nargs=2, default=None, metavar=("BASE", "TARGET"),
+                        help="두 실행 결과를 테스트 번호 기준으로 비교")
+    parser.add_argument("--diff-values", action='store_true',
+                        help="--diff 시 측정값이 다른 테스트의 사이클별 변수 값까지 비교")
+    args = parser.parse_args()
+
+    if args.diff is not None:
+        index_saved_runs()
+        try:
+            run_diff = diff_runs(*args.diff, values=args.diff_values)
+        except RunDiffError as e:
+            parser.error(str(e))
+        for test in run_diff.tests:
+            print(f"{test.status}: Test {test.test_num} ({test.function}) {test.old_result} → {test.new_result}")
+            for change in test.value_changes:
+                print(f"    {change.cycle}) {change.variable}: {change.old} → {change.new}")
+        print(run_diff.summary())
+        raise SystemExit(0)
+
+    if args.reanalyze is not None:
+        AnalyzeRes(time=args.reanalyze)
+        raise SystemExit(0)
+
     with open(SETTING_YAML, encoding='utf-8-sig', mode='r') as f:
         setting = yaml.load(f, Loader=yaml.SafeLoader)
 
+    base, rows = None, None
+    if args.rerun_failed is not None:
+        base = get_latest_run() if args.rerun_failed == 'latest' else args.rerun_failed
+        if base is None:
+            parser.error("재실행할 이전 테스트 결과가 없습니다")
+        rows = [int(i) for i in load_run_result(base).failed_indices]
+        if not rows:
+            print(f"Info: {base} 실행에서 실패한 테스트가 없습니다")
+            raise SystemExit(0)
+
     swTest = GenSWTest(gcc_option=setting["gcc_option"],
                        pjt=setting["project_path"],
                        compil_option=setting["compilation_option"],
                        source=setting["source_file"],
-                       header=setting["header_file"])
-    swRes = AnalyzeRes(time=swTest.time, exp_res=swTest.exp_result)
+                       header=setting["header_file"],
+                       rows=rows,
+                       backend=setting.get("backend", EXE_BACKEND),
+                       compiler=setting.get("compiler", "gcc"),
+                       profile=setting.get("build_profile", PROFILE_FAITHFUL))
+    print('\n'.join(f"{phase}: {sec:.3f}s" for phase, sec in swTest.metrics.phases.items()))
+    swRes = AnalyzeRes(time=swTest.time, exp_res=swTest.expect_table, base=base, rows=swTest.rows,
+                       traces=swTest.traces, excluded=swTest.excluded)
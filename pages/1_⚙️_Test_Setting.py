@@ -1,8 +1,21 @@
 import os
 import shutil
+import pandas as pd
 import streamlit as st
-import yaml
+from dataclasses import asdict
 from Lib.commons import git_checkout, DEFAULT_DIR, SETTING_YAML, LAST_SETTING_YAML, UPLOAD_PATH
+from Lib.dataAccess import invalidate, render_cache_stats, save_yaml
+from Lib.compileCheck import check_sources
+from Lib.toolchain import COMPILERS, BUILD_PROFILES, Toolchain
+
+BACKENDS = ['exe', 'shared']  # 실행 방식: 테스트 드라이버 exe / 공유 라이브러리 직접 호출
+BACKEND_HELP = (
+    "exe: 테스트 드라이버를 빌드하여 실행합니다.  \n"
+    "shared: 스텁 소스를 공유 라이브러리로 빌드하고 드라이버 문장을 직접 해석하여 실행합니다. "
+    "해석 가능한 문장은 `변수 = 값`, `배열[첨자] = 값`, `변수 = {0}`, `함수(값, ...)` 이며 "
+    "값은 정수 리터럴, 전역 변수, `배열[정수 또는 변수]` 입니다. "
+    "수식, 형 변환, 구조체 멤버, 포인터 인자, 스텁 심볼에 없는 변수를 사용하는 행은 exe 로 실행합니다."
+)
 
 
 def get_list_text_area(text_file):
@@ -18,6 +31,7 @@ def get_list_text_area(text_file):
 st.set_page_config(layout="wide")
 
 st.sidebar.title("SW Test")
+render_cache_stats()
 
 st.title("테스트 설정")
 
@@ -48,30 +62,38 @@ if new_files:
 
     col1, col2 = st.columns(2)
     if col1.button("⭕ 코드 컴파일 적합성 확인", type="primary", use_container_width=True):
-        main = """int main(void)
-{
-    return 0;
-}"""
-        with open(f"{UPLOAD_PATH}/main.c", "w") as f:
-            f.write(main)
-
-        os.chdir(UPLOAD_PATH)  # upload 폴더 CLI 이동
-        os.system(f"gcc -g **.c -o test.exe 2> error.log")
-        os.chdir(DEFAULT_DIR)  # default 폴더 복귀
-        if os.path.exists(f"{UPLOAD_PATH}/test.exe"):
-            st.success("성공적으로 프로젝트 빌드 가능합니다")
+        toolchain = Toolchain.from_setting(st.session_state['gcc_option'], st.session_state['compiler'])
+        report = check_sources(UPLOAD_PATH, sources, toolchain)  # 파일별 -fsyntax-only 병렬 검사 (내용 해시 캐시)
+        if report.ok:
+            st.success(f"성공적으로 프로젝트 빌드 가능합니다 (소스 {len(report.verdicts)}개, 캐시 {report.n_cached}개)")
         else:
-            st.error("컴파일러를 통한 빌드가 정상적으로 진행되지 않았습니다. 에러로그를 통해 소스코드를 다시 확인해주세요")
-            with open(f"{UPLOAD_PATH}/error.log", "r", encoding='utf-8') as f:
-                st.text(''.join(f.readlines()))
+            st.error("컴파일러를 통한 빌드가 정상적으로 진행되지 않았습니다. 파일별 진단 메시지를 확인해주세요")
+        for verdict in report.verdicts:
+            if verdict.ok and not verdict.diagnostics:
+                continue
+            with st.expander(f"{'⚠️' if verdict.ok else '❌'} {verdict.source} (에러 {len(verdict.errors)}개)",
+                             expanded=not verdict.ok):
+                if verdict.diagnostics:
+                    st.dataframe(pd.DataFrame([asdict(d) for d in verdict.diagnostics]),
+                                 hide_index=True, use_container_width=True)
+                else:
+                    st.text(verdict.stderr)
     st.write('📖 업로드 파일 리스트')
     st.write({'source_file': sources, 'header_file': headers})
 
     gcc_option = st.text_input("GCC Options", value=st.session_state['gcc_option'])
     compile_option = st.text_input("Compilation Options", value=st.session_state['compilation_option'])
+    backend = st.selectbox("Execution Backend", BACKENDS, index=BACKENDS.index(st.session_state['backend']),
+                           help=BACKEND_HELP)
+    compiler = st.selectbox("Compiler", COMPILERS, index=COMPILERS.index(st.session_state['compiler']))
+    build_profile = st.selectbox("Build Profile", list(BUILD_PROFILES),
+                                 index=list(BUILD_PROFILES).index(st.session_state['build_profile']))
 
     st.session_state["gcc_option"] = gcc_option
     st.session_state["compilation_option"] = compile_option
+    st.session_state["backend"] = backend
+    st.session_state["compiler"] = compiler
+    st.session_state["build_profile"] = build_profile
 else:
     st.session_state["upload_test"] = False
 
@@ -79,6 +101,11 @@ else:
     git_branch = st.text_input("Git Branch", value=st.session_state['git_branch'])
     gcc_option = st.text_input("GCC Options", value=st.session_state['gcc_option'])
     compile_option = st.text_input("Compilation Options", value=st.session_state['compilation_option'])
+    backend = st.selectbox("Execution Backend", BACKENDS, index=BACKENDS.index(st.session_state['backend']),
+                           help=BACKEND_HELP)
+    compiler = st.selectbox("Compiler", COMPILERS, index=COMPILERS.index(st.session_state['compiler']))
+    build_profile = st.selectbox("Build Profile", list(BUILD_PROFILES),
+                                 index=list(BUILD_PROFILES).index(st.session_state['build_profile']))
 
     sources = st.text_area("Source Files", value='\n'.join(st.session_state['source_file']))
     headers = st.text_area("Header Files", height=150, value='\n'.join(st.session_state['header_file']))
@@ -92,6 +119,9 @@ else:
         st.session_state['git_branch'] = git_branch
         st.session_state['gcc_option'] = gcc_option
         st.session_state['compilation_option'] = compile_option
+        st.session_state['backend'] = backend
+        st.session_state['compiler'] = compiler
+        st.session_state['build_profile'] = build_profile
         st.session_state['source_file'] = get_list_text_area(sources)
         st.session_state['header_file'] = get_list_text_area(headers)
 
@@ -102,6 +132,9 @@ else:
         st.session_state['git_branch'] = git_branch
         st.session_state['gcc_option'] = gcc_option
         st.session_state['compilation_option'] = compile_option
+        st.session_state['backend'] = backend
+        st.session_state['compiler'] = compiler
+        st.session_state['build_profile'] = build_profile
         st.session_state['source_file'] = get_list_text_area(sources)
         st.session_state['header_file'] = get_list_text_area(headers)
 
@@ -109,13 +142,16 @@ else:
                     'git_branch': git_branch,
                     'gcc_option': gcc_option,
                     'compilation_option': compile_option,
+                    'backend': backend,
+                    'compiler': compiler,
+                    'build_profile': build_profile,
                     'source_file': st.session_state['source_file'],
-                    'header_file': st.session_state['header_file']}
+                    'header_file': st.session_state['header_file'],
+                    'retention': st.session_state.get('retention', {})}
 
         shutil.copyfile(SETTING_YAML, LAST_SETTING_YAML)
-        with open(SETTING_YAML, 'w') as file:
-            file.write("# To disable the code, add a semicolon at the beginning\n\n")
-            yaml.dump(set_yaml, file, default_flow_style=False, sort_keys=False)
+        invalidate(LAST_SETTING_YAML)
+        save_yaml(SETTING_YAML, set_yaml)
 
         st.rerun()
 
@@ -124,7 +160,9 @@ else:
     - ""project path**: {st.session_state['project_path']}
     - ""git branch**: {st.session_state['git_branch']}
     - ""gcc option**: {st.session_state['gcc_option']}
-    - ""compilation option**: {st.session_state['compilation_option']}""")
+    - ""compilation option**: {st.session_state['compilation_option']}
+    - ""backend**: {st.session_state['backend']}
+    - ""compiler**: {st.session_state['compiler']} ({st.session_state['build_profile']})""")
 
     st.markdown(f"""
     📝 현재 프로젝트 경로 및 빌드 설정
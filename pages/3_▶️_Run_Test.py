@@ -2,14 +2,25 @@ import os.path
 import pandas as pd
 import streamlit as st
 import plotly.express as px
-from Lib.commons import colorize, get_2d_list, UPLOAD_PATH
-from Lib.generateTest import GenSWTest
-from Lib.analyzeRes import AnalyzeRes
+from Lib.commons import UPLOAD_PATH, STUB_PATH
+from Lib.dataAccess import render_cache_stats
+from Lib.generateTest import GenSWTest, EXE_BACKEND
+from Lib.toolchain import PROFILE_FAITHFUL
+from Lib.analyzeRes import AnalyzeRes, load_run_result, MEASURED_TITLE, RESULT_TITLE
+from Lib.rowValidator import issues_frame
+from Lib.resultTable import RUN_RESULT_COLUMNS, ResultTableError, render_result_table
+from Lib.traceBrowser import render_trace_browser
+
+
+def request_rerun(base: str) -> None:
+    """실패 테스트 재실행 요청 (버튼 콜백, 페이지 스크립트 실행 전에 기준 실행 지정)"""
+    st.session_state["rerun_base"] = base
 
 
 st.set_page_config(layout="wide")
 
 st.sidebar.title("SW Test")
+render_cache_stats()
 
 if st.session_state["upload_test"] is True:
     col1, col2 = st.columns([1, 1])
@@ -20,78 +31,112 @@ else:
     st.title("테스트 실행 및 결과")
     pjt_path = st.session_state['project_path']
 
-with st.spinner('테스트 실행중입니다......'):
-    swTest = GenSWTest(gcc_option=st.session_state["gcc_option"],
-                       pjt=pjt_path,
-                       compil_option=st.session_state["gcc_option"],
-                       source=st.session_state["source_file"],
-                       header=st.session_state["header_file"])
+start = st.button("▶️ 테스트 실행", type="primary")
+rerun_base = st.session_state.pop("rerun_base", None)  # 실패 테스트 재실행 대상 실행 시간
+if start or rerun_base:
+    rerun_rows = [int(i) for i in load_run_result(rerun_base).failed_indices] if rerun_base else None
+    with st.spinner('테스트 실행중입니다......'):
+        swTest = GenSWTest(gcc_option=st.session_state["gcc_option"],
+                           pjt=pjt_path,
+                           compil_option=st.session_state["gcc_option"],
+                           source=st.session_state["source_file"],
+                           header=st.session_state["header_file"],
+                           rows=rerun_rows,
+                           backend=st.session_state.get("backend", EXE_BACKEND),
+                           compiler=st.session_state.get("compiler", "gcc"),
+                           profile=st.session_state.get("build_profile", PROFILE_FAITHFUL))
+        # 결과 분석 및 이력 저장소 기록은 테스트를 실행한 경우에만 한 번 수행
+        swRes = AnalyzeRes(time=swTest.time, exp_res=swTest.expect_table, base=rerun_base, rows=swTest.rows,
+                           traces=swTest.traces, excluded=swTest.excluded) if swTest.status is True else None
+    st.session_state["run_test"] = swTest
+    st.session_state["run_res"] = swRes
+    st.session_state["run_base"] = rerun_base
 
-    if swTest.status is True:
-        swRes = AnalyzeRes(time=swTest.time, exp_res=swTest.exp_result)
-        col1, col2 = st.columns([1, 1])
-        fig = px.pie(
-            pd.DataFrame({'result': ['Pass', 'Fail'], 'number': [len(swRes.test_result.results) - len(swRes.test_result.failed_indices), len(swRes.test_result.failed_indices)]}),
-            names='result',
-            values='number',
-            title='결과 현황',
-            hole=.3,
-            color_discrete_sequence=["#00ff00", "#ff0000"])  # hole을 주면 donut 차트
-        fig.update_traces(textposition='inside', textinfo='percent+label+value')
-        fig.update_layout(margin=dict(b=10, l=0, r=0), font=dict(size=12))
-        col1.plotly_chart(fig)
-        if len(swRes.test_result.failed_indices) != 0:
-            st.error(f"테스트 {', '.join(swRes.test_result.failed_indices)}에서 에러가 있습니다.")
-        else:
-            st.success("모든 테스트가 에러 없이 통과했습니다.")
+# 마지막으로 실행한 테스트 (검색/필터 등 위젯 조작으로 인한 재실행에서는 테스트를 다시 실행하지 않음)
+swTest = st.session_state.get("run_test")
+if swTest is None:
+    st.info("▶️ 테스트 실행 버튼을 눌러 테스트를 시작하세요.")
+    st.stop()
+swRes = st.session_state.get("run_res")
+rerun_base = st.session_state.get("run_base")
 
-        st.info(f"테스트 케이스 총 {len(swRes.test_result.results)}개, 성공: {len(swRes.test_result.results) - len(swRes.test_result.failed_indices)}개, 실패: {len(swRes.test_result.failed_indices)}개")
+if swRes is not None:
+    if rerun_base:
+        st.info(f"{rerun_base} 실행의 실패 테스트 {len(swTest.rows)}개를 재실행하여 결과를 병합했습니다.")
+    if swTest.warnings:
+        st.warning(f"테스트 케이스 검사 경고 {len(swTest.warnings)}개가 있습니다. 결과를 확인해주세요.")
+        st.dataframe(issues_frame(swTest.warnings), hide_index=True, use_container_width=True)
+    if swTest.fallback:
+        st.info(f"공유 라이브러리로 해석할 수 없는 테스트 행 {len(swTest.fallback)}개는 exe 백엔드로 실행했습니다: "
+                f"{', '.join(f'{row}행 ({reason})' for row, reason in swTest.fallback.items())}")
+    if swTest.excluded:
+        st.warning(f"컴파일 에러가 있는 테스트 행 {len(swTest.excluded)}개를 제외하고 나머지 테스트를 실행했습니다. 제외한 행은 실패로 기록됩니다.")
+        st.dataframe(issues_frame(swTest.compile_issues), hide_index=True, use_container_width=True)
+    col1, col2 = st.columns([1, 1])
+    fig = px.pie(
+        pd.DataFrame({'result': ['Pass', 'Fail'], 'number': [len(swRes.test_result.results) - len(swRes.test_result.failed_indices), len(swRes.test_result.failed_indices)]}),
+        names='result',
+        values='number',
+        title='결과 현황',
+        hole=.3,
+        color_discrete_sequence=["#00ff00", "#ff0000"])  # hole을 주면 donut 차트
+    fig.update_traces(textposition='inside', textinfo='percent+label+value')
+    fig.update_layout(margin=dict(b=10, l=0, r=0), font=dict(size=12))
+    col1.plotly_chart(fig)
+    if len(swRes.test_result.failed_indices) != 0:
+        st.error(f"테스트 {', '.join(swRes.test_result.failed_indices)}에서 에러가 있습니다.")
+        # 콜백에서 기준 실행을 지정하므로 클릭 후 첫 재실행에서 바로 실패 테스트만 실행
+        col2.button("🔁 실패 테스트만 재실행", type="primary", use_container_width=True,
+                    on_click=request_rerun, args=(swTest.time,))
+    else:
+        st.success("모든 테스트가 에러 없이 통과했습니다.")
 
-        #  Data Frame 변환
-        swTest.df_test.insert(8, 'Measured(산출값)', swRes.test_result.measured_output, True)
-        swTest.df_test.insert(1, 'Result(결과)', swRes.test_result.results, True)
-        df_style = swTest.df_test.style.map(colorize, subset=["Result(결과)"])
-        st.dataframe(df_style, height=(len(swTest.df_test) + 1) * 35 + 10, hide_index=True)
+    st.info(f"테스트 케이스 총 {len(swRes.test_result.results)}개, 성공: {len(swRes.test_result.results) - len(swRes.test_result.failed_indices)}개, 실패: {len(swRes.test_result.failed_indices)}개")
 
-        result_file = f"{swRes.res_path}_SW_TestCase.xlsx"
-        with open(result_file, mode="rb") as file:
-            btn = st.download_button(
-                type="primary",
-                label="📊📈 Download Result (테스트 결과 다운로드)",
-                data=file,
-                file_name=os.path.basename(result_file),
-                mime="application/vnd.ms-excel",
-            )
+    with col2.expander("⏱️ 빌드 단계별 소요 시간"):
+        st.dataframe(pd.DataFrame({'phase': list(swTest.metrics.phases.keys()),
+                                   'seconds': list(swTest.metrics.phases.values())}),
+                     hide_index=True, use_container_width=True)
 
-        st.markdown("""
-        <style>
-        [data-testid="stExpander"] {
-            background-color: #eeeeee;
-            color: black;
-        }
-        [data-testid="stExpanderToggleIcon"] {
-            visibility: show;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        result_files = get_2d_list(divider=3, path=swRes.res_path)
-        for res in result_files:
-            col1, col2, col3 = st.columns([1, 1, 1])
-            with col1.expander(os.path.basename(res[0])):
-                df_res1 = pd.read_csv(f"{swRes.res_path}/{res[0]}", dtype=object, encoding='cp1252')
-                st.dataframe(df_res1, hide_index=True)
-            
-            if 'nan' not in res[1]:
-                with col2.expander(os.path.basename(res[1])):
-                    df_res2 = pd.read_csv(f"{swRes.res_path}/{res[1]}", dtype=object, encoding='cp1252')
-                    st.dataframe(df_res2, hide_index=True)
+    #  Data Frame 변환 (보관한 실행의 표는 그대로 두고 복사본에 결과 컬럼 추가)
+    df_result = swTest.df_test.copy()
+    df_result.insert(8, MEASURED_TITLE, swRes.test_result.measured_output, True)
+    df_result.insert(1, RESULT_TITLE, swRes.test_result.results, True)
+    try:
+        render_result_table(df_result, RUN_RESULT_COLUMNS, key="run_result", token=swTest.time)
+    except ResultTableError as e:
+        st.error(f"{e} (테스트 케이스 시트 헤더를 확인해주세요)")
 
-            if 'nan' not in res[2]:
-                with col3.expander(os.path.basename(res[2])):
-                    df_res3 = pd.read_csv(f"{swRes.res_path}/{res[2]}", dtype=object, encoding='cp1252')
-                    st.dataframe(df_res3, hide_index=True)
-    else:
-        st.error("컴파일러를 통한 빌드가 정상적으로 진행되지 않았습니다. 에러로그를 통해 소스코드를 다시 확인해주세요")
-        with open(f"{UPLOAD_PATH}/error.log", "r", encoding='utf-8') as f:
-            st.text(''.join(f.readlines()))
+    result_file = swRes.result_xlsx
+    with open(result_file, mode="rb") as file:
+        btn = st.download_button(
+            type="primary",
+            label="📊📈 Download Result (테스트 결과 다운로드)",
+            data=file,
+            file_name=os.path.basename(result_file),
+            mime="application/vnd.ms-excel",
+        )
+
+    st.markdown("""
+    <style>
+    [data-testid="stExpander"] {
+        background-color: #eeeeee;
+        color: black;
+    }
+    [data-testid="stExpanderToggleIcon"] {
+        visibility: show;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    st.subheader("측정값")
+    render_trace_browser(swTest.time, key="run_trace")
+elif swTest.issues:
+    st.error("테스트 케이스 검사에서 문제가 발견되어 빌드하지 않았습니다. 테스트 케이스를 수정해주세요")
+    st.dataframe(issues_frame(swTest.issues), hide_index=True, use_container_width=True)
+else:
+    st.error("컴파일러를 통한 빌드가 정상적으로 진행되지 않았습니다. 에러로그를 통해 소스코드를 다시 확인해주세요")
+    if swTest.compile_issues:
+        st.dataframe(issues_frame(swTest.compile_issues), hide_index=True, use_container_width=True)
+    with open(STUB_PATH / swTest.toolchain.error_log, "r", encoding='utf-8') as f:
+        st.text(''.join(f.readlines()))
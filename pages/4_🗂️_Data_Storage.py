@@ -1,22 +1,32 @@
 import os
-import yaml
 import pandas as pd
 import streamlit as st
-from zipfile import ZipFile
 from streamlit_tree_select import tree_select
-from Lib.commons import colorize, get_2d_list, SETTING_YAML, LAST_SETTING_YAML, TEST_CASE_FILE, LAST_TEST_CASE_FILE, RESULT_PATH, DOWNLOAD_ZIP
+from Lib.commons import colorize, SETTING_YAML, LAST_SETTING_YAML, TEST_CASE_FILE, LAST_TEST_CASE_FILE, RESULT_PATH
+from Lib.analyzeRes import index_saved_runs
+from Lib.dataAccess import load_yaml, render_cache_stats
+from Lib.resultArchive import RunArchive, is_archived, read_result_file
+from Lib.resultStore import ResultStore
+from Lib.runDiff import diff_runs
+from Lib.traceBlobs import blob_usage
+from Lib.resultTable import STORE_RESULT_COLUMNS, render_result_table
+from Lib.traceBrowser import render_trace_browser
+from Lib.zipBundle import build_zip, bundle_entries, bundle_key
+
+STORE_COLUMNS = ['row_index', 'test_num', 'function', 'c_file', 'measured', 'result']
+HISTORY_LIMIT = 1000
 
 
 st.set_page_config(layout="wide")
 
 st.sidebar.title("SW Test")
+render_cache_stats()
 
 st.title("테스트 데이터")
 select_set = st.selectbox('테스트 설정 파일', ['setting.yaml', 'last_setting.yaml'])
 
 yaml_file = LAST_SETTING_YAML if 'last' in select_set else SETTING_YAML
-with open(yaml_file, encoding='utf-8-sig') as f:
-    setting = yaml.load(f, Loader=yaml.SafeLoader)
+setting = load_yaml(yaml_file)
 
 st.write('📝 현재 프로젝트 경로 및 빌드 설정')
 st.markdown('\n'.join([f"- **{key}**: {val}" for key, val in setting.items()]))
@@ -32,25 +42,70 @@ with open(yaml_file, mode="rb") as file:
         mime="text/yaml",
     )
 
-result_files = [f for f in os.listdir(RESULT_PATH) if 'xlsx' in f]
-result_files.reverse()
+store = ResultStore()
+index_saved_runs(store)  # 저장소 도입 이전 결과 보고서 추가
+df_runs = store.list_runs().set_index('run_id')
 
-select_result = st.selectbox('테스트 결과 파일', result_files)
-df_test = pd.read_excel(f"{RESULT_PATH}/{select_result}", engine='openpyxl').iloc[:, 1:]
-df_style = df_test.style.map(colorize, subset=["Result(결과)"])
-st.dataframe(df_style, height=(len(df_test) + 1) * 35 + 10, hide_index=True)
+select_run = st.selectbox('테스트 결과', df_runs.index,
+                          format_func=lambda run: f"{run} (Fail {df_runs.at[run, 'n_fail']}/{df_runs.at[run, 'n_tests']})")
+if select_run is None:
+    st.info("저장된 테스트 결과가 없습니다.")
+    st.stop()
 
-col1, _ = st.columns(2)
+df_test = store.get_results(select_run)[STORE_COLUMNS]
+render_result_table(df_test, STORE_RESULT_COLUMNS, key="storage_result", token=select_run)
+
+select_result = df_runs.at[select_run, 'report']
+col1, col2 = st.columns(2)
+run_archived = is_archived(select_run)
+report_data = read_result_file(select_result) if select_result else None  # 압축 보관된 실행은 보관 파일에서 읽음
 
-with open(f"{RESULT_PATH}/{select_result}", mode="rb") as file:
+if report_data is not None:
     col1.download_button(
         use_container_width=True,
         tpye="primary",
         label="📊📈 Download Result (테스트 결과 다운로드)",
-        data=file,
+        data=report_data,
         file_name=select_result,
         mime="application/vnd.ms-excel",
     )
+else:
+    col1.info("결과 보고서 파일이 정리되어 이력만 남아 있습니다.")
+if run_archived:
+    manifest = RunArchive(select_run).manifest
+    col2.info(f"압축 보관된 실행입니다 ({manifest.archived_at}, 원본 {manifest.original_bytes / 2 ** 20:.1f}MB)")
+
+st.subheader("테스트 결과 이력 조회")
+
+col1, col2, col3, col4 = st.columns(4)
+query_test = col1.text_input('Test Number (예: 001)')
+query_func = col2.text_input('Function')
+query_file = col3.selectbox('c_file', [''] + store.get_c_files())
+query_result = col4.selectbox('Result', ['', 'Pass', 'Fail'])
+
+if query_test or query_func or query_file or query_result:
+    query_test = query_test.strip().zfill(3) if query_test.strip().isdigit() else query_test.strip()
+    df_history = store.query_results(test_num=query_test, function=query_func.strip(), c_file=query_file,
+                                     result=query_result, limit=HISTORY_LIMIT)
+    st.caption(f"{len(df_history)}건 (최대 {HISTORY_LIMIT}건)")
+    st.dataframe(df_history[['run_id'] + STORE_COLUMNS].style.map(colorize, subset=["result"]), hide_index=True)
+
+st.subheader("실행 결과 비교")
+
+col1, col2 = st.columns(2)
+diff_base = col1.selectbox('기준 실행', df_runs.index, index=min(1, len(df_runs) - 1))
+diff_target = col2.selectbox('비교 실행', df_runs.index, index=0)
+diff_values = st.checkbox('측정값이 다른 테스트의 사이클별 값 비교')
+
+if diff_base != diff_target:
+    run_diff = diff_runs(diff_base, diff_target, values=diff_values, store=store)
+    st.caption(run_diff.summary())
+    df_diff = run_diff.to_frame()
+    st.dataframe(df_diff.style.map(colorize, subset=["old_result", "new_result"]), hide_index=True)
+    for test in run_diff.tests:
+        if test.value_changes:
+            with st.expander(f"Test {test.test_num} 측정값 변경 ({len(test.value_changes)})"):
+                st.dataframe(pd.DataFrame(test.value_changes), hide_index=True)
 
 st.markdown("""
 <style>
@@ -64,23 +119,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-csv_path = f"{RESULT_PATH}/{select_result.replace('_testcase.xlsx', '')}"
-result_files = get_2d_list(divider=3, path=csv_path)
-for res in result_files:
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col1.expander(os.path.basename(res[0])):
-        df_res1 = pd.read_csv(f"{csv_path}/{res[0]}", dtype=object, encoding='cp1252')
-        st.dataframe(df_res1, hide_index=True)
-
-    if 'nan' not in res[1]:
-        with col2.expander(os.path.basename(res[1])):
-            df_res2 = pd.read_csv(f"{csv_path}/{res[1]}", dtype=object, encoding='cp1252')
-            st.dataframe(df_res2, hide_index=True)
-
-    if 'nan' not in res[2]:
-        with col3.expander(os.path.basename(res[2])):
-            df_res3 = pd.read_csv(f"{csv_path}/{res[2]}", dtype=object, encoding='cp1252')
-            st.dataframe(df_res3, hide_index=True)
+st.subheader("측정값")
+blob_count, blob_bytes = blob_usage()
+st.caption(f"측정값 저장소: 중복 제거된 측정값 {blob_count}개, {blob_bytes / 2 ** 20:.1f}MB")
+render_trace_browser(select_run, key="storage_trace")
 
 st.subheader("프로젝트내 파일 Zip 다운로드")
 
@@ -112,17 +154,18 @@ nodes = [
 
 return_select = tree_select(nodes, expanded=["setting", "test_case", "result"])
 
-with ZipFile(DOWNLOAD_ZIP, 'w') as myzip:
-    for file in return_select['checked']:
-        if 'xlsx' in file or '.yaml' in file:
-            myzip.write(file)
+entries = bundle_entries(return_select['checked'])
+zip_key = bundle_key(entries)
 
-col1, _ = st.columns(2)
-with open(DOWNLOAD_ZIP, mode="rb") as file:
-    col1.download_button(
+col1, col2 = st.columns(2)
+if col1.button("📦 Zip 만들기", use_container_width=True, disabled=not entries):
+    st.session_state["zip_key"] = zip_key  # 선택이 바뀌면 다시 만들어야 다운로드 가능
+
+if entries and st.session_state.get("zip_key") == zip_key:
+    col2.download_button(
         use_container_width=True,
         label="🧷 Download Zip (파일 Zip 다운로드)",
-        data=file,
+        data=build_zip(entries),
         file_name="SW_Test.zip",
         mime="application/zip",
     )
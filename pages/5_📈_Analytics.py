@@ -0,0 +1,61 @@
+import streamlit as st
+import plotly.express as px
+from Lib.commons import colorize
+from Lib.analyzeRes import index_saved_runs
+from Lib.dataAccess import render_cache_stats
+from Lib.resultStore import ResultStore
+
+STATS_COLUMNS = ['test_key', 'function', 'c_file', 'n_runs', 'pass_rate', 'flips', 'flaky_flips',
+                 'last_result', 'last_run']
+
+
+st.set_page_config(layout="wide")
+
+st.sidebar.title("SW Test")
+render_cache_stats()
+
+st.title("테스트 추이 분석")
+
+store = ResultStore()
+index_saved_runs(store)  # 저장소 도입 이전 결과 보고서 추가
+df_trend = store.get_run_trend()
+if df_trend.empty:
+    st.info("저장된 테스트 결과가 없습니다.")
+    st.stop()
+
+df_stats = store.get_test_stats()
+df_flaky = df_stats[df_stats['flaky_flips'] > 0]
+
+col1, col2, col3 = st.columns(3)
+col1.metric("누적 실행", len(df_trend))
+col2.metric("최근 통과율", f"{df_trend['pass_rate'].iloc[-1]:.1%}")
+col3.metric("불안정 테스트", len(df_flaky))
+
+fig = px.line(df_trend, x='run_id', y='pass_rate', markers=True, title='실행별 통과율',
+              hover_data=['n_tests', 'n_fail'])
+fig.update_layout(yaxis_tickformat='.0%', yaxis_range=[0, 1.05], xaxis_type='category')
+st.plotly_chart(fig, use_container_width=True)
+
+df_daily = df_trend.assign(date=df_trend['created_at'].str[:10]).groupby('date', as_index=False)[['n_tests', 'n_fail']].sum()
+df_daily['pass_rate'] = 1 - df_daily['n_fail'] / df_daily['n_tests'].clip(lower=1)
+fig = px.bar(df_daily, x='date', y='pass_rate', title='일별 통과율', hover_data=['n_tests', 'n_fail'])
+fig.update_layout(yaxis_tickformat='.0%', yaxis_range=[0, 1.05])
+st.plotly_chart(fig, use_container_width=True)
+
+st.subheader("테스트별 누적 결과")
+st.caption("불안정(flaky): 테스트 케이스 행과 소스 파일이 그대로인데 직전 실행과 결과가 바뀐 횟수 "
+           "(입력과 결과, 측정값이 직전 실행과 모두 같은 중복 실행은 통계에서 제외)")
+
+flaky_only = st.checkbox('불안정 테스트만 보기', value=not df_flaky.empty)
+df_view = (df_flaky if flaky_only else df_stats)[STATS_COLUMNS]
+st.dataframe(df_view.style.map(colorize, subset=["last_result"]).format({'pass_rate': '{:.1%}'}),
+             hide_index=True, use_container_width=True)
+
+select_test = st.selectbox('테스트 이력', df_view['test_key'])
+if select_test is not None:
+    test_num = df_stats.loc[df_stats['test_key'] == select_test, 'test_num'].iloc[0]
+    df_history = store.query_results(test_num=test_num).iloc[::-1]
+    fig = px.scatter(df_history, x='run_id', y='result', color='result', title=f'Test {select_test} 결과 이력',
+                     color_discrete_map={'Pass': '#00ff00', 'Fail': '#ff0000'}, hover_data=['measured'])
+    fig.update_layout(xaxis_type='category')
+    st.plotly_chart(fig, use_container_width=True)